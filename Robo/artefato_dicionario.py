@@ -0,0 +1,211 @@
+import argparse
+import bisect
+import heapq
+import mmap
+import os
+import struct
+import time
+
+from nucleo_soletra import (
+    normalizar_palavra, construir_indice, palavras_do_grupo, hash_arquivo, ler_palavras_jogaveis, fonte_confere,
+)
+
+
+# --- Dicionário Compilado Em Binário ---
+#
+# Layout do arquivo (tudo little-endian, seções alinhadas em 4 bytes):
+#
+#   cabeçalho   MAGICO (8) | sha256 do .txt (32) | n_mascaras | n_palavras | tam_blob
+#   mascaras    uint32[n_mascaras]        máscaras distintas, em ordem crescente
+#   grupos      uint32[n_mascaras + 1]    posição da 1ª palavra de cada máscara
+#   offsets     uint32[n_palavras + 1]    início de cada palavra dentro do blob
+#   blob        bytes UTF-8 das palavras originais, concatenadas
+#
+# O carregador só faz mmap do arquivo: nada é lido até o tabuleiro aparecer,
+# e apenas as palavras devolvidas pela busca são decodificadas.
+
+
+MAGICO = b"SOLETRA1"
+CABECALHO = struct.Struct("<8s32sIII")
+TAMANHO_CABECALHO = 64
+
+
+def compilar_dicionario(caminho_txt, caminho_bin):
+    """Compila uma lista de palavras (.txt) no artefato binário"""
+    print(f"🛠️  Compilando '{caminho_txt}' em '{caminho_bin}'...")
+    tempo_inicio = time.time()
+
+    resumo = bytes.fromhex(hash_arquivo(caminho_txt))
+    with open(caminho_txt, 'r', encoding='utf-8') as f:
+        indice = construir_indice(f)
+
+    mascaras = sorted(indice)
+    grupos = [0]
+    offsets = [0]
+    blob = bytearray()
+    for mascara in mascaras:
+        for palavra in sorted(palavras_do_grupo(indice[mascara])):
+            blob += palavra.encode('utf-8')
+            offsets.append(len(blob))
+        grupos.append(len(offsets) - 1)
+
+    _gravar_artefato(caminho_bin, resumo, mascaras, grupos, offsets, blob)
+
+    tempo_total = time.time() - tempo_inicio
+    print(f"✓ {len(offsets) - 1} palavras em {len(mascaras)} máscaras compiladas em {tempo_total:.2f}s")
+
+
+def _gravar_artefato(caminho_bin, resumo, mascaras, grupos, offsets, blob):
+    """Grava as seções no layout do artefato, trocando o arquivo de uma vez só no final"""
+    caminho_temp = caminho_bin + ".tmp"
+    with open(caminho_temp, 'wb') as f:
+        cabecalho = CABECALHO.pack(MAGICO, resumo, len(mascaras), len(offsets) - 1, len(blob))
+        f.write(cabecalho.ljust(TAMANHO_CABECALHO, b'\0'))
+        f.write(struct.pack(f"<{len(mascaras)}I", *mascaras))
+        f.write(struct.pack(f"<{len(grupos)}I", *grupos))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(blob)
+    os.replace(caminho_temp, caminho_bin)
+
+
+def atualizar_artefato(caminho_bin, novas_palavras, hash_txt):
+    """
+    Acrescenta palavras ao artefato já compilado sem ler o .txt: só as
+    palavras novas passam pelo filtro, os grupos que não mudam são copiados
+    byte a byte e o hash gravado passa a ser o do .txt atualizado, calculado
+    por quem o escreveu. O resultado é idêntico ao de compilar o .txt do zero.
+
+    Args:
+        caminho_bin (str): Artefato existente (compilado a partir do .txt antes da atualização).
+        novas_palavras (iterable): Palavras que entraram no .txt.
+        hash_txt (str): SHA-256 (hex) do .txt já atualizado.
+
+    Returns:
+        int: Quantas palavras jogáveis entraram no artefato.
+    """
+    novos_grupos = {}
+    for palavra, _, mascara in ler_palavras_jogaveis(novas_palavras):
+        novos_grupos.setdefault(mascara, set()).add(palavra)
+
+    artefato = ArtefatoDicionario(caminho_bin)
+    try:
+        antigas = {mascara: i for i, mascara in enumerate(artefato._mascaras)}
+        grupos_antigos, offsets_antigos, blob_antigo = artefato._grupos, artefato._offsets, artefato._blob
+
+        mascaras = sorted(antigas.keys() | novos_grupos.keys())
+        grupos = [0]
+        offsets = [0]
+        blob = bytearray()
+        inseridas = 0
+        for mascara in mascaras:
+            i = antigas.get(mascara)
+            novas = sorted(novos_grupos.get(mascara, ()))
+            existentes = []
+            if i is not None:
+                primeira, ultima = grupos_antigos[i], grupos_antigos[i + 1]
+                if not novas:
+                    # Grupo intacto: copia o trecho do blob e desloca os offsets
+                    inicio = offsets_antigos[primeira]
+                    deslocamento = len(blob) - inicio
+                    blob += blob_antigo[inicio:offsets_antigos[ultima]]
+                    offsets.extend(o + deslocamento for o in offsets_antigos[primeira + 1:ultima + 1])
+                    grupos.append(len(offsets) - 1)
+                    continue
+                existentes = [
+                    bytes(blob_antigo[offsets_antigos[j]:offsets_antigos[j + 1]]).decode('utf-8')
+                    for j in range(primeira, ultima)
+                ]
+
+            anterior = None
+            for palavra in heapq.merge(existentes, novas):
+                if palavra == anterior:
+                    continue
+                blob += palavra.encode('utf-8')
+                offsets.append(len(blob))
+                anterior = palavra
+            inseridas += len(offsets) - 1 - grupos[-1] - len(existentes)
+            grupos.append(len(offsets) - 1)
+    finally:
+        artefato.fechar()
+
+    _gravar_artefato(caminho_bin, bytes.fromhex(hash_txt), mascaras, grupos, offsets, blob)
+    return inseridas
+
+
+class ArtefatoDicionario:
+    """Índice somente-leitura sobre o mmap do artefato, compatível com o dict de construir_indice"""
+
+    def __init__(self, caminho_arquivo):
+        self._arquivo = open(caminho_arquivo, 'rb')
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magico, resumo, n_mascaras, n_palavras, tam_blob = CABECALHO.unpack_from(self._mapa)
+        if magico != MAGICO:
+            self.fechar()
+            raise ValueError(f"'{caminho_arquivo}' não é um dicionário compilado")
+        self.hash_conteudo = resumo.hex()
+
+        self._visao = visao = memoryview(self._mapa)
+        inicio = TAMANHO_CABECALHO
+        self._mascaras = visao[inicio:inicio + 4 * n_mascaras].cast('I')
+        inicio += 4 * n_mascaras
+        self._grupos = visao[inicio:inicio + 4 * (n_mascaras + 1)].cast('I')
+        inicio += 4 * (n_mascaras + 1)
+        self._offsets = visao[inicio:inicio + 4 * (n_palavras + 1)].cast('I')
+        inicio += 4 * (n_palavras + 1)
+        self._blob = visao[inicio:inicio + tam_blob]
+
+    def __len__(self):
+        return len(self._mascaras)
+
+    def get(self, mascara, padrao=()):
+        """Grupo da máscara no mesmo formato de construir_indice, decodificado sob demanda"""
+        posicao = bisect.bisect_left(self._mascaras, mascara)
+        if posicao == len(self._mascaras) or self._mascaras[posicao] != mascara:
+            return padrao
+
+        palavras = []
+        for i in range(self._grupos[posicao], self._grupos[posicao + 1]):
+            palavra = bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]).decode('utf-8')
+            palavras.append(palavra)
+        return ("\n".join(palavras), "\n".join(normalizar_palavra(p) for p in palavras))
+
+    def fechar(self):
+        for atributo in ("_blob", "_offsets", "_grupos", "_mascaras", "_visao"):
+            visao = self.__dict__.pop(atributo, None)
+            if visao is not None:
+                visao.release()
+        self._mapa.close()
+        self._arquivo.close()
+
+
+def abrir_artefato(caminho_arquivo='Robo-soletra/Robo/palavras3.bin',
+                   caminho_fonte='Robo-soletra/Robo/palavras3.txt'):
+    """Abre o dicionário compilado; retorna None se não existir ou estiver desatualizado"""
+    if not os.path.exists(caminho_arquivo):
+        return None
+
+    try:
+        artefato = ArtefatoDicionario(caminho_arquivo)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"⚠️ Dicionário compilado inválido: {e}")
+        return None
+
+    # O hash gravado no artefato denuncia quando o .txt foi editado depois da compilação;
+    # tamanho e mtime do .txt evitam recalculá-lo a cada partida
+    if caminho_fonte and os.path.exists(caminho_fonte) and not fonte_confere(caminho_fonte, artefato.hash_conteudo, caminho_arquivo):
+        print(f"⚠️ '{caminho_arquivo}' está desatualizado em relação a '{caminho_fonte}'. Recompile.")
+        artefato.fechar()
+        return None
+
+    print(f"📚 Dicionário compilado aberto: {len(artefato)} grupos de letras")
+    return artefato
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compila uma lista de palavras no dicionário binário dos robôs.")
+    parser.add_argument("entrada", nargs="?", default="Robo-soletra/Robo/palavras3.txt")
+    parser.add_argument("saida", nargs="?", default="Robo-soletra/Robo/palavras3.bin")
+    args = parser.parse_args()
+
+    compilar_dicionario(args.entrada, args.saida)
@@ -0,0 +1,101 @@
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+
+from nucleo_soletra import chave_tabuleiro, hash_arquivo
+
+
+# --- Cache Persistente De Soluções ---
+#
+# Guarda a lista final (já priorizada) de cada tabuleiro resolvido, chaveada
+# por (letras externas ordenadas, letra central, hash do dicionário). Se o
+# robô cair ou for reiniciado no mesmo dia, a resposta sai do disco sem
+# recarregar nem varrer o dicionário. Quando o arquivo do dicionário muda, o
+# hash muda junto: as entradas antigas deixam de casar e são descartadas.
+
+
+CACHE_FILE = "Robo-soletra/Robo/cache_solucoes.db"
+LIMITE_ENTRADAS = 200
+
+
+def _conectar(caminho_arquivo):
+    conexao = sqlite3.connect(caminho_arquivo)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS solucoes (
+            chave TEXT NOT NULL,
+            hash_dicionario TEXT NOT NULL,
+            palavras BLOB NOT NULL,
+            ultimo_uso REAL NOT NULL,
+            PRIMARY KEY (chave, hash_dicionario)
+        )
+    """)
+    conexao.execute("CREATE INDEX IF NOT EXISTS idx_solucoes_uso ON solucoes (ultimo_uso)")
+    return conexao
+
+
+def _hash_dicionario(caminho_dicionario, hash_dicionario):
+    # O robô passa o hash que já calculou; só sem ele o .txt é lido de novo
+    if hash_dicionario is not None or not os.path.exists(caminho_dicionario):
+        return hash_dicionario
+    return hash_arquivo(caminho_dicionario)
+
+
+def ler_cache_solucao(letras_disponiveis, letra_central,
+                      caminho_dicionario='Robo-soletra/Robo/palavras3.txt', caminho_arquivo=CACHE_FILE,
+                      hash_dicionario=None):
+    """Lista priorizada salva para o tabuleiro, ou None se não houver entrada válida"""
+    hash_dicionario = _hash_dicionario(caminho_dicionario, hash_dicionario)
+    if hash_dicionario is None or not os.path.exists(caminho_arquivo):
+        return None
+
+    chave = chave_tabuleiro(letras_disponiveis, letra_central)
+    try:
+        with closing(_conectar(caminho_arquivo)) as conexao, conexao:
+            linha = conexao.execute(
+                "SELECT palavras FROM solucoes WHERE chave = ? AND hash_dicionario = ?",
+                (chave, hash_dicionario),
+            ).fetchone()
+            if linha is None:
+                return None
+            conexao.execute(
+                "UPDATE solucoes SET ultimo_uso = ? WHERE chave = ? AND hash_dicionario = ?",
+                (time.time(), chave, hash_dicionario),
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao ler o cache de soluções: {e}")
+        return None
+
+    lista = zlib.decompress(linha[0]).decode('utf-8')
+    palavras = lista.split("\n") if lista else []
+    print(f"⚡ Cache: {len(palavras)} palavras recuperadas para {chave.upper()}")
+    return palavras
+
+
+def salvar_cache_solucao(letras_disponiveis, letra_central, palavras,
+                         caminho_dicionario='Robo-soletra/Robo/palavras3.txt',
+                         caminho_arquivo=CACHE_FILE, limite_entradas=LIMITE_ENTRADAS, hash_dicionario=None):
+    """Grava a lista priorizada do tabuleiro e descarta entradas velhas além do limite"""
+    hash_dicionario = _hash_dicionario(caminho_dicionario, hash_dicionario)
+    if hash_dicionario is None:
+        return
+
+    chave = chave_tabuleiro(letras_disponiveis, letra_central)
+    lista = zlib.compress("\n".join(palavras).encode('utf-8'))
+    try:
+        with closing(_conectar(caminho_arquivo)) as conexao, conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO solucoes VALUES (?, ?, ?, ?)",
+                (chave, hash_dicionario, lista, time.time()),
+            )
+            # Entradas de outra versão do dicionário nunca mais serão lidas
+            conexao.execute("DELETE FROM solucoes WHERE hash_dicionario != ?", (hash_dicionario,))
+            # Despeja as menos usadas recentemente quando passa do limite
+            conexao.execute("""
+                DELETE FROM solucoes WHERE rowid IN (
+                    SELECT rowid FROM solucoes ORDER BY ultimo_uso DESC LIMIT -1 OFFSET ?
+                )
+            """, (limite_entradas,))
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao salvar o cache de soluções: {e}")
@@ -0,0 +1,127 @@
+import argparse
+import os
+import sqlite3
+import time
+import zlib
+from multiprocessing import Pool
+
+from nucleo_soletra import (
+    construir_indice, buscar_palavras, chave_tabuleiro, letras_da_mascara, hash_arquivo,
+)
+
+
+# --- Catálogo Offline De Tabuleiros ---
+#
+# Todo tabuleiro do Soletra tem pelo menos um pangrama, então as 7 letras do
+# jogo são sempre a máscara de alguma palavra do dicionário com 7 letras
+# distintas. O catálogo enumera essas máscaras, resolve cada uma com as 7
+# escolhas de letra central e grava a lista ordenada de candidatas (comprimida
+# com zlib) em SQLite, indexada pela chave do tabuleiro. Na hora do jogo a
+# resposta é uma única consulta pela chave.
+
+
+LETRAS_DO_TABULEIRO = 7
+
+_indice_trabalhador = None
+
+
+def _iniciar_trabalhador(indice):
+    global _indice_trabalhador
+    _indice_trabalhador = indice
+
+
+def _resolver_pangramas(mascaras):
+    """Resolve, dentro de um processo do pool, todos os tabuleiros de um bloco de máscaras"""
+    resultados = []
+    for mascara in mascaras:
+        letras = letras_da_mascara(mascara)
+        for letra_central in letras:
+            palavras = buscar_palavras(_indice_trabalhador, letras, letra_central)
+            lista = "\n".join(palavras).encode('utf-8')
+            resultados.append((chave_tabuleiro(letras, letra_central), zlib.compress(lista)))
+    return resultados
+
+
+def _criar_tabelas(conexao):
+    conexao.execute("CREATE TABLE IF NOT EXISTS meta (chave TEXT PRIMARY KEY, valor TEXT)")
+    conexao.execute("CREATE TABLE IF NOT EXISTS catalogo (chave TEXT PRIMARY KEY, palavras BLOB NOT NULL) WITHOUT ROWID")
+
+
+def construir_catalogo(caminho_dicionario, caminho_catalogo, processos=None, tamanho_bloco=200):
+    """Gera o catálogo de todos os tabuleiros com pangrama usando todos os núcleos"""
+    print(f"📚 Indexando '{caminho_dicionario}'...")
+    tempo_inicio = time.time()
+
+    with open(caminho_dicionario, 'r', encoding='utf-8') as f:
+        indice = construir_indice(f)
+
+    pangramas = sorted(m for m in indice if bin(m).count("1") == LETRAS_DO_TABULEIRO)
+    blocos = [pangramas[i:i + tamanho_bloco] for i in range(0, len(pangramas), tamanho_bloco)]
+    processos = processos or os.cpu_count()
+    print(f"🔍 {len(pangramas)} conjuntos de letras com pangrama, {processos} processo(s)...")
+
+    caminho_temp = caminho_catalogo + ".tmp"
+    if os.path.exists(caminho_temp):
+        os.remove(caminho_temp)
+
+    conexao = sqlite3.connect(caminho_temp)
+    _criar_tabelas(conexao)
+    total = 0
+    with Pool(processos, initializer=_iniciar_trabalhador, initargs=(indice,)) as pool:
+        for resultados in pool.imap_unordered(_resolver_pangramas, blocos):
+            conexao.executemany("INSERT OR REPLACE INTO catalogo VALUES (?, ?)", resultados)
+            total += len(resultados)
+
+    conexao.execute("INSERT OR REPLACE INTO meta VALUES ('hash_dicionario', ?)", (hash_arquivo(caminho_dicionario),))
+    conexao.commit()
+    conexao.close()
+    os.replace(caminho_temp, caminho_catalogo)
+
+    tempo_total = time.time() - tempo_inicio
+    print(f"✓ Catálogo com {total} tabuleiros salvo em '{caminho_catalogo}' ({tempo_total:.1f}s)")
+
+
+def consultar_catalogo(letras_disponiveis, letra_central,
+                       caminho_arquivo='Robo-soletra/Robo/catalogo_soletra.db',
+                       caminho_fonte='Robo-soletra/Robo/palavras3.txt', hash_fonte=None):
+    """
+    Lista ordenada de candidatas do tabuleiro, ou None se não houver catálogo
+    válido para ele. hash_fonte evita reler o .txt quando o robô já tem o hash.
+    """
+    if not os.path.exists(caminho_arquivo):
+        return None
+    if hash_fonte is None and caminho_fonte and os.path.exists(caminho_fonte):
+        hash_fonte = hash_arquivo(caminho_fonte)
+
+    conexao = sqlite3.connect(f"file:{caminho_arquivo}?mode=ro", uri=True)
+    try:
+        if hash_fonte is not None:
+            linha = conexao.execute("SELECT valor FROM meta WHERE chave = 'hash_dicionario'").fetchone()
+            if not linha or linha[0] != hash_fonte:
+                print(f"⚠️ Catálogo '{caminho_arquivo}' desatualizado em relação a '{caminho_fonte}'.")
+                return None
+
+        linha = conexao.execute(
+            "SELECT palavras FROM catalogo WHERE chave = ?",
+            (chave_tabuleiro(letras_disponiveis, letra_central),),
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao consultar o catálogo: {e}")
+        return None
+    finally:
+        conexao.close()
+
+    if linha is None:
+        return None
+    lista = zlib.decompress(linha[0]).decode('utf-8')
+    return lista.split("\n") if lista else []
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-calcula as respostas de todos os tabuleiros com pangrama.")
+    parser.add_argument("--dicionario", default="Robo-soletra/Robo/palavras3.txt")
+    parser.add_argument("--saida", default="Robo-soletra/Robo/catalogo_soletra.db")
+    parser.add_argument("--processos", type=int, default=None)
+    args = parser.parse_args()
+
+    construir_catalogo(args.dicionario, args.saida, processos=args.processos)
@@ -0,0 +1,280 @@
+import argparse
+import mmap
+import os
+import struct
+import time
+
+from nucleo_soletra import (
+    ALFABETO, TAMANHO_MINIMO, ler_palavras_jogaveis, mascara_tabuleiro, hash_arquivo,
+    fonte_confere,
+)
+
+
+# --- Dicionário Em DAWG (Grafo Acíclico De Palavras) ---
+#
+# Alternativa ao índice por máscaras: as formas normalizadas viram um trie
+# minimizado, em que prefixos e sufixos iguais são o mesmo caminho ("-ção",
+# "-mente", "des-"...), então o grafo inteiro cabe em poucos arrays. A busca
+# anda só pelas arestas com as letras do tabuleiro e corta de uma vez toda a
+# subárvore de uma letra que não está lá.
+#
+# Cada forma normalizada tem um número (sua posição em ordem alfabética),
+# calculado no caminho somando "quantas palavras ficam antes" de cada aresta;
+# esse número aponta para as grafias originais guardadas no blob.
+#
+# Layout do arquivo (little-endian, seções alinhadas em 4 bytes):
+#
+#   cabeçalho   MAGICO (8) | sha256 do .txt (32) | n_nos | n_arestas | n_palavras | tam_blob
+#   primeira    uint32[n_nos + 1]       índice da 1ª aresta de cada nó
+#   destinos    uint32[n_arestas]       nó de chegada de cada aresta
+#   antes       uint32[n_arestas]       palavras que vêm antes de quem segue a aresta
+#   offsets     uint32[n_palavras + 1]  início das grafias de cada palavra no blob
+#   rotulos     uint8[n_arestas]        letra da aresta (0 = 'a' ... 25 = 'z')
+#   finais      uint8[n_nos]            1 se o nó encerra uma palavra
+#   blob        grafias originais em UTF-8, separadas por '\n' dentro de cada palavra
+
+
+MAGICO = b"SOLDAWG1"
+CABECALHO = struct.Struct("<8s32sIIII")
+TAMANHO_CABECALHO = 64
+
+
+class _No:
+    __slots__ = ("arestas", "final")
+
+    def __init__(self):
+        self.arestas = {}
+        self.final = False
+
+    def assinatura(self):
+        # Os filhos já são canônicos quando o pai é registrado, então a identidade basta
+        return self.final, tuple((letra, id(filho)) for letra, filho in sorted(self.arestas.items()))
+
+
+def construir_dawg(palavras_ordenadas):
+    """
+    Constrói o DAWG mínimo de palavras em ordem alfabética estrita, de uma
+    passada (algoritmo incremental de Daciuk): cada ramo é minimizado assim
+    que a próxima palavra deixa de compartilhá-lo.
+    """
+    raiz = _No()
+    registro = {}
+    nao_verificados = []  # (pai, letra, filho) do último ramo inserido
+    anterior = ""
+
+    def minimizar(ate):
+        while len(nao_verificados) > ate:
+            pai, letra, filho = nao_verificados.pop()
+            assinatura = filho.assinatura()
+            igual = registro.get(assinatura)
+            if igual is None:
+                registro[assinatura] = filho
+            else:
+                pai.arestas[letra] = igual
+
+    for palavra in palavras_ordenadas:
+        if palavra <= anterior:
+            raise ValueError(f"Palavras fora de ordem ou repetidas: '{anterior}' e '{palavra}'")
+        comum = 0
+        while comum < min(len(palavra), len(anterior)) and palavra[comum] == anterior[comum]:
+            comum += 1
+        minimizar(comum)
+
+        no = nao_verificados[-1][2] if nao_verificados else raiz
+        for letra in palavra[comum:]:
+            filho = _No()
+            no.arestas[letra] = filho
+            nao_verificados.append((no, letra, filho))
+            no = filho
+        no.final = True
+        anterior = palavra
+
+    minimizar(0)
+    return raiz
+
+
+def _achatar(raiz):
+    """Numera os nós e gera os arrays do layout (primeira, destinos, antes, rotulos, finais)"""
+    numeros = {id(raiz): 0}
+    ordem = [raiz]
+    for no in ordem:
+        for _, filho in sorted(no.arestas.items()):
+            if id(filho) not in numeros:
+                numeros[id(filho)] = len(ordem)
+                ordem.append(filho)
+
+    # Palavras alcançáveis a partir de cada nó, dos filhos para os pais
+    contagens = {}
+    for no in reversed(_ordem_topologica(raiz)):
+        contagens[id(no)] = int(no.final) + sum(contagens[id(f)] for f in no.arestas.values())
+
+    primeira, destinos, antes, rotulos = [0], [], [], []
+    for no in ordem:
+        acumulado = int(no.final)
+        for letra, filho in sorted(no.arestas.items()):
+            destinos.append(numeros[id(filho)])
+            antes.append(acumulado)
+            rotulos.append(ALFABETO.index(letra))
+            acumulado += contagens[id(filho)]
+        primeira.append(len(destinos))
+    finais = bytes(int(no.final) for no in ordem)
+    return primeira, destinos, antes, bytes(rotulos), finais
+
+
+def _ordem_topologica(raiz):
+    """Nós em ordem topológica (pais antes dos filhos), sem recursão"""
+    visitados = set()
+    pos_ordem = []
+    pilha = [(raiz, False)]
+    while pilha:
+        no, expandido = pilha.pop()
+        if expandido:
+            pos_ordem.append(no)
+            continue
+        if id(no) in visitados:
+            continue
+        visitados.add(id(no))
+        pilha.append((no, True))
+        for filho in no.arestas.values():
+            if id(filho) not in visitados:
+                pilha.append((filho, False))
+    pos_ordem.reverse()
+    return pos_ordem
+
+
+def compilar_dawg(caminho_txt, caminho_bin, hash_txt=None):
+    """Compila uma lista de palavras (.txt) no DAWG binário (hash_txt: SHA-256 já conhecido do .txt)"""
+    print(f"🛠️  Compilando '{caminho_txt}' em '{caminho_bin}'...")
+    tempo_inicio = time.time()
+
+    resumo = bytes.fromhex(hash_txt or hash_arquivo(caminho_txt))
+    grafias = {}
+    with open(caminho_txt, 'r', encoding='utf-8') as f:
+        for palavra, palavra_norm, _ in ler_palavras_jogaveis(f):
+            grafias.setdefault(palavra_norm, {})[palavra] = None
+
+    normalizadas = sorted(grafias)
+    primeira, destinos, antes, rotulos, finais = _achatar(construir_dawg(normalizadas))
+
+    offsets = [0]
+    blob = bytearray()
+    for palavra_norm in normalizadas:
+        blob += "\n".join(grafias[palavra_norm]).encode('utf-8')
+        offsets.append(len(blob))
+
+    n_nos, n_arestas = len(finais), len(rotulos)
+    caminho_temp = caminho_bin + ".tmp"
+    with open(caminho_temp, 'wb') as f:
+        cabecalho = CABECALHO.pack(MAGICO, resumo, n_nos, n_arestas, len(normalizadas), len(blob))
+        f.write(cabecalho.ljust(TAMANHO_CABECALHO, b'\0'))
+        for valores in (primeira, destinos, antes, offsets):
+            f.write(struct.pack(f"<{len(valores)}I", *valores))
+        f.write(rotulos)
+        f.write(finais)
+        f.write(blob)
+    os.replace(caminho_temp, caminho_bin)
+
+    tempo_total = time.time() - tempo_inicio
+    print(f"✓ {len(normalizadas)} formas em {n_nos} nós e {n_arestas} arestas compiladas em {tempo_total:.2f}s")
+
+
+class DicionarioDawg:
+    """DAWG somente-leitura sobre o mmap do arquivo compilado"""
+
+    def __init__(self, caminho_arquivo):
+        self._arquivo = open(caminho_arquivo, 'rb')
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magico, resumo, n_nos, n_arestas, n_palavras, tam_blob = CABECALHO.unpack_from(self._mapa)
+        if magico != MAGICO:
+            self.fechar()
+            raise ValueError(f"'{caminho_arquivo}' não é um DAWG compilado")
+        self.hash_conteudo = resumo.hex()
+        self._n_palavras = n_palavras
+
+        self._visao = visao = memoryview(self._mapa)
+        inicio = TAMANHO_CABECALHO
+        secoes = []
+        for quantidade in (n_nos + 1, n_arestas, n_arestas, n_palavras + 1):
+            secoes.append(visao[inicio:inicio + 4 * quantidade].cast('I'))
+            inicio += 4 * quantidade
+        self._primeira, self._destinos, self._antes, self._offsets = secoes
+        self._rotulos = visao[inicio:inicio + n_arestas]
+        inicio += n_arestas
+        self._finais = visao[inicio:inicio + n_nos]
+        inicio += n_nos
+        self._blob = visao[inicio:inicio + tam_blob]
+
+    def __len__(self):
+        return self._n_palavras
+
+    def _grafias(self, numero):
+        return bytes(self._blob[self._offsets[numero]:self._offsets[numero + 1]]).decode('utf-8').split("\n")
+
+    def buscar_palavras(self, letras_disponiveis, letra_central):
+        """Palavras ORIGINAIS válidas para o tabuleiro, das menores para as maiores"""
+        permitidas = mascara_tabuleiro(letras_disponiveis) | mascara_tabuleiro(letra_central)
+        central = mascara_tabuleiro(letra_central)
+        if not central:
+            return []
+        bit_central = central.bit_length() - 1
+
+        primeira, destinos, antes = self._primeira, self._destinos, self._antes
+        rotulos, finais = self._rotulos, self._finais
+
+        encontradas = []
+        # (nó, profundidade, já passou pela central, número da palavra até aqui)
+        pilha = [(0, 0, False, 0)]
+        while pilha:
+            no, profundidade, tem_central, numero = pilha.pop()
+            if finais[no] and tem_central and profundidade >= TAMANHO_MINIMO:
+                encontradas.append(numero)
+            for aresta in range(primeira[no], primeira[no + 1]):
+                rotulo = rotulos[aresta]
+                if permitidas >> rotulo & 1:
+                    pilha.append((destinos[aresta], profundidade + 1,
+                                  tem_central or rotulo == bit_central, numero + antes[aresta]))
+
+        palavras = []
+        for numero in sorted(encontradas):
+            palavras.extend(self._grafias(numero))
+        palavras.sort(key=len)
+        return palavras
+
+    def fechar(self):
+        for atributo in ("_blob", "_finais", "_rotulos", "_offsets", "_antes", "_destinos", "_primeira", "_visao"):
+            visao = self.__dict__.pop(atributo, None)
+            if visao is not None:
+                visao.release()
+        self._mapa.close()
+        self._arquivo.close()
+
+
+def abrir_dawg(caminho_arquivo='Robo-soletra/Robo/palavras3.dawg',
+               caminho_fonte='Robo-soletra/Robo/palavras3.txt'):
+    """Abre o DAWG compilado; retorna None se não existir ou estiver desatualizado"""
+    if not os.path.exists(caminho_arquivo):
+        return None
+
+    try:
+        dawg = DicionarioDawg(caminho_arquivo)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"⚠️ DAWG inválido: {e}")
+        return None
+
+    if caminho_fonte and os.path.exists(caminho_fonte) and not fonte_confere(caminho_fonte, dawg.hash_conteudo, caminho_arquivo):
+        print(f"⚠️ '{caminho_arquivo}' está desatualizado em relação a '{caminho_fonte}'. Recompile.")
+        dawg.fechar()
+        return None
+
+    print(f"📚 DAWG aberto: {len(dawg)} formas normalizadas")
+    return dawg
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compila uma lista de palavras no DAWG dos robôs.")
+    parser.add_argument("entrada", nargs="?", default="Robo-soletra/Robo/palavras3.txt")
+    parser.add_argument("saida", nargs="?", default="Robo-soletra/Robo/palavras3.dawg")
+    args = parser.parse_args()
+
+    compilar_dawg(args.entrada, args.saida)
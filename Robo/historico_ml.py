@@ -0,0 +1,235 @@
+import csv
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date
+
+from nucleo_soletra import chave_tabuleiro, normalizar_palavra
+
+
+# --- Histórico Em SQLite, Particionado Por Tabuleiro ---
+#
+# Substitui o historico_soletra.csv lido e regravado inteiro pelo pandas a
+# cada salvamento. Cada palavra é uma linha com chave primária; um lote de
+# resultados vira um único INSERT ... ON CONFLICT numa transação só, e a
+# priorização lê só a partição do tabuleiro, pela chave primária.
+#
+# Mesmas colunas do CSV antigo (palavra, foi_aceita, tamanho, frequencia),
+# mais a assinatura do tabuleiro (data + letras externas ordenadas + central).
+# Cada dia/tabuleiro tem a sua partição, então o arquivo não precisa mais ser
+# apagado à mão quando as palavras mudam. Registros de antes da partição (o
+# CSV antigo ou um banco sem a coluna) ficam em SEM_TABULEIRO.
+#
+# partidas guarda, de cada tabuleiro completado, as palavras aceitas na ordem
+# em que foram enviadas: rodar o robô de novo no mesmo tabuleiro reenvia só
+# essa lista (modo replay). Durante uma execução, os robôs leem a partição
+# uma vez em HistoricoEmMemoria.
+
+
+HISTORICO_FILE = "historico_soletra.db"
+HISTORICO_CSV = "historico_soletra.csv"
+SEM_TABULEIRO = ""
+
+_CRIAR_HISTORICO = """
+    CREATE TABLE IF NOT EXISTS historico (
+        tabuleiro TEXT NOT NULL,
+        palavra TEXT NOT NULL,
+        foi_aceita INTEGER NOT NULL,
+        tamanho INTEGER NOT NULL,
+        frequencia INTEGER NOT NULL,
+        PRIMARY KEY (tabuleiro, palavra)
+    ) WITHOUT ROWID
+"""
+
+
+def assinatura_tabuleiro(letras_disponiveis, letra_central, data=None):
+    """Partição do histórico: data + chave do tabuleiro (ex: '2024-05-01|aiorst:c')"""
+    return f"{(data or date.today()).isoformat()}|{chave_tabuleiro(letras_disponiveis, letra_central)}"
+
+
+def _conectar(caminho_arquivo):
+    novo = not os.path.exists(caminho_arquivo)
+    conexao = sqlite3.connect(caminho_arquivo)
+    colunas = [linha[1] for linha in conexao.execute("PRAGMA table_info(historico)")]
+    if colunas and "tabuleiro" not in colunas:
+        _migrar_sem_particao(conexao)
+    conexao.execute(_CRIAR_HISTORICO)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS partidas (
+            tabuleiro TEXT PRIMARY KEY,
+            palavras TEXT NOT NULL,
+            concluida_em REAL NOT NULL
+        )
+    """)
+    if novo and os.path.exists(HISTORICO_CSV):
+        _importar_csv(conexao, HISTORICO_CSV)
+    return conexao
+
+
+def _migrar_sem_particao(conexao):
+    # Banco de antes das partições: a chave primária muda, então a tabela é recriada
+    with conexao:
+        conexao.execute("ALTER TABLE historico RENAME TO historico_sem_particao")
+        conexao.execute(_CRIAR_HISTORICO)
+        conexao.execute("""
+            INSERT INTO historico SELECT ?, palavra, foi_aceita, tamanho, frequencia FROM historico_sem_particao
+        """, (SEM_TABULEIRO,))
+        conexao.execute("DROP TABLE historico_sem_particao")
+
+
+def _importar_csv(conexao, caminho_csv):
+    with open(caminho_csv, 'r', encoding='utf-8', newline='') as f:
+        registros = [
+            (SEM_TABULEIRO, linha["palavra"], int(float(linha.get("foi_aceita") or 1)),
+             len(linha["palavra"]), int(float(linha.get("frequencia") or 0)))
+            for linha in csv.DictReader(f) if linha.get("palavra")
+        ]
+    with conexao:
+        conexao.executemany("INSERT OR REPLACE INTO historico VALUES (?, ?, ?, ?, ?)", registros)
+    print(f"📊 Histórico antigo '{caminho_csv}' importado: {len(registros)} registros")
+
+
+def registrar_historico(palavras_aceitas, palavras_rejeitadas=(), caminho_arquivo=HISTORICO_FILE,
+                        tabuleiro=SEM_TABULEIRO):
+    """
+    Grava um lote de resultados do tabuleiro numa única transação.
+
+    Aceitas entram com frequência 1 ou somam 1 à frequência (e passam a
+    constar como aceitas); rejeitadas só entram se a palavra ainda não
+    estiver na partição.
+    """
+    with closing(_conectar(caminho_arquivo)) as conexao, conexao:
+        conexao.executemany("""
+            INSERT INTO historico VALUES (?, ?, 1, ?, 1)
+            ON CONFLICT (tabuleiro, palavra) DO UPDATE SET frequencia = frequencia + 1, foi_aceita = 1
+        """, [(tabuleiro, palavra, len(palavra)) for palavra in palavras_aceitas])
+        conexao.executemany("""
+            INSERT INTO historico VALUES (?, ?, 0, ?, 0)
+            ON CONFLICT (tabuleiro, palavra) DO NOTHING
+        """, [(tabuleiro, palavra, len(palavra)) for palavra in palavras_rejeitadas])
+
+
+def _existe_historico(caminho_arquivo):
+    return os.path.exists(caminho_arquivo) or os.path.exists(HISTORICO_CSV)
+
+
+def tamanho_historico(caminho_arquivo=HISTORICO_FILE, tabuleiro=SEM_TABULEIRO):
+    """(total de registros, quantos foram aceitos) da partição"""
+    if not _existe_historico(caminho_arquivo):
+        return 0, 0
+    with closing(_conectar(caminho_arquivo)) as conexao:
+        total, aceitas = conexao.execute(
+            "SELECT COUNT(*), TOTAL(foi_aceita) FROM historico WHERE tabuleiro = ?", (tabuleiro,),
+        ).fetchone()
+    return total, int(aceitas)
+
+
+def carregar_registros(caminho_arquivo=HISTORICO_FILE, tabuleiro=SEM_TABULEIRO):
+    """Partição inteira em {palavra: (foi_aceita, frequencia)}, numa consulta só"""
+    if caminho_arquivo is None or not _existe_historico(caminho_arquivo):
+        return {}
+    with closing(_conectar(caminho_arquivo)) as conexao:
+        return {palavra: (foi_aceita, frequencia) for palavra, foi_aceita, frequencia in conexao.execute(
+            "SELECT palavra, foi_aceita, frequencia FROM historico WHERE tabuleiro = ?", (tabuleiro,),
+        )}
+
+
+def exemplos_de_treino(caminho_arquivo=HISTORICO_FILE):
+    """(palavra, foi_aceita) de todas as partições; aceita em algum tabuleiro conta como aceita"""
+    if not _existe_historico(caminho_arquivo):
+        return []
+    with closing(_conectar(caminho_arquivo)) as conexao:
+        return conexao.execute(
+            "SELECT palavra, MAX(foi_aceita) FROM historico GROUP BY palavra ORDER BY palavra"
+        ).fetchall()
+
+
+class HistoricoEmMemoria:
+    """
+    Scores de uma partição lidos uma vez por execução e atualizados em memória.
+
+    Cada robô passa a sua fórmula pontuar(foi_aceita, frequencia); as
+    novas tentativas usam os resultados das anteriores sem reler o banco,
+    que continua sendo gravado por registrar_historico no fim da execução.
+    """
+
+    def __init__(self, pontuar, caminho_arquivo=HISTORICO_FILE, so_aceitas=False, tabuleiro=SEM_TABULEIRO):
+        self._pontuar = pontuar
+        self._so_aceitas = so_aceitas
+        self._registros = carregar_registros(caminho_arquivo, tabuleiro)
+        self.scores = {}
+        for palavra, registro in self._registros.items():
+            self._atualizar_score(palavra, registro)
+        self.aceitas = sum(foi_aceita for foi_aceita, _ in self._registros.values())
+
+    def __len__(self):
+        return len(self._registros)
+
+    def _atualizar_score(self, palavra, registro):
+        if registro[0] or not self._so_aceitas:
+            self.scores[palavra] = self._pontuar(*registro)
+
+    def registrar(self, palavras_aceitas, palavras_rejeitadas=()):
+        """Mesma regra do upsert de registrar_historico, só que no dict"""
+        for palavra in palavras_aceitas:
+            foi_aceita, frequencia = self._registros.get(palavra, (0, 0))
+            self.aceitas += not foi_aceita
+            self._registros[palavra] = registro = (1, frequencia + 1)
+            self._atualizar_score(palavra, registro)
+        for palavra in palavras_rejeitadas:
+            if palavra not in self._registros:
+                self._registros[palavra] = registro = (0, 0)
+                self._atualizar_score(palavra, registro)
+
+    def ordenar(self, palavras, score_novas):
+        """Candidatas por score (maior primeiro) e tamanho; score_novas(palavra) para as fora do histórico"""
+        scores = self.scores
+        return sorted(palavras, key=lambda p: (-(scores[p] if p in scores else score_novas(p)), len(p)))
+
+
+# --- Replay De Tabuleiros Já Completados ---
+
+
+def ordem_de_replay(palavras_enviadas, palavras_acertadas):
+    """
+    Grafias enviadas pelo robô cuja forma está entre os acertos do jogo, na
+    ordem de envio e uma por forma: a lista que completa o tabuleiro de novo.
+    """
+    formas_acertadas = {normalizar_palavra(p) for p in palavras_acertadas}
+    vistas = set()
+    lista = []
+    for palavra in palavras_enviadas:
+        forma = normalizar_palavra(palavra)
+        if forma in formas_acertadas and forma not in vistas:
+            vistas.add(forma)
+            lista.append(palavra)
+    return lista
+
+
+def salvar_partida_resolvida(tabuleiro, palavras, caminho_arquivo=HISTORICO_FILE):
+    """Guarda a lista de replay de um tabuleiro completado"""
+    if not palavras:
+        return
+    try:
+        with closing(_conectar(caminho_arquivo)) as conexao, conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO partidas VALUES (?, ?, ?)", (tabuleiro, "\n".join(palavras), time.time()),
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao salvar a partida para replay: {e}")
+        return
+    print(f"⚡ Replay salvo: {len(palavras)} palavras para {tabuleiro}")
+
+
+def ler_partida_resolvida(tabuleiro, caminho_arquivo=HISTORICO_FILE):
+    """Lista de replay do tabuleiro, ou None se ele ainda não foi completado"""
+    if not os.path.exists(caminho_arquivo):
+        return None
+    try:
+        with closing(_conectar(caminho_arquivo)) as conexao:
+            linha = conexao.execute("SELECT palavras FROM partidas WHERE tabuleiro = ?", (tabuleiro,)).fetchone()
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao ler a partida para replay: {e}")
+        return None
+    return linha[0].split("\n") if linha else None
@@ -0,0 +1,283 @@
+import numpy as np
+
+from nucleo_soletra import ALFABETO, TAMANHO_MINIMO, MAXIMO_LETRAS_DISTINTAS, TABELA_NORMALIZACAO, normalizar_palavra
+
+
+# --- Filtro Vetorizado Do Dicionário ---
+#
+# Mesmo resultado de ler_palavras_jogaveis_simples/construir_indice_simples
+# do nucleo_soletra, sem laço por palavra: o texto é lido em blocos, cada
+# bloco vira um array de códigos de caractere e a máscara de cada linha sai
+# de um bitwise_or.reduceat entre as quebras. O nucleo_soletra usa este
+# módulo quando o numpy está instalado e cai no caminho palavra a palavra
+# quando não está.
+#
+# lower() e a tabela levam cada caractere latin-1 a um único caractere
+# latin-1, então, para texto que cabe em latin-1 (o caso do português),
+# normalizar é um bytes.translate. Cada caractere normalizado vira a posição
+# do seu bit: a-z em 0-25, BIT_INVALIDO para o resto e BIT_QUEBRA na quebra
+# de linha, que sai da máscara depois do reduceat.
+
+TAMANHO_BLOCO = 1 << 18  # caracteres lidos e filtrados de uma vez
+LINHAS_POR_BLOCO = 1 << 14
+
+# Códigos de todos os caracteres que str.strip() remove (o maior é U+3000)
+ESPACOS = np.array([codigo for codigo in range(0x3001) if chr(codigo).isspace()], dtype=np.uint32)
+ESPACOS_LATIN1 = np.isin(np.arange(256), ESPACOS)
+
+BIT_INVALIDO = len(ALFABETO)
+BIT_QUEBRA = BIT_INVALIDO + 1
+BASE_HASH = 0x9E3779B97F4A7C15
+
+NORMALIZACAO_LATIN1 = bytes(ord(normalizar_palavra(chr(codigo))) for codigo in range(256))
+
+# Posição do bit de cada código normalizado; 256 representa "acima de latin-1"
+POSICOES_BITS = np.full(257, BIT_INVALIDO, dtype=np.uint8)
+POSICOES_BITS[ord("\n")] = BIT_QUEBRA
+POSICOES_BITS[[ord(letra) for letra in ALFABETO]] = np.arange(len(ALFABETO))
+POSICOES_LATIN1 = POSICOES_BITS[np.frombuffer(NORMALIZACAO_LATIN1, dtype=np.uint8)].tobytes()
+
+
+def _normalizar_texto(texto):
+    """Mesmo resultado de normalizar_palavra, para um texto grande de uma vez"""
+    try:
+        return texto.encode("latin-1").translate(NORMALIZACAO_LATIN1).decode("latin-1")
+    except UnicodeEncodeError:
+        # Fora de latin-1: um replace por letra acentuada ainda é bem mais rápido que translate com dict
+        texto = texto.lower()
+        for origem, destino in TABELA_NORMALIZACAO.items():
+            texto = texto.replace(chr(origem), destino)
+        return texto
+
+
+def _blocos_de_texto(linhas):
+    """Texto em blocos que terminam em fim de linha, de um arquivo aberto ou de um iterável de palavras"""
+    ler = getattr(linhas, "read", None)
+    if ler is not None:
+        resto = ""
+        while True:
+            bloco = ler(TAMANHO_BLOCO)
+            if not bloco:
+                break
+            bloco = resto + bloco
+            corte = bloco.rfind("\n") + 1
+            resto = bloco[corte:]
+            if corte:
+                yield bloco[:corte]
+        if resto:
+            yield resto
+        return
+
+    lote = []
+    for linha in linhas:
+        lote.append(linha)
+        if len(lote) >= LINHAS_POR_BLOCO:
+            yield "\n".join(lote)
+            lote = []
+    if lote:
+        yield "\n".join(lote)
+
+
+def _contar_bits(mascaras):
+    """Popcount de um array uint32 (soma de bits em paralelo)"""
+    mascaras = mascaras - ((mascaras >> 1) & 0x55555555)
+    mascaras = (mascaras & 0x33333333) + ((mascaras >> 2) & 0x33333333)
+    mascaras = (mascaras + (mascaras >> 4)) & 0x0F0F0F0F
+    return (mascaras * 0x01010101) >> 24
+
+
+def _codigos(texto):
+    """Códigos dos caracteres num array: uint8 se o texto couber em latin-1, senão uint32"""
+    try:
+        return np.frombuffer(texto.encode("latin-1"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return np.frombuffer(texto.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+
+def _texto(codigos):
+    if codigos.dtype == np.uint8:
+        return codigos.tobytes().decode("latin-1")
+    return codigos.tobytes().decode("utf-32-le", "surrogatepass")
+
+
+def _linhas(texto):
+    """(códigos do texto com um '\n' final, início e tamanho de cada linha)"""
+    codigos = _codigos(texto + "\n")
+    quebras = np.flatnonzero(codigos == 10)
+    inicios = np.concatenate(([0], quebras[:-1] + 1))
+    return codigos, inicios, quebras - inicios
+
+
+def _juntar_linhas(linhas, escolhidas, lote=1 << 14):
+    """
+    Códigos só das linhas escolhidas, na ordem dada, cada uma terminada em
+    '\n', e o tamanho de cada uma com a quebra. Junta de `lote` em `lote`
+    linhas para os índices de caractere não crescerem com o texto inteiro.
+    """
+    codigos, inicios, tamanhos = linhas
+    partes = []
+    com_quebra = tamanhos[escolhidas] + 1
+    for inicio in range(0, len(escolhidas), lote):
+        trecho = com_quebra[inicio:inicio + lote]
+        fins = np.cumsum(trecho)
+        deslocamentos = np.repeat(inicios[escolhidas[inicio:inicio + lote]] - (fins - trecho), trecho)
+        deslocamentos += np.arange(len(deslocamentos))
+        partes.append(codigos[deslocamentos])
+    return (np.concatenate(partes) if partes else codigos[:0]), com_quebra
+
+
+def _filtrar_bloco(bloco):
+    """
+    Filtra um bloco de linhas inteiro com operações de array, sem laço por
+    palavra: cada caractere normalizado vira o seu bit e a máscara de cada
+    linha é um bitwise_or.reduceat entre as quebras.
+
+    Returns:
+        tuple: (linhas originais no formato de _linhas, posições das
+        jogáveis, máscara de cada jogável)
+    """
+    originais = _linhas(bloco)
+    codigos, inicios, tamanhos = originais
+    com_texto = tamanhos > 0
+    bordas = codigos[np.concatenate((inicios[com_texto], (inicios + tamanhos - 1)[com_texto]))]
+    if (ESPACOS_LATIN1[bordas] if bordas.dtype == np.uint8 else np.isin(bordas, ESPACOS)).any():
+        # Raro: linha com espaço, tab ou \r nas bordas. Refaz com as linhas aparadas
+        return _filtrar_bloco("\n".join(linha.strip() for linha in bloco.split("\n")))
+
+    if codigos.dtype == np.uint8:
+        posicoes = np.frombuffer(codigos.tobytes().translate(POSICOES_LATIN1), dtype=np.uint8)
+        inicios_norm = inicios
+    else:
+        # Fora de latin-1, lower() pode mudar o tamanho da linha: as posições vêm da forma normalizada
+        codigos_norm, inicios_norm, _ = _linhas(_normalizar_texto(bloco))
+        # A forma normalizada pode caber em latin-1 (ex: 'ẞ' vira 'ß'): uint32 antes de comparar com 256
+        posicoes = POSICOES_BITS[np.minimum(codigos_norm.astype(np.uint32), 256)]
+    bits = np.left_shift(1, posicoes, dtype=np.uint32)
+    mascaras = np.bitwise_or.reduceat(bits, inicios_norm) & ~np.uint32(1 << BIT_QUEBRA)
+
+    jogaveis = np.flatnonzero(
+        (tamanhos >= TAMANHO_MINIMO)
+        & (mascaras != 0) & (mascaras < (1 << BIT_INVALIDO))
+        & (_contar_bits(mascaras) <= MAXIMO_LETRAS_DISTINTAS)
+    )
+    return originais, jogaveis, mascaras[jogaveis]
+
+
+def ler_palavras_jogaveis(linhas):
+    """Mesmo resultado de nucleo_soletra.ler_palavras_jogaveis_simples, bloco a bloco"""
+    for bloco in _blocos_de_texto(linhas):
+        originais, jogaveis, mascaras = _filtrar_bloco(bloco)
+        if not len(jogaveis):
+            continue
+        texto = _texto(_juntar_linhas(originais, jogaveis)[0][:-1])
+        yield from zip(texto.split("\n"), _normalizar_texto(texto).split("\n"), mascaras.tolist())
+
+
+def _hashes_das_linhas(codigos, com_quebra):
+    """Hash polinomial (mod 2^64) de cada linha de um array de _juntar_linhas"""
+    fins = np.cumsum(com_quebra)
+    posicoes = np.arange(len(codigos), dtype=np.int32)
+    posicoes -= np.repeat((fins - com_quebra).astype(np.int32), com_quebra)
+    pesos = np.cumprod(np.full(int(com_quebra.max()), BASE_HASH, dtype=np.uint64))
+    # Soma acumulada mod 2^64: o hash da linha é a diferença entre os fins
+    termos = np.take(pesos, posicoes)
+    del posicoes
+    termos *= codigos
+    somas = np.cumsum(termos, out=termos)[fins - 1]
+    return np.diff(somas, prepend=np.uint64(0))
+
+
+def _primeiras_ocorrencias(linhas, hashes):
+    """
+    Posições (em ordem) da primeira ocorrência de cada linha. Linhas com o
+    mesmo hash são comparadas caractere a caractere; se duas diferentes
+    colidirem, devolve None e a repetição é tirada grupo a grupo.
+    """
+    # Hash nos bits altos e posição nos baixos: depois do sort, cada linha
+    # repetida fica logo atrás da sua primeira ocorrência
+    bits_posicao = np.uint64(max(len(hashes) - 1, 1).bit_length())
+    chaves = (hashes >> bits_posicao << bits_posicao) | np.arange(len(hashes), dtype=np.uint64)
+    chaves.sort()
+    hashes = chaves >> bits_posicao
+    posicoes = (chaves & ((np.uint64(1) << bits_posicao) - np.uint64(1))).astype(np.intp)
+    del chaves
+    novas = np.ones(len(posicoes), dtype=bool)
+    novas[1:] = hashes[1:] != hashes[:-1]
+    if novas.all():
+        return np.arange(len(posicoes))
+
+    primeiras = posicoes[novas]
+    donas = primeiras[np.cumsum(novas, dtype=np.int32)[~novas] - 1]
+    repetidas = posicoes[~novas]
+    _, _, tamanhos = linhas
+    if not np.array_equal(tamanhos[repetidas], tamanhos[donas]) or not np.array_equal(
+        _juntar_linhas(linhas, repetidas)[0], _juntar_linhas(linhas, donas)[0],
+    ):
+        return None
+    primeiras.sort()
+    return primeiras
+
+
+def _agrupar_por_mascara(linhas):
+    """
+    Lê e filtra o texto bloco a bloco e devolve as jogáveis já agrupadas:
+    (texto com as palavras em ordem de máscara, máscara, início e fim de cada
+    grupo no texto, se ainda há repetidas). Os arrays morrem aqui; quem chama
+    só recebe o texto e listas do tamanho do número de grupos.
+    """
+    codigos, com_quebra, mascaras, hashes = [], [], [], []
+    for bloco in _blocos_de_texto(linhas):
+        originais, jogaveis, mascaras_bloco = _filtrar_bloco(bloco)
+        if not len(jogaveis):
+            continue
+        codigos_bloco, com_quebra_bloco = _juntar_linhas(originais, jogaveis)
+        codigos.append(codigos_bloco)
+        com_quebra.append(com_quebra_bloco.astype(np.int32))
+        mascaras.append(mascaras_bloco)
+        hashes.append(_hashes_das_linhas(codigos_bloco, com_quebra_bloco))
+    if not mascaras:
+        return "", [], [], [], False
+
+    codigos, com_quebra, mascaras, hashes = map(np.concatenate, (codigos, com_quebra, mascaras, hashes))
+    jogaveis = (codigos, np.cumsum(com_quebra, dtype=np.int32) - com_quebra, com_quebra - 1)
+    unicas = _primeiras_ocorrencias(jogaveis, hashes)
+    del hashes
+    repetidas = unicas is None
+    if repetidas:
+        unicas = np.arange(len(mascaras))
+
+    # Máscara nos 32 bits altos e posição nos baixos: um sort simples já é estável
+    chaves = (mascaras[unicas].astype(np.uint64) << np.uint64(32)) | unicas.astype(np.uint64)
+    del mascaras, unicas
+    chaves.sort()
+    mascaras = (chaves >> np.uint64(32)).astype(np.uint32)
+    ordem = (chaves & np.uint64(0xFFFFFFFF)).astype(np.int32)
+    del chaves
+    ultimas = np.append(np.flatnonzero(mascaras[1:] != mascaras[:-1]), len(mascaras) - 1)
+
+    codigos, com_quebra = _juntar_linhas(jogaveis, ordem)
+    del jogaveis, ordem
+    fins = np.cumsum(com_quebra)[ultimas]
+    inicios = np.concatenate(([0], fins[:-1]))
+    return _texto(codigos), mascaras[ultimas].tolist(), inicios.tolist(), (fins - 1).tolist(), repetidas
+
+
+def construir_indice(linhas):
+    """
+    Mesmo resultado de nucleo_soletra.construir_indice_simples. Nenhuma
+    palavra vira objeto Python: as jogáveis de cada bloco ficam num array de
+    códigos, as linhas repetidas saem por hash, uma ordenação estável por
+    máscara junta os grupos (na ordem do arquivo) e cada grupo é uma fatia
+    de um texto decodificado uma vez só.
+    """
+    texto, mascaras, inicios, fins, repetidas = _agrupar_por_mascara(linhas)
+    originais = list(map(texto.__getitem__, map(slice, inicios, fins)))
+    if repetidas:
+        # Colisão de hash: tira as repetições de cada grupo comparando as strings
+        originais = ["\n".join(dict.fromkeys(grupo.split("\n"))) for grupo in originais]
+    normalizado = _normalizar_texto(texto)
+    if repetidas or len(normalizado) != len(texto):
+        normais = map(_normalizar_texto, originais)
+    else:
+        normais = map(normalizado.__getitem__, map(slice, inicios, fins))
+    return dict(zip(mascaras, zip(originais, normais)))
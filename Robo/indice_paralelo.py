@@ -0,0 +1,98 @@
+import argparse
+import os
+import time
+from multiprocessing import Pool
+
+from nucleo_soletra import construir_indice, total_palavras
+
+
+# --- Indexação Em Vários Núcleos ---
+#
+# Para listas mescladas de vários milhões de entradas, a passada de
+# normalização e filtro vira o gargalo antes da primeira palavra enviada.
+# O arquivo é cortado em trechos que terminam sempre em fim de linha; cada
+# processo indexa o seu trecho e os índices parciais são mesclados na ordem
+# dos trechos, então o resultado é idêntico ao da leitura sequencial.
+
+
+LIMITE_SEQUENCIAL = 16 * 1024 * 1024  # abaixo disso, subir processos custa mais do que ganha
+TRECHOS_POR_PROCESSO = 4
+
+
+def _dividir_arquivo(caminho_arquivo, partes):
+    """Intervalos de bytes [início, fim) que começam e terminam em fronteira de linha"""
+    tamanho = os.path.getsize(caminho_arquivo)
+    limites = [0]
+    with open(caminho_arquivo, 'rb') as f:
+        for i in range(1, partes):
+            f.seek(tamanho * i // partes)
+            f.readline()
+            limites.append(max(f.tell(), limites[-1]))
+    limites.append(tamanho)
+    return [(inicio, fim) for inicio, fim in zip(limites, limites[1:]) if fim > inicio]
+
+
+def _indexar_trecho(tarefa):
+    caminho_arquivo, inicio, fim = tarefa
+    with open(caminho_arquivo, 'rb') as f:
+        f.seek(inicio)
+        dados = f.read(fim - inicio)
+    return construir_indice(dados.decode('utf-8').split("\n"))
+
+
+def _mesclar_indices(parciais):
+    """Junta índices parciais na ordem recebida, mantendo a primeira ocorrência de cada palavra"""
+    grupos = {}
+    for parcial in parciais:
+        for mascara, (originais, normalizadas) in parcial.items():
+            grupo = grupos.get(mascara)
+            if grupo is None:
+                grupos[mascara] = grupo = {}
+            for palavra, palavra_norm in zip(originais.split("\n"), normalizadas.split("\n")):
+                grupo.setdefault(palavra, palavra_norm)
+
+    return {
+        mascara: ("\n".join(grupo), "\n".join(grupo.values()))
+        for mascara, grupo in grupos.items()
+    }
+
+
+def construir_indice_paralelo(caminho_arquivo, processos=None, limite_sequencial=LIMITE_SEQUENCIAL):
+    """Indexa o arquivo de palavras usando um pool de processos (ou no próprio processo, se for pequeno)"""
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or os.path.getsize(caminho_arquivo) < limite_sequencial:
+        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
+            return construir_indice(f)
+
+    trechos = _dividir_arquivo(caminho_arquivo, processos * TRECHOS_POR_PROCESSO)
+    tarefas = [(caminho_arquivo, inicio, fim) for inicio, fim in trechos]
+    with Pool(processos) as pool:
+        parciais = pool.map(_indexar_trecho, tarefas)
+    return _mesclar_indices(parciais)
+
+
+def medir_aceleracao(caminho_arquivo, max_processos=None):
+    """Compara o tempo de indexação sequencial com 2..N processos e imprime a aceleração"""
+    max_processos = max_processos or os.cpu_count() or 1
+
+    tempo_inicio = time.time()
+    referencia = construir_indice_paralelo(caminho_arquivo, processos=1)
+    tempo_base = time.time() - tempo_inicio
+    print(f"📚 {total_palavras(referencia)} palavras jogáveis em '{caminho_arquivo}'")
+    print(f"   1 processo : {tempo_base:6.2f}s | 1.00x")
+
+    for processos in range(2, max_processos + 1):
+        tempo_inicio = time.time()
+        indice = construir_indice_paralelo(caminho_arquivo, processos=processos, limite_sequencial=0)
+        tempo = time.time() - tempo_inicio
+        status = "✓" if indice == referencia else "❌ resultado diferente!"
+        print(f"   {processos} processos: {tempo:6.2f}s | {tempo_base / tempo:.2f}x {status}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mede a indexação do dicionário em vários núcleos.")
+    parser.add_argument("dicionario", nargs="?", default="Robo-soletra/Robo/palavras3.txt")
+    parser.add_argument("--processos", type=int, default=None, help="máximo de processos a testar")
+    args = parser.parse_args()
+
+    medir_aceleracao(args.dicionario, args.processos)
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from nucleo_soletra import normalizar_palavra
+
+
+# --- Léxico Global Do Jogo (Vale Para Todos Os Dias) ---
+#
+# O histórico de cada tabuleiro vale só para ele, mas o dicionário do jogo
+# é o mesmo todo dia: uma forma que ele aceitou num tabuleiro é aceita em
+# qualquer outro, e uma que ele recusou ("não está na lista") não deve ser
+# enviada de novo. Este arquivo guarda esse conhecimento por forma
+# normalizada e não deve ser apagado.
+#
+# O jogo não diz palavra a palavra o que recusou, e a recusa deduzida do
+# placar no envio em alta velocidade pode ser falsa (o placar não atualizou
+# a tempo). Por isso só conta como recusa a que vem de um tabuleiro
+# completado: a lista de acertos do jogo é a resposta inteira e toda forma
+# enviada fora dela está fora do dicionário do jogo. A poda é reversível:
+# uma aceitação em qualquer dia tira a forma da poda, e a recusa vence
+# depois de VALIDADE_RECUSA (o jogo pode ganhar palavras novas).
+
+
+LEXICO_FILE = "lexico_soletra.db"
+VALIDADE_RECUSA = 90 * 24 * 3600  # segundos
+
+
+def _conectar(caminho_arquivo):
+    conexao = sqlite3.connect(caminho_arquivo)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS lexico (
+            forma TEXT PRIMARY KEY,
+            aceitas INTEGER NOT NULL DEFAULT 0,
+            rejeicoes INTEGER NOT NULL DEFAULT 0,
+            ultimo_resultado REAL NOT NULL,
+            recusada_em REAL
+        ) WITHOUT ROWID
+    """)
+    colunas = [linha[1] for linha in conexao.execute("PRAGMA table_info(lexico)")]
+    if "recusada_em" not in colunas:
+        # Léxico de antes da recusa confirmada: as recusas antigas vinham do placar e não podam nada
+        with conexao:
+            conexao.execute("ALTER TABLE lexico ADD COLUMN recusada_em REAL")
+    return conexao
+
+
+def registrar_resultados(palavras_aceitas, palavras_rejeitadas, definitivo=False, caminho_arquivo=LEXICO_FILE):
+    """
+    Soma aceitas e recusas do dia ao léxico global.
+
+    Args:
+        palavras_aceitas (list): Palavras que o jogo aceitou.
+        palavras_rejeitadas (list): Palavras enviadas que não pontuaram.
+        definitivo (bool): True quando o tabuleiro foi completado e a lista de
+            acertos lida por inteiro. Sem isso as recusas são ignoradas.
+        caminho_arquivo (str): Arquivo SQLite do léxico.
+    """
+    agora = time.time()
+    formas_aceitas = {normalizar_palavra(p) for p in palavras_aceitas}
+    # Uma variante que pontuou (ou que repetiu uma forma já acertada) não é recusa
+    formas_rejeitadas = ({normalizar_palavra(p) for p in palavras_rejeitadas} - formas_aceitas) if definitivo else set()
+
+    try:
+        with closing(_conectar(caminho_arquivo)) as conexao, conexao:
+            conexao.executemany("""
+                INSERT INTO lexico (forma, aceitas, ultimo_resultado) VALUES (?, 1, ?)
+                ON CONFLICT (forma) DO UPDATE SET aceitas = aceitas + 1, ultimo_resultado = excluded.ultimo_resultado
+            """, [(forma, agora) for forma in formas_aceitas])
+            conexao.executemany("""
+                INSERT INTO lexico (forma, rejeicoes, ultimo_resultado, recusada_em) VALUES (?, 1, ?, ?)
+                ON CONFLICT (forma) DO UPDATE SET rejeicoes = rejeicoes + 1,
+                                                  ultimo_resultado = excluded.ultimo_resultado,
+                                                  recusada_em = excluded.recusada_em
+            """, [(forma, agora, agora) for forma in formas_rejeitadas])
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao atualizar o léxico global: {e}")
+        return
+
+    print(f"📖 Léxico global: +{len(formas_aceitas)} aceitas, +{len(formas_rejeitadas)} recusas"
+          f"{' (confirmadas)' if definitivo else ''}")
+
+
+def carregar_rejeitadas(caminho_arquivo=LEXICO_FILE):
+    """Formas normalizadas que o jogo recusou há menos de VALIDADE_RECUSA e nunca aceitou"""
+    if not os.path.exists(caminho_arquivo):
+        return set()
+    try:
+        with closing(_conectar(caminho_arquivo)) as conexao:
+            linhas = conexao.execute(
+                "SELECT forma FROM lexico WHERE aceitas = 0 AND recusada_em >= ?", (time.time() - VALIDADE_RECUSA,),
+            ).fetchall()
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao ler o léxico global: {e}")
+        return set()
+    return {forma for forma, in linhas}
+
+
+def podar_rejeitadas(palavras, rejeitadas, avisar=True):
+    """Remove as candidatas cuja forma o jogo já recusou em algum dia"""
+    if not rejeitadas:
+        return palavras
+    podadas = [p for p in palavras if normalizar_palavra(p) not in rejeitadas]
+    if avisar and len(podadas) < len(palavras):
+        print(f"✂️ Léxico global: {len(palavras) - len(podadas)} palavras já recusadas pelo jogo foram podadas")
+    return podadas
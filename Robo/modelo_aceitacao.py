@@ -0,0 +1,246 @@
+import argparse
+import hashlib
+import os
+import time
+import zlib
+
+import numpy as np
+
+from nucleo_soletra import ler_palavras_jogaveis, normalizar_palavra
+from historico_ml import HISTORICO_FILE, exemplos_de_treino
+
+
+# --- Modelo De Aceitação (Regressão Logística Em NumPy) ---
+#
+# Prevê a chance de o jogo aceitar uma palavra que nunca foi enviada, a
+# partir do que o histórico acumulou em todos os tabuleiros. Cada palavra vira
+# um punhado de características de texto (n-gramas de letras com marcas de
+# início/fim, sufixos, tamanho, acento e em quais dicionários antigos a forma
+# aparece), mapeadas por hash (crc32, estável entre execuções) num vetor de
+# 2^BITS_HASH pesos. Como cada palavra liga só umas dezenas de posições, a
+# matriz fica esparsa: índices + início de cada linha, e o produto escalar é
+# um np.add.reduceat. Treino em lote inteiro com AdaGrad, só CPU.
+#
+# Treino (offline):  python Robo/modelo_aceitacao.py --dicionario dics/antigo.txt
+# Os robôs só carregam o .npz e chamam prever(). Os dicionários de origem só
+# são lidos no treino: o .npz guarda, de cada um, o hash de 64 bits de cada
+# forma jogável, ordenado, e a pertinência vira um np.searchsorted.
+
+
+MODELO_FILE = "modelo_aceitacao.npz"
+VERSAO_MODELO = 3
+BITS_HASH = 18
+TAMANHOS_NGRAMA = (2, 3, 4)
+TAMANHOS_SUFIXO = (1, 2, 3, 4, 5)
+
+
+def caracteristicas(palavra, fontes=None):
+    """Nomes das características de uma palavra (antes do hash)"""
+    forma = normalizar_palavra(palavra)
+    marcada = f"^{forma}$"
+    nomes = ["vies", f"tam:{min(len(forma), 12)}"]
+    if palavra.lower() != forma:
+        nomes.append("acento")
+    for n in TAMANHOS_NGRAMA:
+        nomes.extend(f"g{n}:{marcada[i:i + n]}" for i in range(len(marcada) - n + 1))
+    nomes.extend(f"suf:{forma[-n:]}" for n in TAMANHOS_SUFIXO if len(forma) > n)
+    for nome_fonte, formas in (fontes or {}).items():
+        if forma in formas:
+            nomes.append(f"fonte:{nome_fonte}")
+    return nomes
+
+
+def vetorizar(palavras, fontes=None, bits=BITS_HASH):
+    """Matriz esparsa das palavras: (índices dos pesos, início de cada palavra em índices)"""
+    mascara = (1 << bits) - 1
+    indices = []
+    inicios = [0]
+    for palavra in palavras:
+        indices.extend(zlib.crc32(nome.encode('utf-8')) & mascara for nome in caracteristicas(palavra, fontes))
+        inicios.append(len(indices))
+    return np.array(indices, dtype=np.int64), np.array(inicios, dtype=np.int64)
+
+
+def _probabilidades(pesos, indices, inicios):
+    # Toda palavra tem ao menos o viés, então nenhum trecho do reduceat fica vazio
+    margem = np.add.reduceat(pesos[indices], inicios[:-1])
+    return 1.0 / (1.0 + np.exp(-np.clip(margem, -30, 30)))
+
+
+def treinar(palavras, rotulos, fontes=None, bits=BITS_HASH, epocas=300, taxa=0.5, l2=1e-5):
+    """
+    Ajusta a regressão logística por descida de gradiente em lote com AdaGrad.
+
+    Args:
+        palavras (list): Palavras enviadas ao jogo.
+        rotulos (array): 1 se a palavra foi aceita, 0 se foi recusada.
+        fontes (dict): {nome: conjunto de formas normalizadas} dos dicionários de origem.
+        bits (int): Tamanho do vetor de pesos (2^bits).
+        epocas (int): Passadas sobre o lote inteiro.
+        taxa (float): Taxa de aprendizado inicial do AdaGrad.
+        l2 (float): Regularização dos pesos.
+
+    Returns:
+        np.ndarray: Pesos float32 do modelo.
+    """
+    indices, inicios = vetorizar(palavras, fontes, bits)
+    rotulos = np.asarray(rotulos, dtype=np.float64)
+    por_palavra = np.diff(inicios)
+    n = len(rotulos)
+
+    pesos = np.zeros(1 << bits)
+    acumulado = np.zeros(1 << bits)
+    for _ in range(epocas):
+        erro = _probabilidades(pesos, indices, inicios) - rotulos
+        gradiente = np.bincount(indices, weights=np.repeat(erro, por_palavra), minlength=1 << bits) / n
+        gradiente += l2 * pesos
+        acumulado += gradiente ** 2
+        pesos -= taxa * gradiente / (np.sqrt(acumulado) + 1e-8)
+    return pesos.astype(np.float32)
+
+
+def _hash_forma(forma):
+    return int.from_bytes(hashlib.blake2b(forma.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class FormasDaFonte:
+    """Formas jogáveis de um dicionário de origem, como hashes de 64 bits ordenados"""
+
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def __contains__(self, forma):
+        alvo = np.uint64(_hash_forma(forma))
+        posicao = int(np.searchsorted(self.hashes, alvo))
+        return posicao < len(self.hashes) and self.hashes[posicao] == alvo
+
+
+def carregar_fontes(caminhos):
+    """{nome do arquivo: FormasDaFonte} de cada dicionário de origem que existir (só no treino)"""
+    fontes = {}
+    for caminho in caminhos:
+        if not os.path.exists(caminho):
+            print(f"⚠️ Dicionário de origem '{caminho}' não encontrado; característica ignorada")
+            continue
+        with open(caminho, 'r', encoding='utf-8') as f:
+            hashes = {_hash_forma(forma) for _, forma, _ in ler_palavras_jogaveis(f)}
+        fontes[os.path.basename(caminho)] = FormasDaFonte(np.sort(np.fromiter(hashes, dtype=np.uint64, count=len(hashes))))
+    return fontes
+
+
+class ModeloAceitacao:
+    """Pesos treinados + dicionários de origem, prontos para prever"""
+
+    def __init__(self, pesos, fontes=None):
+        self.pesos = pesos
+        self.bits = int(pesos.size).bit_length() - 1
+        self.fontes = fontes or {}
+
+    def prever(self, palavras):
+        """Probabilidade de aceitação de cada palavra, na ordem dada"""
+        if not palavras:
+            return np.zeros(0)
+        indices, inicios = vetorizar(palavras, self.fontes, self.bits)
+        return _probabilidades(self.pesos, indices, inicios)
+
+
+def salvar_modelo(caminho_arquivo, pesos, fontes=None):
+    """Grava os pesos e, de cada dicionário de origem, o nome e os hashes das formas (concatenados)"""
+    fontes = fontes or {}
+    caminho_temp = caminho_arquivo + ".tmp.npz"
+    np.savez_compressed(
+        caminho_temp, versao=VERSAO_MODELO, pesos=pesos,
+        fontes=np.array(list(fontes), dtype=str),
+        tamanhos_fontes=np.array([len(formas) for formas in fontes.values()], dtype=np.int64),
+        hashes_fontes=np.concatenate([formas.hashes for formas in fontes.values()] or [np.zeros(0, np.uint64)]),
+    )
+    os.replace(caminho_temp, caminho_arquivo)
+
+
+def carregar_modelo(caminho_arquivo=MODELO_FILE):
+    """Abre o modelo treinado; retorna None se não existir ou for de outra versão"""
+    if not os.path.exists(caminho_arquivo):
+        return None
+    try:
+        with np.load(caminho_arquivo) as dados:
+            if int(dados["versao"]) != VERSAO_MODELO:
+                print(f"⚠️ '{caminho_arquivo}' é de outra versão do modelo. Treine de novo.")
+                return None
+            pesos = dados["pesos"]
+            fins = np.cumsum(dados["tamanhos_fontes"])
+            hashes = dados["hashes_fontes"]
+            fontes = {
+                str(nome): FormasDaFonte(hashes[fim - tamanho:fim])
+                for nome, tamanho, fim in zip(dados["fontes"], dados["tamanhos_fontes"], fins)
+            }
+    except (OSError, KeyError, ValueError) as e:
+        print(f"⚠️ Modelo de aceitação inválido: {e}")
+        return None
+    modelo = ModeloAceitacao(pesos, fontes)
+    print(f"🧠 Modelo de aceitação carregado ({modelo.pesos.size} pesos, {len(modelo.fontes)} dicionários de origem)")
+    return modelo
+
+
+def _envios_ate(acertos_acumulados, quantidade):
+    """Quantos envios até somar `quantidade` aceitas"""
+    return int(np.searchsorted(acertos_acumulados, quantidade)) + 1
+
+
+def avaliar(palavras, rotulos, probabilidades):
+    """Compara a ordem do modelo com a ordem por tamanho (a das palavras sem histórico)"""
+    rotulos = np.asarray(rotulos)
+    perda = -np.mean(rotulos * np.log(probabilidades + 1e-12) + (1 - rotulos) * np.log(1 - probabilidades + 1e-12))
+    acuracia = np.mean((probabilidades >= 0.5) == rotulos)
+    print(f"   📉 Log-loss: {perda:.4f} | 🎯 Acurácia: {acuracia * 100:.1f}%")
+
+    total_aceitas = int(rotulos.sum())
+    if not total_aceitas:
+        return
+    tamanhos = np.fromiter((len(p) for p in palavras), dtype=np.int64, count=len(palavras))
+    por_modelo = np.cumsum(rotulos[np.lexsort((tamanhos, -probabilidades))])
+    por_tamanho = np.cumsum(rotulos[np.argsort(tamanhos, kind='stable')])
+    for rotulo, quantidade in (("metade das", (total_aceitas + 1) // 2), ("todas as", total_aceitas)):
+        print(f"   📨 Envios até {rotulo} {total_aceitas} aceitas: modelo {_envios_ate(por_modelo, quantidade)}"
+              f" | por tamanho {_envios_ate(por_tamanho, quantidade)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Treina o modelo de aceitação com o histórico acumulado.")
+    parser.add_argument("--historico", default=HISTORICO_FILE)
+    parser.add_argument("--saida", default=MODELO_FILE)
+    parser.add_argument("--dicionario", action="append", default=[],
+                        help="dicionário de origem (repetível); vira característica 'está neste dicionário'")
+    parser.add_argument("--epocas", type=int, default=300)
+    parser.add_argument("--taxa", type=float, default=0.5)
+    parser.add_argument("--bits", type=int, default=BITS_HASH)
+    parser.add_argument("--validacao", type=float, default=0.2, help="fração separada para avaliar (0 = nenhuma)")
+    args = parser.parse_args()
+
+    exemplos = exemplos_de_treino(args.historico)
+    if not exemplos:
+        print(f"❌ Nenhum resultado em '{args.historico}' para treinar.")
+        raise SystemExit(1)
+    palavras = [palavra for palavra, _ in exemplos]
+    rotulos = np.array([foi_aceita for _, foi_aceita in exemplos], dtype=np.float64)
+    print(f"📊 {len(palavras)} palavras no histórico ({int(rotulos.sum())} aceitas)")
+
+    fontes = carregar_fontes(args.dicionario)
+
+    if args.validacao > 0:
+        embaralhadas = np.random.default_rng(0).permutation(len(palavras))
+        corte = int(len(palavras) * args.validacao)
+        teste, treino = embaralhadas[:corte], embaralhadas[corte:]
+        tempo_inicio = time.time()
+        pesos = treinar([palavras[i] for i in treino], rotulos[treino], fontes, args.bits, args.epocas, args.taxa)
+        print(f"🧪 Validação ({len(teste)} palavras fora do treino, {time.time() - tempo_inicio:.2f}s de treino):")
+        palavras_teste = [palavras[i] for i in teste]
+        indices, inicios = vetorizar(palavras_teste, fontes, args.bits)
+        avaliar(palavras_teste, rotulos[teste], _probabilidades(pesos.astype(np.float64), indices, inicios))
+
+    tempo_inicio = time.time()
+    pesos = treinar(palavras, rotulos, fontes, args.bits, args.epocas, args.taxa)
+    salvar_modelo(args.saida, pesos, fontes)
+    print(f"✓ Modelo treinado com {len(palavras)} palavras em {time.time() - tempo_inicio:.2f}s e salvo em '{args.saida}'")
@@ -0,0 +1,109 @@
+import argparse
+import time
+
+import numpy as np
+
+from nucleo_soletra import construir_indice, palavras_do_grupo, mascara_tabuleiro
+
+
+# --- Motor Vetorizado Para Replay De Tabuleiros ---
+#
+# Mesma regra de encontrar_palavras_validas, mas com o dicionário inteiro em
+# um array uint32 de máscaras. Um tabuleiro é uma única expressão booleana
+# sobre o array; um lote de tabuleiros vira uma matriz (tabuleiros x palavras)
+# calculada de uma vez, em blocos para limitar a memória.
+
+
+def construir_motor(linhas):
+    """Achata o dicionário em (palavras, máscaras uint32, tamanhos)"""
+    indice = construir_indice(linhas)
+
+    palavras = []
+    mascaras = []
+    for mascara, grupo in indice.items():
+        for palavra in palavras_do_grupo(grupo):
+            palavras.append(palavra)
+            mascaras.append(mascara)
+
+    tamanhos = np.fromiter((len(p) for p in palavras), dtype=np.uint8, count=len(palavras))
+    return palavras, np.array(mascaras, dtype=np.uint32), tamanhos
+
+
+def _mascaras_dos_tabuleiros(tabuleiros):
+    """Converte [(letras_disponiveis, letra_central), ...] em arrays de proibidas e centrais"""
+    permitidas = np.fromiter((mascara_tabuleiro(letras) for letras, _ in tabuleiros), dtype=np.uint32)
+    centrais = np.fromiter((mascara_tabuleiro(central) for _, central in tabuleiros), dtype=np.uint32)
+    return ~permitidas, centrais
+
+
+def _palavras_ordenadas(motor, posicoes):
+    palavras, _, tamanhos = motor
+    posicoes = posicoes[np.argsort(tamanhos[posicoes], kind='stable')]
+    return [palavras[i] for i in posicoes]
+
+
+def resolver_tabuleiro(motor, letras_disponiveis, letra_central):
+    """Palavras válidas para um tabuleiro, das menores para as maiores"""
+    _, mascaras, _ = motor
+    proibidas, centrais = _mascaras_dos_tabuleiros([(letras_disponiveis, letra_central)])
+
+    validas = ((mascaras & proibidas[0]) == 0) & ((mascaras & centrais[0]) != 0)
+    return _palavras_ordenadas(motor, np.flatnonzero(validas))
+
+
+def _matrizes_do_lote(motor, tabuleiros, tamanho_bloco):
+    """Gera (início, matriz booleana tabuleiros x palavras) bloco a bloco"""
+    _, mascaras, _ = motor
+    proibidas, centrais = _mascaras_dos_tabuleiros(tabuleiros)
+
+    for inicio in range(0, len(tabuleiros), tamanho_bloco):
+        fim = inicio + tamanho_bloco
+        matriz = ((mascaras[None, :] & proibidas[inicio:fim, None]) == 0)
+        matriz &= (mascaras[None, :] & centrais[inicio:fim, None]) != 0
+        yield inicio, matriz
+
+
+def contar_lote(motor, tabuleiros, tamanho_bloco=512):
+    """Quantidade de palavras válidas por tabuleiro, para checar cobertura do dicionário"""
+    contagens = np.zeros(len(tabuleiros), dtype=np.int64)
+    for inicio, matriz in _matrizes_do_lote(motor, tabuleiros, tamanho_bloco):
+        contagens[inicio:inicio + len(matriz)] = matriz.sum(axis=1)
+    return contagens
+
+
+def resolver_lote(motor, tabuleiros, tamanho_bloco=512):
+    """Lista de palavras válidas de cada tabuleiro do lote"""
+    resultados = []
+    for _, matriz in _matrizes_do_lote(motor, tabuleiros, tamanho_bloco):
+        resultados.extend(_palavras_ordenadas(motor, np.flatnonzero(linha)) for linha in matriz)
+    return resultados
+
+
+def ler_tabuleiros(caminho_arquivo):
+    """Lê um tabuleiro por linha no formato 'letras central' (ex: 'ratsioc c')"""
+    tabuleiros = []
+    with open(caminho_arquivo, 'r', encoding='utf-8') as f:
+        for linha in f:
+            partes = linha.split()
+            if len(partes) >= 2:
+                tabuleiros.append((partes[0], partes[1]))
+    return tabuleiros
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay vetorizado de tabuleiros históricos.")
+    parser.add_argument("tabuleiros", help="arquivo com um tabuleiro por linha: 'letras central'")
+    parser.add_argument("--dicionario", default="Robo-soletra/Robo/palavras3.txt")
+    args = parser.parse_args()
+
+    with open(args.dicionario, 'r', encoding='utf-8') as f:
+        motor = construir_motor(f)
+    tabuleiros = ler_tabuleiros(args.tabuleiros)
+
+    tempo_inicio = time.time()
+    contagens = contar_lote(motor, tabuleiros)
+    tempo_total = time.time() - tempo_inicio
+
+    for (letras, central), quantidade in zip(tabuleiros, contagens):
+        print(f"{letras.upper()} [{central.upper()}]: {quantidade} palavras")
+    print(f"\n⚡ {len(tabuleiros)} tabuleiros resolvidos em {tempo_total:.2f}s")
@@ -0,0 +1,286 @@
+import hashlib
+import os
+
+
+# --- Núcleo Compartilhado Dos Robôs ---
+#
+# Funções usadas por todos os robôs para normalizar palavras e responder
+# ao tabuleiro. O dicionário é indexado uma única vez, agrupando as palavras
+# pela máscara de 26 bits das letras distintas que usam. Como o tabuleiro
+# tem só 7 letras, existem no máximo 64 subconjuntos que contêm a letra
+# central: a busca consulta esses 64 grupos e nunca percorre o dicionário,
+# então o tempo de resposta não depende do tamanho da lista de palavras.
+
+
+ALFABETO = "abcdefghijklmnopqrstuvwxyz"
+BITS_LETRAS = {letra: 1 << posicao for posicao, letra in enumerate(ALFABETO)}
+TAMANHO_MINIMO = 4
+MAXIMO_LETRAS_DISTINTAS = 7
+
+# Política para o "ç": 'manter' deixa o ç como está (o tabuleiro só tem
+# letras de a-z, então palavras com ç nunca são jogáveis, como sempre foi);
+# 'c' trata ç como c. Ao trocar a política, recompile artefato e catálogo.
+POLITICA_CEDILHA = 'manter'
+
+# Só os diacríticos do português. Marcas de outras línguas (ä, è, ï, ö, û...)
+# ficam na forma normalizada, que então tem caractere fora de a-z: palavras
+# estrangeiras como 'arrière' ou 'Anaïs' não viram candidatas. Ao mudar a
+# tabela, recompile artefato, DAWG e catálogo.
+MAPA_ACENTOS = {
+    'á': 'a', 'à': 'a', 'â': 'a', 'ã': 'a',
+    'é': 'e', 'ê': 'e',
+    'í': 'i',
+    'ó': 'o', 'ô': 'o', 'õ': 'o',
+    'ú': 'u', 'ü': 'u',
+}
+
+
+def compilar_normalizador(politica_cedilha=POLITICA_CEDILHA):
+    """Tabela de str.translate que remove os diacríticos do português"""
+    mapa = dict(MAPA_ACENTOS)
+    if politica_cedilha == 'c':
+        mapa['ç'] = 'c'
+    elif politica_cedilha != 'manter':
+        raise ValueError(f"Política de cedilha desconhecida: '{politica_cedilha}'")
+    return str.maketrans(mapa)
+
+
+TABELA_NORMALIZACAO = compilar_normalizador()
+
+
+def normalizar_palavra(texto, tabela=TABELA_NORMALIZACAO):
+    return texto.lower().translate(tabela)
+
+
+def hash_arquivo(caminho_arquivo):
+    """SHA-256 do conteúdo do arquivo, lido em blocos"""
+    resumo = hashlib.sha256()
+    with open(caminho_arquivo, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def _marca_da_fonte(caminho_fonte):
+    estado = os.stat(caminho_fonte)
+    return f"{estado.st_size} {estado.st_mtime_ns}"
+
+
+def fonte_confere(caminho_fonte, hash_esperado, caminho_compilado):
+    """
+    Diz se o .txt ainda é o que gerou o arquivo compilado sem ler o .txt a
+    cada partida: tamanho e mtime ficam num arquivo '.fonte' ao lado do
+    compilado, junto com o hash. Só quando a marca muda o .txt é hasheado de
+    novo; se o conteúdo for o mesmo (ex: arquivo copiado), a marca é renovada.
+    """
+    caminho_marca = caminho_compilado + ".fonte"
+    marca = _marca_da_fonte(caminho_fonte)
+    try:
+        with open(caminho_marca, 'r', encoding='utf-8') as f:
+            if f.read().split("\n") == [marca, hash_esperado]:
+                return True
+    except OSError:
+        pass
+
+    if hash_arquivo(caminho_fonte) != hash_esperado:
+        return False
+    try:
+        with open(caminho_marca, 'w', encoding='utf-8') as f:
+            f.write(f"{marca}\n{hash_esperado}")
+    except OSError:
+        pass  # Sem permissão de escrita: só não ganha o atalho na próxima partida
+    return True
+
+
+def hash_do_indice(indice, caminho_fonte):
+    """
+    Hash do .txt de origem do índice, para catálogo e cache de soluções:
+    o artefato e o DAWG já trazem o seu; um índice montado do .txt lê o
+    arquivo uma vez. None se não houver nenhum dos dois.
+    """
+    hash_conteudo = getattr(indice, "hash_conteudo", None)
+    if hash_conteudo is None and os.path.exists(caminho_fonte):
+        hash_conteudo = hash_arquivo(caminho_fonte)
+    return hash_conteudo
+
+
+def mascara_letras(texto_normalizado):
+    """Máscara de 26 bits das letras do texto (None se tiver caractere fora de a-z)"""
+    mascara = 0
+    for letra in texto_normalizado:
+        bit = BITS_LETRAS.get(letra)
+        if bit is None:
+            return None
+        mascara |= bit
+    return mascara
+
+
+def letras_da_mascara(mascara):
+    """Letras (em ordem alfabética) presentes na máscara"""
+    return "".join(letra for letra, bit in BITS_LETRAS.items() if mascara & bit)
+
+
+def chave_tabuleiro(letras_disponiveis, letra_central):
+    """Assinatura do tabuleiro: letras externas ordenadas + ':' + central (ex: 'aiorst:c')"""
+    central = normalizar_palavra(letra_central)
+    externas = sorted(set(normalizar_palavra(letras_disponiveis)) - set(central))
+    return f"{''.join(externas)}:{central}"
+
+
+def mascara_tabuleiro(letras):
+    """Máscara das letras do tabuleiro, ignorando o que não for letra de a-z"""
+    mascara = 0
+    for letra in normalizar_palavra(letras):
+        mascara |= BITS_LETRAS.get(letra, 0)
+    return mascara
+
+
+# --- Leitura E Indexação Do Dicionário ---
+#
+# Com numpy instalado, o dicionário é filtrado em blocos pelo indice_numpy,
+# sem laço por palavra. As versões _simples abaixo, palavra a palavra, são a
+# referência desse filtro (os testes comparam as duas) e o caminho usado
+# quando não há numpy, como no robo_soletra simples.
+
+
+def _indice_numpy():
+    """Módulo do filtro vetorizado, ou None se o numpy não estiver instalado"""
+    try:
+        import indice_numpy
+    except ModuleNotFoundError as e:
+        if e.name != "numpy":
+            raise
+        return None
+    return indice_numpy
+
+
+def ler_palavras_jogaveis_simples(linhas):
+    """Referência de ler_palavras_jogaveis, uma palavra por vez"""
+    for linha in linhas:
+        palavra = linha.strip()
+        if len(palavra) < TAMANHO_MINIMO:
+            continue
+
+        palavra_norm = normalizar_palavra(palavra)
+        letras = set(palavra_norm)
+        if len(letras) > MAXIMO_LETRAS_DISTINTAS:
+            continue
+
+        mascara = mascara_letras(letras)
+        if mascara is None:
+            continue
+
+        yield palavra, palavra_norm, mascara
+
+
+def construir_indice_simples(linhas):
+    """Referência de construir_indice, uma palavra por vez"""
+    grupos = {}
+    for palavra, palavra_norm, mascara in ler_palavras_jogaveis_simples(linhas):
+        grupo = grupos.get(mascara)
+        if grupo is None:
+            grupos[mascara] = grupo = {}
+        grupo[palavra] = palavra_norm
+
+    indice = {}
+    for mascara in list(grupos):
+        grupo = grupos.pop(mascara)
+        indice[mascara] = ("\n".join(grupo), "\n".join(grupo.values()))
+    return indice
+
+
+def ler_palavras_jogaveis(linhas):
+    """
+    Gera (palavra, forma normalizada, máscara) só das palavras que podem ser
+    resposta, normalizando e filtrando enquanto o arquivo é lido.
+
+    Ficam de fora: linhas em branco, palavras com menos de 4 letras, entradas
+    com hífen, espaço, ç ou outro caractere fora de a-z e palavras com mais
+    letras distintas do que o tabuleiro oferece.
+    """
+    vetorizado = _indice_numpy()
+    if vetorizado is None:
+        return ler_palavras_jogaveis_simples(linhas)
+    return vetorizado.ler_palavras_jogaveis(linhas)
+
+
+def construir_indice(linhas):
+    """
+    Agrupa as palavras jogáveis por máscara em uma estrutura compacta:
+    {mascara: ("original1\noriginal2...", "normal1\nnormal2...")}.
+
+    Cada grupo guarda duas strings em vez de um objeto str por palavra, o que
+    corta a memória residente do dicionário. Aceita um arquivo aberto ou
+    qualquer iterável de palavras; repetidas ficam uma vez, na ordem do arquivo.
+    """
+    vetorizado = _indice_numpy()
+    if vetorizado is None:
+        return construir_indice_simples(linhas)
+    return vetorizado.construir_indice(linhas)
+
+
+def palavras_do_grupo(grupo):
+    """Lista das palavras originais de um grupo do índice"""
+    return grupo[0].split("\n")
+
+
+def total_palavras(indice):
+    """Quantidade de palavras guardadas no índice"""
+    return sum(grupo[0].count("\n") + 1 for grupo in indice.values())
+
+
+def subconjuntos_do_tabuleiro(letras_disponiveis, letra_central):
+    """Gera as máscaras de todos os subconjuntos de letras que contêm a letra central"""
+    central = mascara_tabuleiro(letra_central)
+    if not central:
+        return
+
+    externas = mascara_tabuleiro(letras_disponiveis) & ~central
+    subconjunto = externas
+    while True:
+        yield subconjunto | central
+        if subconjunto == 0:
+            break
+        subconjunto = (subconjunto - 1) & externas
+
+
+def buscar_palavras(indice, letras_disponiveis, letra_central):
+    """Retorna as palavras ORIGINAIS válidas para o tabuleiro, das menores para as maiores"""
+    # Backends com busca própria (ex: o DAWG de dawg_dicionario) respondem sozinhos
+    busca_propria = getattr(indice, "buscar_palavras", None)
+    if busca_propria is not None:
+        return busca_propria(letras_disponiveis, letra_central)
+
+    palavras_encontradas = []
+    for mascara in subconjuntos_do_tabuleiro(letras_disponiveis, letra_central):
+        grupo = indice.get(mascara)
+        if grupo:
+            palavras_encontradas.extend(palavras_do_grupo(grupo))
+
+    palavras_encontradas.sort(key=len)
+    return palavras_encontradas
+
+
+def colapsar_variantes(palavras, preferencia=None):
+    """
+    Mantém uma única grafia por forma normalizada: o jogo trata "avó", "avô"
+    e "avo" como a mesma resposta, então enviar as três só gasta tempo.
+
+    Args:
+        palavras (list): Candidatas, na ordem em que serão enviadas.
+        preferencia (callable, optional): Peso de cada grafia (ex: frequência no
+            histórico); vence a de maior peso. Sem preferência, vence a primeira
+            da lista, que nos robôs com ML já é a grafia aceita antes.
+
+    Returns:
+        list: Uma grafia por grupo, na posição da primeira variante do grupo.
+    """
+    escolhidas = {}
+    for palavra in palavras:
+        chave = normalizar_palavra(palavra)
+        atual = escolhidas.get(chave)
+        if atual is None:
+            escolhidas[chave] = palavra
+        elif preferencia is not None and preferencia(palavra) > preferencia(atual):
+            escolhidas[chave] = palavra
+    return list(escolhidas.values())
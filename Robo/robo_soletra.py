@@ -1,3 +1,4 @@
+import os
 import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -6,61 +7,34 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from nucleo_soletra import total_palavras, buscar_palavras, colapsar_variantes, hash_do_indice
+from indice_paralelo import construir_indice_paralelo
+from artefato_dicionario import abrir_artefato
+from dawg_dicionario import abrir_dawg
+from catalogo_tabuleiros import consultar_catalogo
 
 # --- O Cérebro Do Robô ---
 
-def normalizar_palavra(texto):
-    texto = texto.lower()
-    # Mapa de substituição apenas para vogais acentuadas
-    mapa_acentos = {
-        'á': 'a', 'à': 'a', 'â': 'a', 'ã': 'a',
-        'é': 'e', 'ê': 'e',
-        'í': 'i',
-        'ó': 'o', 'ô': 'o', 'õ': 'o',
-        'ú': 'u',
-    }
-    
-    # Cria a nova string substituindo apenas os caracteres do mapa
-    texto_normalizado = "".join(mapa_acentos.get(char, char) for char in texto)
-    return texto_normalizado
+CAMINHO_DICIONARIO = os.path.join('Robo-soletra', 'Robo', 'palavras3.txt')
 
-def carregar_dicionario(caminho_arquivo='Robo-soletra\Robo\palavras3.txt'):
+def carregar_dicionario(caminho_arquivo=CAMINHO_DICIONARIO):
     print(f"Carregando o dicionário '{caminho_arquivo}'...")
     try:
-        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-            # Carregamos as palavras originais
-            palavras = {linha.strip() for linha in f}
-            print(f"Dicionário carregado com {len(palavras)} palavras.")
-            return palavras
+        # Normaliza e filtra enquanto lê; listas gigantes são divididas entre os núcleos
+        indice = construir_indice_paralelo(caminho_arquivo)
+        print(f"Dicionário carregado com {total_palavras(indice)} palavras.")
+        return indice
     except FileNotFoundError:
         print(f"ERRO CRÍTICO: O arquivo de dicionário '{caminho_arquivo}' não foi encontrado.")
         return None
 
-def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
+def encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario=None):
     print("Caçando palavras válidas com a lógica correta...")
-    palavras_encontradas = []
-    
-    # Normalizamos as letras do jogo uma única vez para eficiência
-    letra_central_norm = normalizar_palavra(letra_central)
-    letras_disponiveis_norm_set = set(normalizar_palavra(letras_disponiveis))
-
-    for palavra_original in dicionario:
-        if len(palavra_original) < 4:
-            continue
-        
-        # Normalizamos a palavra do dicionário para a verificação
-        palavra_norm = normalizar_palavra(palavra_original)
-        
-        # A letra central (normalizada) deve estar na palavra (normalizada)
-        if letra_central_norm not in palavra_norm:
-            continue
-        
-        # Todas as letras da palavra (normalizada) devem estar no conjunto de letras disponíveis (normalizadas)
-        if set(palavra_norm).issubset(letras_disponiveis_norm_set):
-            # Adicionamos a palavra ORIGINAL à lista para ser digitada corretamente no jogo
-            palavras_encontradas.append(palavra_original)
-            
-    palavras_encontradas.sort(key=len)
+    # Tabuleiro já resolvido no catálogo offline: resposta por consulta direta
+    palavras_encontradas = consultar_catalogo(letras_disponiveis, letra_central, hash_fonte=hash_dicionario)
+    if palavras_encontradas is None:
+        palavras_encontradas = buscar_palavras(indice, letras_disponiveis, letra_central)
+    palavras_encontradas = colapsar_variantes(palavras_encontradas)
     
     print(f"Sucesso! {len(palavras_encontradas)} palavras válidas foram encontradas.")
     return palavras_encontradas
@@ -69,9 +43,17 @@ def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
 # --- Automação Do Jogo  ---
 
 def jogar_soletra():
-    dicionario = carregar_dicionario()
-    if not dicionario:
-        return
+    # O dicionário compilado abre na hora via mmap; o .txt fica como reserva
+    indice = abrir_artefato()
+    if indice is None:
+        # Sem o artefato, o DAWG compilado (se existir) também evita reler o .txt
+        indice = abrir_dawg()
+    if indice is None:
+        indice = carregar_dicionario()
+        if not indice:
+            return
+    # Hash do .txt uma vez só (o artefato/DAWG já o trazem) para catálogo e cache
+    hash_dicionario = hash_do_indice(indice, CAMINHO_DICIONARIO)
 
     print("\nIniciando o navegador...")
     servico = Service(ChromeDriverManager().install())
@@ -108,7 +90,7 @@ def jogar_soletra():
         print(f"Letras disponíveis: {letras_disponiveis.upper()}")
         print(f"Letra obrigatória: {letra_central.upper()}")
         
-        palavras_para_jogar = encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario)
+        palavras_para_jogar = encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario)
         
         # Jogar As Respostas
         if not palavras_para_jogar:
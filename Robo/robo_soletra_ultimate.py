@@ -8,56 +8,35 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from nucleo_soletra import normalizar_palavra, total_palavras, buscar_palavras, colapsar_variantes, hash_do_indice
+from indice_paralelo import construir_indice_paralelo
+from artefato_dicionario import abrir_artefato
+from dawg_dicionario import abrir_dawg
+from catalogo_tabuleiros import consultar_catalogo
 
 
 # --- O Cérebro Turbinado Do Robô ---
 
 
-def normalizar_palavra(texto):
-    texto = texto.lower()
-    mapa_acentos = {
-        'á': 'a', 'à': 'a', 'â': 'a', 'ã': 'a',
-        'é': 'e', 'ê': 'e',
-        'í': 'i',
-        'ó': 'o', 'ô': 'o', 'õ': 'o',
-        'ú': 'u',
-    }
-    texto_normalizado = "".join(mapa_acentos.get(char, char) for char in texto)
-    return texto_normalizado
-
-
 def carregar_dicionario(caminho_arquivo='Robo-soletra/Robo/palavras3.txt'):
     print(f"Carregando o dicionário '{caminho_arquivo}'...")
     try:
-        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-            palavras = {linha.strip() for linha in f}
-            print(f"Dicionário carregado com {len(palavras)} palavras.")
-            return palavras
+        # Normaliza e filtra enquanto lê; listas gigantes são divididas entre os núcleos
+        indice = construir_indice_paralelo(caminho_arquivo)
+        print(f"Dicionário carregado com {total_palavras(indice)} palavras.")
+        return indice
     except FileNotFoundError:
         print(f"ERRO CRÍTICO: O arquivo de dicionário '{caminho_arquivo}' não foi encontrado.")
         return None
 
 
-def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
+def encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario=None):
     print("Caçando palavras válidas com a lógica correta...")
-    palavras_encontradas = []
-    
-    letra_central_norm = normalizar_palavra(letra_central)
-    letras_disponiveis_norm_set = set(normalizar_palavra(letras_disponiveis))
-
-    for palavra_original in dicionario:
-        if len(palavra_original) < 4:
-            continue
-        
-        palavra_norm = normalizar_palavra(palavra_original)
-        
-        if letra_central_norm not in palavra_norm:
-            continue
-        
-        if set(palavra_norm).issubset(letras_disponiveis_norm_set):
-            palavras_encontradas.append(palavra_original)
-            
-    palavras_encontradas.sort(key=len)
+    # Tabuleiro já resolvido no catálogo offline: resposta por consulta direta
+    palavras_encontradas = consultar_catalogo(letras_disponiveis, letra_central, hash_fonte=hash_dicionario)
+    if palavras_encontradas is None:
+        palavras_encontradas = buscar_palavras(indice, letras_disponiveis, letra_central)
+    palavras_encontradas = colapsar_variantes(palavras_encontradas)
     
     print(f"Sucesso! {len(palavras_encontradas)} palavras válidas foram encontradas.")
     return palavras_encontradas
@@ -210,9 +189,17 @@ def enviar_lote_palavras(driver, palavras, descricao=""):
 
 
 def jogar_soletra():
-    dicionario = carregar_dicionario()
-    if not dicionario:
-        return
+    # O dicionário compilado abre na hora via mmap; o .txt fica como reserva
+    indice = abrir_artefato()
+    if indice is None:
+        # Sem o artefato, o DAWG compilado (se existir) também evita reler o .txt
+        indice = abrir_dawg()
+    if indice is None:
+        indice = carregar_dicionario()
+        if not indice:
+            return
+    # Hash do .txt uma vez só (o artefato/DAWG já o trazem) para catálogo e cache
+    hash_dicionario = hash_do_indice(indice, 'Robo-soletra/Robo/palavras3.txt')
 
     print("\nIniciando o navegador turbinado...")
     navegador = configurar_navegador_otimizado()
@@ -262,7 +249,7 @@ def jogar_soletra():
         print(f"Letras disponíveis: {letras_disponiveis.upper()}")
         print(f"Letra obrigatória: {letra_central.upper()}")
         
-        todas_palavras = encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario)
+        todas_palavras = encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario)
         
         if not todas_palavras:
             print("\nNenhuma palavra foi encontrada no dicionário.")
@@ -276,6 +263,9 @@ def jogar_soletra():
         # Ativar o jogo
         ativar_jogo_clicando_letra_central(navegador)
         
+        # Forma normalizada de cada candidata calculada uma única vez para todas as tentativas
+        forma_normalizada = {p: normalizar_palavra(p) for p in todas_palavras}
+        
         # Sistema de tentativas com retry inteligente
         max_tentativas = 5
         tentativa = 1
@@ -336,7 +326,7 @@ def jogar_soletra():
                 # Filtrar palavras que ainda faltam
                 palavras_para_enviar = [
                     p for p in todas_palavras 
-                    if normalizar_palavra(p) not in palavras_acertadas_norm and
+                    if forma_normalizada[p] not in palavras_acertadas_norm and
                     len(p) in faltantes_por_tamanho
                 ]
                 
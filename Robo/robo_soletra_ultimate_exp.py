@@ -1,6 +1,5 @@
 import time
-import pandas as pd
-import os
+import sqlite3
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -10,60 +9,44 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from nucleo_soletra import normalizar_palavra, total_palavras, buscar_palavras, colapsar_variantes, hash_do_indice
+from indice_paralelo import construir_indice_paralelo
+from artefato_dicionario import abrir_artefato
+from dawg_dicionario import abrir_dawg
+from catalogo_tabuleiros import consultar_catalogo
+from cache_solucoes import ler_cache_solucao, salvar_cache_solucao
+from lexico_global import registrar_resultados, carregar_rejeitadas, podar_rejeitadas
+from historico_ml import (
+    registrar_historico, HistoricoEmMemoria, assinatura_tabuleiro, ordem_de_replay,
+    salvar_partida_resolvida, ler_partida_resolvida,
+)
 
 
 # --- CONFIGURAÇÕES ---
-HISTORICO_FILE = "historico_soletra.csv"
+HISTORICO_FILE = "historico_soletra.db"
 
 
 # --- O Cérebro Turbinado Com Machine Learning ---
 
 
-def normalizar_palavra(texto):
-    texto = texto.lower()
-    mapa_acentos = {
-        'á': 'a', 'à': 'a', 'â': 'a', 'ã': 'a',
-        'é': 'e', 'ê': 'e',
-        'í': 'i',
-        'ó': 'o', 'ô': 'o', 'õ': 'o',
-        'ú': 'u',
-    }
-    texto_normalizado = "".join(mapa_acentos.get(char, char) for char in texto)
-    return texto_normalizado
-
-
 def carregar_dicionario(caminho_arquivo='Robo-soletra/Robo/palavras3.txt'):
     print(f"|| Carregando o dicionário ||'{caminho_arquivo}'...")
     try:
-        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-            palavras = {linha.strip() for linha in f}
-            print(f"✓ Dicionário carregado com {len(palavras)} palavras.")
-            return palavras
+        # Normaliza e filtra enquanto lê; listas gigantes são divididas entre os núcleos
+        indice = construir_indice_paralelo(caminho_arquivo)
+        print(f"✓ Dicionário carregado com {total_palavras(indice)} palavras.")
+        return indice
     except FileNotFoundError:
         print(f"ERRO: O arquivo de dicionário '{caminho_arquivo}' não foi encontrado.")
         return None
 
 
-def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
+def encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario=None):
     print("🔍 Caçando palavras válidas...")
-    palavras_encontradas = []
-    
-    letra_central_norm = normalizar_palavra(letra_central)
-    letras_disponiveis_norm_set = set(normalizar_palavra(letras_disponiveis))
-
-    for palavra_original in dicionario:
-        if len(palavra_original) < 4:
-            continue
-        
-        palavra_norm = normalizar_palavra(palavra_original)
-        
-        if letra_central_norm not in palavra_norm:
-            continue
-        
-        if set(palavra_norm).issubset(letras_disponiveis_norm_set):
-            palavras_encontradas.append(palavra_original)
-            
-    palavras_encontradas.sort(key=len)
+    # Tabuleiro já resolvido no catálogo offline: resposta por consulta direta
+    palavras_encontradas = consultar_catalogo(letras_disponiveis, letra_central, hash_fonte=hash_dicionario)
+    if palavras_encontradas is None:
+        palavras_encontradas = buscar_palavras(indice, letras_disponiveis, letra_central)
     
     print(f"✓ {len(palavras_encontradas)} palavras válidas encontradas.")
     return palavras_encontradas
@@ -72,98 +55,48 @@ def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
 # --- MACHINE LEARNING: HISTÓRICO E PRIORIZAÇÃO ---
 
 
-def carregar_historico():
-    #Carrega histórico de palavras que funcionaram antes
-    if os.path.exists(HISTORICO_FILE):
-        try:
-            df = pd.read_csv(HISTORICO_FILE)
-            print(f"📊 Histórico ML carregado: {len(df)} registros")
-            return df
-        except Exception as e:
-            print(f"⚠️ Erro ao carregar histórico: {e}. Criando novo...")
-            return pd.DataFrame(columns=["palavra", "foi_aceita", "tamanho", "frequencia"])
+def _score_historico(foi_aceita, frequencia):
+    # Score: foi_aceita (peso 100) + frequencia (peso 10)
+    # Isso garante que palavras aceitas antes vêm primeiro
+    return (foi_aceita * 100) + (frequencia * 10)
+
+
+def _score_palavra_nova(palavra):
+    # Palavras novas recebem score baseado no tamanho (favorece palavras menores)
+    return 50 - len(palavra)
+
+
+def carregar_historico(tabuleiro):
+    #Carrega a partição do tabuleiro uma vez por execução, já como palavra -> score
+    try:
+        historico = HistoricoEmMemoria(_score_historico, HISTORICO_FILE, tabuleiro=tabuleiro)
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao carregar histórico: {e}. Criando novo...")
+        historico = HistoricoEmMemoria(_score_historico, caminho_arquivo=None)
+    if len(historico):
+        print(f"📊 Histórico ML carregado: {len(historico)} registros")
     else:
         print("📊 Nenhum histórico encontrado. Criando novo arquivo...")
-        return pd.DataFrame(columns=["palavra", "foi_aceita", "tamanho", "frequencia"])
+    return historico
 
 
-def atualizar_historico(palavras_aceitas, palavras_rejeitadas):
-    #Atualiza o histórico com novos resultados (Machine Learning)
-    historico = carregar_historico()
-    
-    # Adicionar palavras aceitas
-    for palavra in palavras_aceitas:
-        if palavra in historico['palavra'].values:
-            # Incrementa frequência
-            idx = historico[historico['palavra'] == palavra].index[0]
-            historico.at[idx, 'frequencia'] = historico.at[idx, 'frequencia'] + 1
-            historico.at[idx, 'foi_aceita'] = 1
-        else:
-            # Nova entrada
-            novo_registro = pd.DataFrame([{
-                "palavra": palavra, 
-                "foi_aceita": 1,
-                "tamanho": len(palavra),
-                "frequencia": 1
-            }])
-            historico = pd.concat([historico, novo_registro], ignore_index=True)
-    
-    # Adicionar palavras rejeitadas (para evitar tentar novamente)
-    for palavra in palavras_rejeitadas:
-        if palavra not in historico['palavra'].values:
-            novo_registro = pd.DataFrame([{
-                "palavra": palavra, 
-                "foi_aceita": 0,
-                "tamanho": len(palavra),
-                "frequencia": 0
-            }])
-            historico = pd.concat([historico, novo_registro], ignore_index=True)
-    
-    # Salvar histórico
-    historico.to_csv(HISTORICO_FILE, index=False)
+def atualizar_historico(palavras_aceitas, palavras_rejeitadas, tabuleiro):
+    #Atualiza o histórico do tabuleiro com novos resultados (Machine Learning), numa transação só
+    registrar_historico(palavras_aceitas, palavras_rejeitadas, HISTORICO_FILE, tabuleiro)
     print(f"💾 Histórico ML salvo: {len(palavras_aceitas)} aceitas, {len(palavras_rejeitadas)} rejeitadas")
     print(f"   📁 Arquivo: {HISTORICO_FILE}")
 
 
-def priorizar_palavras_ml(palavras):
+def priorizar_palavras_ml(palavras, historico):
     """Usa Machine Learning para priorizar palavras com maior probabilidade de sucesso"""
-    historico = carregar_historico()
-    
-    if historico.empty:
+    if not len(historico):
         print("🤖 ML: Sem dados históricos. Usando ordem padrão (por tamanho).")
         return palavras
     
-    # Criar dicionário de scores para acesso rápido
-    score_dict = {}
-    palavras_conhecidas = 0
-    
-    for _, row in historico.iterrows():
-        palavra = row['palavra']
-        # Score: foi_aceita (peso 100) + frequencia (peso 10)
-        # Isso garante que palavras aceitas antes vêm primeiro
-        score = (row['foi_aceita'] * 100) + (row['frequencia'] * 10)
-        score_dict[palavra] = score
-        if row['foi_aceita'] == 1:
-            palavras_conhecidas += 1
-    
-    print(f"🤖 ML: {palavras_conhecidas} palavras aceitas anteriormente no histórico")
-    
-    # Atribuir scores a todas as palavras
-    palavras_com_score = []
-    
-    for palavra in palavras:
-        if palavra in score_dict:
-            score = score_dict[palavra]
-        else:
-            # Palavras novas recebem score baseado no tamanho (favorece palavras menores)
-            score = 50 - len(palavra)
-        
-        palavras_com_score.append((palavra, score))
+    print(f"🤖 ML: {historico.aceitas} palavras aceitas anteriormente no histórico")
     
     # Ordenar por score (MAIOR primeiro) e depois por tamanho (MENOR primeiro)
-    palavras_com_score.sort(key=lambda x: (-x[1], len(x[0])))
-    
-    palavras_priorizadas = [p[0] for p in palavras_com_score]
+    palavras_priorizadas = historico.ordenar(palavras, _score_palavra_nova)
     
     # Mostrar top 10 palavras priorizadas para debug
     top_10 = palavras_priorizadas[:10]
@@ -287,7 +220,10 @@ def enviar_palavra_ultra_rapido(driver, palavra):
 
 
 def enviar_lote_palavras_ultra_rapido(driver, palavras, descricao=""):
-    """Envia palavras em velocidade máxima com verificação periódica"""
+    """
+    Envia palavras em velocidade máxima com verificação periódica; retorna
+    (aceitas, rejeitadas, tempo, completou, palavras enviadas)
+    """
     print(f"\n{'='*60}")
     print(f"📝 {descricao}")
     print(f"🎯 Enviando {len(palavras)} palavras em velocidade máxima...")
@@ -331,7 +267,7 @@ def enviar_lote_palavras_ultra_rapido(driver, palavras, descricao=""):
                 print(f"⏱️  Tempo: {tempo_decorrido:.2f} segundos")
                 print(f"{'🎉'*30}\n")
                 
-                return palavras_aceitas, palavras_rejeitadas, tempo_decorrido, True
+                return palavras_aceitas, palavras_rejeitadas, tempo_decorrido, True, palavras[:i + 1]
             
             if (i + 1) % 100 == 0:
                 tempo_decorrido = time.time() - tempo_inicio
@@ -342,14 +278,22 @@ def enviar_lote_palavras_ultra_rapido(driver, palavras, descricao=""):
     time.sleep(0.5)
     tempo_total = time.time() - tempo_inicio
     
-    return palavras_aceitas, palavras_rejeitadas, tempo_total, False
+    return palavras_aceitas, palavras_rejeitadas, tempo_total, False, palavras
 
 
 def jogar_soletra_ml(headless=False):
     """Versão definitiva com Machine Learning otimizado"""
-    dicionario = carregar_dicionario()
-    if not dicionario:
-        return
+    # O dicionário compilado abre na hora via mmap; o .txt fica como reserva
+    indice = abrir_artefato()
+    if indice is None:
+        # Sem o artefato, o DAWG compilado (se existir) também evita reler o .txt
+        indice = abrir_dawg()
+    if indice is None:
+        indice = carregar_dicionario()
+        if not indice:
+            return
+    # Hash do .txt uma vez só (o artefato/DAWG já o trazem) para catálogo e cache
+    hash_dicionario = hash_do_indice(indice, 'Robo-soletra/Robo/palavras3.txt')
 
     print("\n" + "="*60)
     print("🤖 ROBÔ SOLETRA ULTIMATE - VELOCIDADE MÁXIMA + ML")
@@ -395,14 +339,36 @@ def jogar_soletra_ml(headless=False):
         print(f"✓ Letras disponíveis: {letras_disponiveis.upper()}")
         print(f"✓ Letra obrigatória: {letra_central.upper()}")
         
-        todas_palavras = encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario)
+        # Partição do histórico deste tabuleiro de hoje, lida uma vez
+        tabuleiro = assinatura_tabuleiro(letras_disponiveis, letra_central)
+        historico = carregar_historico(tabuleiro)
         
-        if not todas_palavras:
-            print("\n❌ Nenhuma palavra foi encontrada.")
-            return
+        # Tabuleiro já completado: reenvia só as palavras aceitas, na ordem salva
+        palavras_replay = ler_partida_resolvida(tabuleiro, HISTORICO_FILE)
+        if palavras_replay is not None:
+            print(f"⚡ MODO REPLAY: tabuleiro já completado, {len(palavras_replay)} palavras aceitas salvas")
+            todas_palavras = palavras_priorizadas = palavras_replay
+        else:
+            # Tabuleiro já resolvido antes (ex: robô reiniciado no mesmo dia): lista direto do cache
+            palavras_priorizadas = ler_cache_solucao(letras_disponiveis, letra_central, hash_dicionario=hash_dicionario)
+            if palavras_priorizadas is not None:
+                todas_palavras = palavras_priorizadas
+            else:
+                todas_palavras = encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario)
+        
+                if not todas_palavras:
+                    print("\n❌ Nenhuma palavra foi encontrada.")
+                    return
         
-        # MACHINE LEARNING: Priorizar palavras (CORRIGIDO)
-        palavras_priorizadas = priorizar_palavras_ml(todas_palavras)
+                # MACHINE LEARNING: Priorizar palavras (CORRIGIDO)
+                # Uma grafia por forma normalizada; fica a mais bem priorizada pelo histórico
+                palavras_priorizadas = colapsar_variantes(priorizar_palavras_ml(todas_palavras, historico))
+                salvar_cache_solucao(letras_disponiveis, letra_central, palavras_priorizadas, hash_dicionario=hash_dicionario)
+        
+            # Formas que o jogo já recusou em outros dias não são enviadas de novo
+            rejeitadas = carregar_rejeitadas()
+            palavras_priorizadas = podar_rejeitadas(palavras_priorizadas, rejeitadas)
+            todas_palavras = podar_rejeitadas(todas_palavras, rejeitadas, avisar=False)
         
         print(f"\n{'='*60}")
         print(f"🚀 MODO TURBO MÁXIMO COM ML!")
@@ -412,11 +378,15 @@ def jogar_soletra_ml(headless=False):
         
         ativar_jogo_clicando_letra_central(navegador)
         
+        # Forma normalizada de cada candidata calculada uma única vez para todas as tentativas
+        forma_normalizada = {p: normalizar_palavra(p) for p in todas_palavras}
+        
         max_tentativas = 5
         tentativa = 1
         palavras_para_enviar = palavras_priorizadas.copy()
         todas_aceitas = []
         todas_rejeitadas = []
+        palavras_enviadas = {}  # em ordem de envio, sem repetir entre tentativas
         completou = False
         
         tempo_total_inicio = time.time()
@@ -426,14 +396,16 @@ def jogar_soletra_ml(headless=False):
             print(f"🔄 TENTATIVA {tentativa}/{max_tentativas}")
             print(f"{'#'*60}")
             
-            aceitas, rejeitadas, tempo, completou_agora = enviar_lote_palavras_ultra_rapido(
+            aceitas, rejeitadas, tempo, completou_agora, enviadas = enviar_lote_palavras_ultra_rapido(
                 navegador, 
                 palavras_para_enviar,
                 f"Tentativa {tentativa} - {len(palavras_para_enviar)} palavras"
             )
             
+            palavras_enviadas.update(dict.fromkeys(enviadas))
             todas_aceitas.extend(aceitas)
             todas_rejeitadas.extend(rejeitadas)
+            historico.registrar(aceitas, rejeitadas)
             completou = completou_agora
             
             time.sleep(0.5)
@@ -475,11 +447,11 @@ def jogar_soletra_ml(headless=False):
                 
                 palavras_para_enviar = [
                     p for p in todas_palavras 
-                    if normalizar_palavra(p) not in palavras_acertadas_norm and
+                    if forma_normalizada[p] not in palavras_acertadas_norm and
                     len(p) in faltantes_por_tamanho
                 ]
                 
-                palavras_para_enviar = priorizar_palavras_ml(palavras_para_enviar)
+                palavras_para_enviar = colapsar_variantes(priorizar_palavras_ml(palavras_para_enviar, historico))
                 
                 print(f"   ✓ {len(palavras_para_enviar)} palavras filtradas para retry")
                 
@@ -497,8 +469,22 @@ def jogar_soletra_ml(headless=False):
                 break
         
         print("\n💾 Atualizando histórico com Machine Learning...")
-        atualizar_historico(todas_aceitas, todas_rejeitadas)
+        atualizar_historico(todas_aceitas, todas_rejeitadas, tabuleiro)
         print("✓ Histórico ML atualizado! O robô ficará mais inteligente na próxima execução.")
+        
+        # A lista de acertos do jogo é mais confiável que o placar lido a cada envio; com o
+        # tabuleiro completo ela é a resposta inteira e toda palavra enviada fora dela vira
+        # recusa confirmada. Sem isso, só as aceitas entram no léxico
+        completou_tabuleiro = total > 0 and acertos >= total and len(palavras_acertadas) >= total
+        registrar_resultados(
+            palavras_acertadas or todas_aceitas,
+            list(palavras_enviadas),
+            definitivo=completou_tabuleiro,
+        )
+        if completou_tabuleiro:
+            salvar_partida_resolvida(
+                tabuleiro, ordem_de_replay(palavras_enviadas, palavras_acertadas), HISTORICO_FILE,
+            )
 
     except Exception as e:
         print(f"\n❌ Erro inesperado: {e}")
@@ -0,0 +1,42 @@
+import historico_ml
+
+
+# --- Upsert Do Histórico E Leitura Da Partição ---
+
+
+def _pontuar(foi_aceita, frequencia):
+    return foi_aceita * 100 + frequencia
+
+
+def test_upsert_e_leitura_da_particao(tmp_path, monkeypatch):
+    # Sem historico_soletra.csv no diretório atual, nada é importado do CSV antigo
+    monkeypatch.chdir(tmp_path)
+    caminho = str(tmp_path / "historico.db")
+    tabuleiro = "2024-05-01|aiorst:c"
+
+    historico_ml.registrar_historico(["casa", "cais"], ["sapo"], caminho, tabuleiro)
+    # Aceita de novo soma frequência; rejeitada já presente não é sobrescrita; recusa depois de aceita não apaga
+    historico_ml.registrar_historico(["casa", "sapo"], ["cais", "rato"], caminho, tabuleiro)
+    historico_ml.registrar_historico(["casa"], [], caminho, "outro")
+
+    esperado = {"casa": (1, 2), "cais": (1, 1), "sapo": (1, 1), "rato": (0, 0)}
+    assert historico_ml.carregar_registros(caminho, tabuleiro) == esperado
+    assert historico_ml.tamanho_historico(caminho, tabuleiro) == (4, 3)
+    assert historico_ml.carregar_registros(caminho, "outro") == {"casa": (1, 1)}
+
+
+def test_registro_em_memoria_segue_o_upsert(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    caminho = str(tmp_path / "historico.db")
+    historico_ml.registrar_historico(["casa"], ["sapo"], caminho)
+
+    historico = historico_ml.HistoricoEmMemoria(_pontuar, caminho)
+    lotes = [(["casa", "sapo"], ["rato"]), (["rato"], ["casa", "tatu"])]
+    for aceitas, rejeitadas in lotes:
+        historico.registrar(aceitas, rejeitadas)
+        historico_ml.registrar_historico(aceitas, rejeitadas, caminho)
+
+    relido = historico_ml.HistoricoEmMemoria(_pontuar, caminho)
+    assert relido.scores == historico.scores
+    assert relido.aceitas == historico.aceitas == 3
+    assert historico.ordenar(["tatu", "rato", "casa", "gato"], lambda p: 50) == ["casa", "rato", "gato", "tatu"]
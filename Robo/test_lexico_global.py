@@ -0,0 +1,50 @@
+import sqlite3
+import time
+
+import lexico_global
+
+
+# --- Recusas Do Léxico Global ---
+
+
+def test_recusa_sem_tabuleiro_completo_nao_poda(tmp_path):
+    caminho = str(tmp_path / "lexico.db")
+    for _ in range(3):
+        lexico_global.registrar_resultados(["casa"], ["sapo", "rato"], caminho_arquivo=caminho)
+    assert lexico_global.carregar_rejeitadas(caminho) == set()
+
+
+def test_recusa_confirmada_poda_e_aceitacao_desfaz(tmp_path):
+    caminho = str(tmp_path / "lexico.db")
+    lexico_global.registrar_resultados(["casa"], ["Casa", "sapo", "Rato"], definitivo=True, caminho_arquivo=caminho)
+    assert lexico_global.carregar_rejeitadas(caminho) == {"sapo", "rato"}
+
+    lexico_global.registrar_resultados(["rato"], [], caminho_arquivo=caminho)
+    assert lexico_global.carregar_rejeitadas(caminho) == {"sapo"}
+    assert lexico_global.podar_rejeitadas(["Sapo", "rato", "casa"], {"sapo"}, avisar=False) == ["rato", "casa"]
+
+
+def test_recusa_vence(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "lexico.db")
+    lexico_global.registrar_resultados([], ["sapo"], definitivo=True, caminho_arquivo=caminho)
+    agora = time.time()
+    monkeypatch.setattr(lexico_global.time, "time", lambda: agora + lexico_global.VALIDADE_RECUSA + 1)
+    assert lexico_global.carregar_rejeitadas(caminho) == set()
+
+
+def test_lexico_antigo_nao_poda_pelas_recusas_do_placar(tmp_path):
+    caminho = str(tmp_path / "lexico.db")
+    conexao = sqlite3.connect(caminho)
+    conexao.execute("""
+        CREATE TABLE lexico (
+            forma TEXT PRIMARY KEY, aceitas INTEGER NOT NULL DEFAULT 0,
+            rejeicoes INTEGER NOT NULL DEFAULT 0, ultimo_resultado REAL NOT NULL
+        ) WITHOUT ROWID
+    """)
+    conexao.execute("INSERT INTO lexico VALUES ('sapo', 0, 5, ?)", (time.time(),))
+    conexao.commit()
+    conexao.close()
+
+    assert lexico_global.carregar_rejeitadas(caminho) == set()
+    lexico_global.registrar_resultados([], ["sapo"], definitivo=True, caminho_arquivo=caminho)
+    assert lexico_global.carregar_rejeitadas(caminho) == {"sapo"}
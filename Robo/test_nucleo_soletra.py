@@ -0,0 +1,106 @@
+import io
+import os
+import sys
+
+import pytest
+
+import nucleo_soletra
+
+
+# --- Filtro Vetorizado Contra A Referência Palavra A Palavra ---
+#
+# construir_indice e ler_palavras_jogaveis usam o indice_numpy quando há
+# numpy; o resultado tem que ser o mesmo das versões _simples.
+
+
+indice_numpy = pytest.importorskip("indice_numpy")
+
+CASOS = {
+    "vazio": [],
+    "linha_vazia": [""],
+    "so_injogaveis": ["ab", "a-b-c-d", "abcdefghij", "   "],
+    "bloco_injogavel_antes_de_jogavel": ["abcdefghij"] * 30000 + ["casa"],
+    "repetidas_e_acentos": ["casa", "Casa", "avó", "avô", "avo", "casa", "ação", "pé-de-moleque", "avó", "arrière", "Anaïs"],
+    # 'ẞ', o sinal de Kelvin e o de Ångström só caem em latin-1 depois do lower()
+    "fora_de_latin1": ["casaẞ", "casa", "Kaka", "Åsar", "İlha", "日本語", "sapo"],
+    "espacos_nas_bordas": [" casa", "sapo\t", "　rato　", "\x1cgato"],
+    "crlf": ["casa\r\n", " sapo \r\n", "rato\r", "\r\n"],
+}
+
+
+def _comparar(linhas):
+    assert indice_numpy.construir_indice(linhas) == nucleo_soletra.construir_indice_simples(linhas)
+    assert list(indice_numpy.ler_palavras_jogaveis(linhas)) == list(nucleo_soletra.ler_palavras_jogaveis_simples(linhas))
+
+
+@pytest.mark.parametrize("nome", sorted(CASOS))
+def test_vetorizado_igual_a_referencia(nome):
+    _comparar(CASOS[nome])
+
+
+def test_marcas_de_outras_linguas_nao_viram_candidatas():
+    indice = nucleo_soletra.construir_indice(["DRÂÄ", "BÈÍÚ", "Anaïs", "arrière", "avós", "pães", "Pinguïm", "sagüi"])
+    assert sorted(p for grupo in indice.values() for p in nucleo_soletra.palavras_do_grupo(grupo)) == ["avós", "pães", "sagüi"]
+    assert nucleo_soletra.normalizar_palavra("Ãmbar Ü") == "ambar u"
+
+
+def test_bloco_sem_jogaveis_nao_quebra():
+    assert nucleo_soletra.construir_indice(["ab"]) == {}
+    assert list(nucleo_soletra.ler_palavras_jogaveis(["ab"])) == []
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 5, 8, 64])
+def test_quebras_de_bloco(monkeypatch, tamanho_bloco):
+    monkeypatch.setattr(indice_numpy, "TAMANHO_BLOCO", tamanho_bloco)
+    monkeypatch.setattr(indice_numpy, "LINHAS_POR_BLOCO", 3)
+    linhas = ["casa", "ab", "sapo", "Casa", "ação", "abcdefghij", "rato", "sapo", "avó", "x", "tatu"]
+    texto = "\n".join(linhas)
+
+    referencia = nucleo_soletra.construir_indice_simples(linhas)
+    assert indice_numpy.construir_indice(linhas) == referencia
+    assert indice_numpy.construir_indice(io.StringIO(texto)) == referencia
+    assert indice_numpy.construir_indice(io.StringIO(texto + "\n")) == referencia
+    assert list(indice_numpy.ler_palavras_jogaveis(io.StringIO(texto))) == list(
+        nucleo_soletra.ler_palavras_jogaveis_simples(linhas)
+    )
+
+
+def test_arquivo_crlf(monkeypatch):
+    monkeypatch.setattr(indice_numpy, "TAMANHO_BLOCO", 6)
+    texto = "casa\r\nsapo\r\n\r\nab\r\nrato"
+    # newline='' deixa o \r nas linhas, como num arquivo aberto sem tradução
+    assert indice_numpy.construir_indice(io.StringIO(texto, newline="")) == nucleo_soletra.construir_indice_simples(
+        texto.split("\n")
+    )
+
+
+def test_sem_numpy_usa_a_referencia(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.delitem(sys.modules, "indice_numpy")
+    linhas = CASOS["repetidas_e_acentos"]
+    assert nucleo_soletra._indice_numpy() is None
+    assert nucleo_soletra.construir_indice(linhas) == nucleo_soletra.construir_indice_simples(linhas)
+
+
+# --- Conferência Do .txt Pela Marca De Tamanho E mtime ---
+
+
+def test_fonte_confere_so_hasheia_quando_a_marca_muda(tmp_path, monkeypatch):
+    fonte = tmp_path / "palavras.txt"
+    fonte.write_text("casa\nsapo\n", encoding="utf-8")
+    compilado = str(tmp_path / "palavras.bin")
+    hash_original = nucleo_soletra.hash_arquivo(fonte)
+
+    chamadas = []
+    hash_arquivo = nucleo_soletra.hash_arquivo
+    monkeypatch.setattr(nucleo_soletra, "hash_arquivo", lambda caminho: chamadas.append(caminho) or hash_arquivo(caminho))
+
+    assert nucleo_soletra.fonte_confere(str(fonte), hash_original, compilado)
+    assert nucleo_soletra.fonte_confere(str(fonte), hash_original, compilado)
+    assert len(chamadas) == 1
+
+    fonte.write_text("casa\nrato\n", encoding="utf-8")
+    estado = os.stat(fonte)
+    os.utime(fonte, ns=(estado.st_atime_ns, estado.st_mtime_ns + 10**9))
+    assert not nucleo_soletra.fonte_confere(str(fonte), hash_original, compilado)
+    assert len(chamadas) == 2
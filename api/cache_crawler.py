@@ -0,0 +1,87 @@
+import sqlite3
+import zlib
+
+
+# --- Cache De Respostas E Diário Do Crawler ---
+#
+# respostas: a última resposta de cada prefixo, com o ETag/Last-Modified que
+# o servidor mandou; na próxima execução a requisição vira condicional e um
+# 304 reaproveita as palavras guardadas.
+# diario: os prefixos da execução em andamento e se já foram concluídos. Se o
+# crawler morrer no meio, a próxima execução recomeça só do que ficou
+# pendente; o diário é apagado quando uma execução termina sem pendências.
+
+
+CACHE_FILE = "cache_crawler.db"
+
+
+def conectar(caminho_arquivo=CACHE_FILE):
+    conexao = sqlite3.connect(caminho_arquivo)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS respostas (
+            prefixo TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            palavras BLOB NOT NULL,
+            completa INTEGER NOT NULL
+        )
+    """)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS diario (
+            prefixo TEXT PRIMARY KEY,
+            concluido INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    return conexao
+
+
+def ler_resposta(conexao, prefixo):
+    """(palavras, completa, etag, last_modified) guardados para o prefixo, ou None"""
+    linha = conexao.execute(
+        "SELECT palavras, completa, etag, last_modified FROM respostas WHERE prefixo = ?", (prefixo,),
+    ).fetchone()
+    if linha is None:
+        return None
+    texto = zlib.decompress(linha[0]).decode("utf-8")
+    return (texto.split("\n") if texto else []), bool(linha[1]), linha[2], linha[3]
+
+
+def salvar_resposta(conexao, prefixo, palavras, completa, etag, last_modified):
+    with conexao:
+        conexao.execute(
+            "INSERT OR REPLACE INTO respostas VALUES (?, ?, ?, ?, ?)",
+            (prefixo, etag, last_modified, zlib.compress("\n".join(palavras).encode("utf-8")), int(completa)),
+        )
+
+
+def iniciar_diario(conexao, prefixos):
+    """
+    Abre o diário da execução. Se houver uma execução interrompida, devolve
+    (pendentes, concluidos) dela; senão registra `prefixos` como pendentes.
+    """
+    linhas = conexao.execute("SELECT prefixo, concluido FROM diario ORDER BY prefixo").fetchall()
+    if linhas:
+        pendentes = [prefixo for prefixo, concluido in linhas if not concluido]
+        concluidos = [prefixo for prefixo, concluido in linhas if concluido]
+        return pendentes, concluidos
+
+    prefixos = list(prefixos)
+    with conexao:
+        conexao.executemany("INSERT INTO diario (prefixo) VALUES (?)", [(p,) for p in prefixos])
+    return prefixos, []
+
+
+def concluir_prefixo(conexao, prefixo, sub_prefixos=()):
+    """Marca o prefixo como concluído e registra, na mesma transação, os sub-prefixos que ele gerou"""
+    with conexao:
+        conexao.executemany("INSERT OR IGNORE INTO diario (prefixo) VALUES (?)", [(p,) for p in sub_prefixos])
+        conexao.execute("UPDATE diario SET concluido = 1 WHERE prefixo = ?", (prefixo,))
+
+
+def encerrar_diario(conexao):
+    """Apaga o diário se não sobrou nada pendente; devolve quantos prefixos ficaram pendentes"""
+    pendentes = conexao.execute("SELECT COUNT(*) FROM diario WHERE concluido = 0").fetchone()[0]
+    if pendentes == 0:
+        with conexao:
+            conexao.execute("DELETE FROM diario")
+    return pendentes
@@ -1,7 +1,16 @@
+import argparse
+import asyncio
+import codecs
+import json
+import random
 import requests
 import string
 import time  # Importa a biblioteca de tempo
 
+import aiohttp  # Cliente HTTP assíncrono usado pelo crawler concorrente
+
+import cache_crawler
+
 # Import para desabilitar os avisos de segurança ao ignorar a verificação SSL
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
@@ -71,5 +80,321 @@ def create_word_list_file(filename="palavras5.txt"):
     else:
         print("\nNão foi possível obter nenhuma palavra da API.")
 
+# --- Crawler Assíncrono Com Sessão Compartilhada ---
+#
+# Em vez de 26 requisições em fila, cada uma com conexão nova e um sleep fixo,
+# os prefixos vão para uma fila consumida por vários workers que dividem uma
+# única sessão HTTP (conexões reaproveitadas). O ritmo é controlado por um
+# token bucket, falhas temporárias são repetidas com backoff exponencial e as
+# palavras vão para o arquivo assim que cada resposta chega.
+
+
+BASE_URL = "http://dicionario-aberto.net"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Limitador de taxa: libera até `rate` requisições por segundo, com rajadas
+    de no máximo `capacity` requisições.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# Letras que podem aparecer depois de um prefixo ao dividi-lo em sub-prefixos
+SHARD_ALPHABET = string.ascii_lowercase + "áàâãäçéèêëíìîïñóòôõöúùûü-'"
+
+
+class TruncatedResponse(ValueError):
+    """A resposta terminou antes de fechar a lista JSON (payload cortado)."""
+
+
+async def iter_json_array(response, chunk_size=64 * 1024):
+    """
+    Parser JSON em streaming para respostas no formato [obj, obj, ...]: gera
+    cada objeto assim que ele chega, sem guardar o corpo inteiro em memória.
+    Lança TruncatedResponse se o corpo acabar antes do ']'.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    started = False
+
+    async for chunk in response.content.iter_chunked(chunk_size):
+        buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buffer):
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("a resposta não é uma lista JSON")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Objeto incompleto: espera o próximo pedaço
+            yield item
+
+    raise TruncatedResponse("a lista JSON terminou antes do ']'")
+
+
+async def fetch_words(session, prefix, limiter, base_url=BASE_URL, retries=4, backoff=0.5, max_items=1000,
+                      cached=None):
+    """
+    Busca as palavras de um prefixo, repetindo falhas temporárias com backoff.
+    A resposta é lida em streaming e abandonada ao passar de `max_items`
+    palavras, sinal de que o prefixo é grande demais e deve ser dividido.
+    Com uma resposta em cache, a requisição é condicional (ETag/Last-Modified)
+    e um 304 devolve as palavras guardadas.
+
+    Args:
+        session (aiohttp.ClientSession): Sessão compartilhada entre os workers.
+        prefix (str): Prefixo a ser pesquisado.
+        limiter (TokenBucket): Limitador de taxa comum a todas as requisições.
+        base_url (str, optional): Endereço da API (ou de um servidor local de testes).
+        retries (int, optional): Quantas vezes repetir antes de desistir.
+        backoff (float, optional): Espera inicial entre tentativas, dobrada a cada falha.
+        max_items (int, optional): Tamanho a partir do qual a resposta é considerada
+            incompleta. Deve ser menor ou igual ao limite de resultados do servidor.
+        cached (tuple, optional): (palavras, completa, etag, last_modified) de cache_crawler.
+
+    Returns:
+        tuple: (palavras, completa, validadores). `completa` é False quando a
+               resposta foi cortada ou passou de `max_items`; as palavras lidas
+               até ali são mantidas. `validadores` é um dict com 'status',
+               'etag' e 'last_modified', ou None se a busca falhou.
+    """
+    url = f"{base_url}/search-json"
+    headers = {}
+    if cached is not None:
+        _, _, etag, last_modified = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    for attempt in range(retries + 1):
+        await limiter.acquire()
+        words = []
+        validators = None
+        try:
+            async with session.get(url, params={"prefix": prefix}, headers=headers) as response:
+                validators = {
+                    "status": response.status,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                if response.status == 304 and cached is not None:
+                    return cached[0], cached[1], validators
+                if response.status in RETRY_STATUS:
+                    raise aiohttp.ClientResponseError(
+                        response.request_info, response.history, status=response.status, message=response.reason,
+                    )
+                response.raise_for_status()
+                async for entry in iter_json_array(response):
+                    # Entradas fora do formato {"word": "..."} são ignoradas
+                    word = entry.get("word") if isinstance(entry, dict) else None
+                    if word and isinstance(word, str):
+                        words.append(word)
+                    if len(words) >= max_items:
+                        return words, False, validators  # Sai do "async with" e descarta o resto do corpo
+                return words, True, validators
+        except TruncatedResponse:
+            return words, False, validators
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = getattr(e, "status", None)
+            if attempt == retries or (status is not None and status not in RETRY_STATUS):
+                print(f"Erro ao buscar palavras com o prefixo '{prefix}': {e}")
+                return [], True, None
+            # Backoff exponencial com jitter para os workers não voltarem todos juntos
+            await asyncio.sleep(backoff * 2 ** attempt * (0.5 + random.random()))
+        except ValueError:
+            print(f"A resposta para o prefixo '{prefix}' não foi um JSON válido.")
+            return [], True, None
+    return [], True, None
+
+
+async def crawl_words(prefixes, on_words, base_url=BASE_URL, concurrency=8, rate=4.0, timeout=30,
+                      max_items=1000, max_depth=3, cache_file=None):
+    """
+    Busca vários prefixos em paralelo, entregando cada lote de palavras a
+    `on_words(prefix, words)` assim que a resposta chega. Um prefixo cuja
+    resposta vem cortada ou grande demais é dividido em sub-prefixos (até
+    `max_depth` letras), que entram na mesma fila e são buscados em paralelo.
+
+    Com `cache_file`, as respostas ficam guardadas para requisições
+    condicionais e o progresso vai para um diário: se a execução anterior foi
+    interrompida, os prefixos já concluídos saem do cache sem rede e só os
+    pendentes são buscados.
+
+    Args:
+        prefixes (iterable): Prefixos a serem buscados.
+        on_words (callable): Chamado com (prefixo, palavras) para cada resposta.
+        base_url (str, optional): Endereço da API (ou de um servidor local de testes).
+        concurrency (int, optional): Quantas requisições podem estar em andamento.
+        rate (float, optional): Máximo de requisições por segundo.
+        timeout (float, optional): Tempo limite de cada requisição, em segundos.
+        max_items (int, optional): Tamanho de resposta que faz o prefixo ser dividido.
+        max_depth (int, optional): Tamanho máximo dos sub-prefixos.
+        cache_file (str, optional): Arquivo SQLite do cache de respostas e do diário.
+
+    Returns:
+        dict: Quantas respostas vieram de cada status HTTP, do diário ('diario'),
+              falharam ('falhas') ou deram erro inesperado ('erros').
+    """
+    stats = {}
+    conexao = cache_crawler.conectar(cache_file) if cache_file else None
+    if conexao is not None:
+        prefixes, done = cache_crawler.iniciar_diario(conexao, prefixes)
+        if done:
+            print(f"Retomando execução interrompida: {len(done)} prefixos já concluídos, {len(prefixes)} pendentes.")
+        for prefix in done:
+            on_words(prefix, cache_crawler.ler_resposta(conexao, prefix)[0])
+        stats["diario"] = len(done)
+
+    queue = asyncio.Queue()
+    for prefix in prefixes:
+        queue.put_nowait(prefix)
+
+    limiter = TokenBucket(rate)
+    connector = aiohttp.TCPConnector(limit=concurrency, ssl=False)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def worker(session):
+        while True:
+            prefix = await queue.get()
+            try:
+                cached = cache_crawler.ler_resposta(conexao, prefix) if conexao is not None else None
+                words, complete, validators = await fetch_words(
+                    session, prefix, limiter, base_url, max_items=max_items, cached=cached,
+                )
+                on_words(prefix, words)
+                if validators is None:
+                    # Fica pendente no diário: a próxima execução tenta de novo
+                    stats["falhas"] = stats.get("falhas", 0) + 1
+                    continue
+                stats[validators["status"]] = stats.get(validators["status"], 0) + 1
+                if conexao is not None and validators["status"] != 304:
+                    cache_crawler.salvar_resposta(
+                        conexao, prefix, words, complete, validators["etag"], validators["last_modified"],
+                    )
+
+                sub_prefixes = []
+                if not complete:
+                    if len(prefix) < max_depth:
+                        print(f"Prefixo '{prefix}' grande demais, dividindo em sub-prefixos...")
+                        sub_prefixes = [prefix + letter for letter in SHARD_ALPHABET]
+                    else:
+                        print(f"Aviso: o prefixo '{prefix}' continua incompleto no tamanho máximo.")
+                if conexao is not None:
+                    cache_crawler.concluir_prefixo(conexao, prefix, sub_prefixes)
+                for sub_prefix in sub_prefixes:
+                    queue.put_nowait(sub_prefix)
+            except Exception as e:
+                # Um erro inesperado não pode derrubar o worker, senão a fila nunca esvazia;
+                # o prefixo fica pendente no diário, como uma falha de rede
+                print(f"Erro inesperado no prefixo '{prefix}': {e!r}")
+                stats["erros"] = stats.get("erros", 0) + 1
+            finally:
+                queue.task_done()
+
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(concurrency)]
+            # Os workers também alimentam a fila, então o fim é quando ela esvazia de vez
+            await queue.join()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        if conexao is not None:
+            pending = cache_crawler.encerrar_diario(conexao)
+            if pending:
+                print(f"Aviso: {pending} prefixos falharam e ficaram no diário para a próxima execução.")
+    finally:
+        if conexao is not None:
+            conexao.close()
+    return stats
+
+
+def create_word_list_file_async(filename="palavras5.txt", base_url=BASE_URL, concurrency=8, rate=4.0,
+                                max_items=1000, max_depth=3, cache_file=cache_crawler.CACHE_FILE):
+    """
+    Versão concorrente de create_word_list_file. As palavras são gravadas
+    (sem repetição) conforme chegam, então a ordem do arquivo segue a ordem das
+    respostas; use o dup/pipeline para ordenar, se precisar.
+
+    Args:
+        filename (str, optional): O nome do arquivo a ser criado.
+        base_url (str, optional): Endereço da API (ou de um servidor local de testes).
+        concurrency (int, optional): Quantas requisições podem estar em andamento.
+        rate (float, optional): Máximo de requisições por segundo.
+        max_items (int, optional): Tamanho de resposta que faz o prefixo ser dividido.
+        max_depth (int, optional): Tamanho máximo dos sub-prefixos.
+        cache_file (str, optional): Cache de respostas e diário para retomar
+            execuções interrompidas (None desliga).
+    """
+    seen = set()
+    start = time.time()
+
+    with open(filename, "w", encoding="utf-8") as f:
+        def on_words(prefix, words):
+            new_words = [word for word in words if word not in seen]
+            seen.update(new_words)
+            f.writelines(f"{word}\n" for word in new_words)
+            print(f"Prefixo '{prefix}': {len(words)} palavras ({len(new_words)} novas).")
+
+        stats = asyncio.run(crawl_words(string.ascii_lowercase, on_words, base_url, concurrency, rate,
+                                        max_items=max_items, max_depth=max_depth, cache_file=cache_file))
+
+    print("Respostas: " + ", ".join(f"{origem}: {total}" for origem, total in stats.items()))
+
+    if seen:
+        print(f"Arquivo '{filename}' criado com sucesso com {len(seen)} palavras em {time.time() - start:.1f}s.")
+    else:
+        print("\nNão foi possível obter nenhuma palavra da API.")
+
+
 if __name__ == "__main__":
-    create_word_list_file()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Baixa a lista de palavras do Dicionário Aberto.")
+    parser.add_argument("--saida", default="palavras5.txt")
+    parser.add_argument("--base-url", default=BASE_URL, help="ex: http://127.0.0.1:8765 para o servidor local")
+    parser.add_argument("--concorrencia", type=int, default=8)
+    parser.add_argument("--taxa", type=float, default=4.0, help="máximo de requisições por segundo")
+    parser.add_argument("--max-itens", type=int, default=1000,
+                        help="respostas com isso ou mais palavras têm o prefixo dividido")
+    parser.add_argument("--profundidade", type=int, default=3, help="tamanho máximo dos sub-prefixos")
+    parser.add_argument("--cache", default=cache_crawler.CACHE_FILE, help="cache de respostas e diário do crawl")
+    parser.add_argument("--sem-cache", action="store_true")
+    parser.add_argument("--sequencial", action="store_true", help="usa o modo antigo, uma letra por vez")
+    args = parser.parse_args()
+
+    if args.sequencial:
+        create_word_list_file(args.saida)
+    else:
+        create_word_list_file_async(args.saida, args.base_url, args.concorrencia, args.taxa,
+                                    args.max_itens, args.profundidade, None if args.sem_cache else args.cache)
\ No newline at end of file
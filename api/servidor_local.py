@@ -0,0 +1,123 @@
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import random
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+# --- Servidor Local Que Imita O search-json Do Dicionário Aberto ---
+#
+# Serve uma lista de palavras local no mesmo formato da API
+# ([{"word": ...}, ...] em /search-json?prefix=), para testar o crawler sem
+# depender da rede. Pode atrasar respostas e falhar de propósito (503) para
+# exercitar o limitador de taxa e as novas tentativas, e limitar o tamanho
+# das respostas para exercitar a divisão de prefixos: "paginar" devolve só os
+# primeiros resultados (JSON válido) e "cortar" interrompe o corpo no meio.
+# Toda resposta leva ETag e Last-Modified e requisições condicionais recebem
+# 304 quando nada mudou. Com "invalidas", cada lista começa com entradas fora
+# do formato (texto solto, objeto sem "word", "word" numérico).
+
+
+def carregar_palavras(caminho_arquivo):
+    with open(caminho_arquivo, "r", encoding="utf-8") as f:
+        return sorted({linha.strip() for linha in f if linha.strip()})
+
+
+def palavras_com_prefixo(palavras, prefixo):
+    """Fatia da lista ordenada com as palavras que começam com o prefixo"""
+    inicio = bisect.bisect_left(palavras, prefixo)
+    fim = bisect.bisect_left(palavras, prefixo + "￿")
+    return palavras[inicio:fim]
+
+
+ENTRADAS_INVALIDAS = ["lixo", {"palavra": "casa"}, {"word": 7}, None]
+
+
+def _lista_json(palavras, invalidas=False):
+    # UTF-8 cru, como a API: letras acentuadas ocupam mais de um byte no corpo
+    entradas = (ENTRADAS_INVALIDAS if invalidas else []) + [{"word": p} for p in palavras]
+    return json.dumps(entradas, ensure_ascii=False).encode("utf-8")
+
+
+def criar_servidor(palavras, porta=8765, latencia=0.0, taxa_falhas=0.0, limite=None, modo_limite="paginar",
+                   modificado_em=None, verboso=False, requisicoes=None, invalidas=False):
+    """
+    Monta (sem iniciar) o servidor HTTP que responde com as palavras dadas.
+    Com `requisicoes` (uma lista), cada resposta é anotada como (prefixo, status).
+    """
+    last_modified = formatdate(modificado_em or time.time(), usegmt=True)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/search-json":
+                self.send_error(404)
+                return
+            if latencia:
+                time.sleep(latencia)
+            prefixo = parse_qs(url.query).get("prefix", [""])[0]
+            if random.random() < taxa_falhas:
+                self._anotar(prefixo, 503)
+                self.send_error(503)
+                return
+
+            encontradas = palavras_com_prefixo(palavras, prefixo)
+            if limite and len(encontradas) > limite and modo_limite == "paginar":
+                encontradas = encontradas[:limite]
+            corpo = _lista_json(encontradas, invalidas)
+            if limite and len(encontradas) > limite and modo_limite == "cortar":
+                # Corta no meio de um objeto, como uma resposta interrompida
+                corpo = corpo[:len(_lista_json(encontradas[:limite], invalidas)) - 7]
+
+            etag = '"' + hashlib.sha1(corpo).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == etag or (
+                "If-None-Match" not in self.headers and self.headers.get("If-Modified-Since") == last_modified
+            ):
+                self._anotar(prefixo, 304)
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            self._anotar(prefixo, 200)
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def _anotar(self, prefixo, status):
+            if requisicoes is not None:
+                requisicoes.append((prefixo, status))
+
+        def log_message(self, formato, *args):
+            if verboso:
+                super().log_message(formato, *args)
+
+    return ThreadingHTTPServer(("127.0.0.1", porta), Handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local no formato do search-json do Dicionário Aberto.")
+    parser.add_argument("palavras", nargs="?", default="Robo-soletra/onelet/onelet_corrigido.txt")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--latencia", type=float, default=0.0, help="atraso de cada resposta, em segundos")
+    parser.add_argument("--taxa-falhas", type=float, default=0.0, help="fração das respostas que devolvem 503")
+    parser.add_argument("--limite", type=int, default=None, help="máximo de palavras por resposta")
+    parser.add_argument("--modo-limite", choices=("paginar", "cortar"), default="paginar")
+    parser.add_argument("--verboso", action="store_true", help="uma linha de log por requisição")
+    parser.add_argument("--invalidas", action="store_true", help="começa cada lista com entradas fora do formato")
+    args = parser.parse_args()
+
+    servidor = criar_servidor(carregar_palavras(args.palavras), args.porta, args.latencia, args.taxa_falhas,
+                              args.limite, args.modo_limite, os.path.getmtime(args.palavras), args.verboso,
+                              invalidas=args.invalidas)
+    print(f"🌐 Servindo {args.palavras} em http://127.0.0.1:{args.porta}/search-json?prefix=")
+    servidor.serve_forever()
@@ -0,0 +1,242 @@
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import string
+import threading
+
+import pytest
+
+import servidor_local
+
+
+# --- Testes Do Crawler Contra O Servidor Local ---
+#
+# O api/index.py é carregado pelo caminho para não colidir com o index.py da
+# raiz. Cada teste sobe o servidor_local numa porta livre, com respostas
+# limitadas a LIMITE palavras, e compara o que o crawler juntou com a lista
+# servida.
+
+
+_spec = importlib.util.spec_from_file_location(
+    "crawler_api", os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.py"),
+)
+crawler = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(crawler)
+
+LIMITE = 60
+PROFUNDIDADE = 3
+
+
+def _palavras_de_teste(quantidade=1500, semente=7):
+    sorteio = random.Random(semente)
+    letras = "abcdeç" + "ãéë"
+    palavras = {
+        sorteio.choice("abcde") + "".join(sorteio.choice(letras) for _ in range(sorteio.randint(3, 8)))
+        for _ in range(quantidade)
+    }
+    return sorted(palavras)
+
+
+@pytest.fixture
+def servidor():
+    """Sobe um servidor_local configurável; devolve (base_url, requisicoes)"""
+    servidores = []
+
+    def iniciar(palavras, modo_limite="paginar", latencia=0.0, invalidas=False):
+        requisicoes = []
+        http = servidor_local.criar_servidor(
+            palavras, porta=0, latencia=latencia, limite=LIMITE, modo_limite=modo_limite, requisicoes=requisicoes,
+            invalidas=invalidas,
+        )
+        threading.Thread(target=http.serve_forever, daemon=True).start()
+        servidores.append(http)
+        return f"http://127.0.0.1:{http.server_address[1]}", requisicoes
+
+    yield iniciar
+    for http in servidores:
+        http.shutdown()
+        http.server_close()
+
+
+def _crawl(base_url, cache_file=None):
+    coletadas = set()
+
+    def on_words(prefix, words):
+        coletadas.update(words)
+
+    stats = asyncio.run(crawler.crawl_words(
+        string.ascii_lowercase, on_words, base_url, concurrency=8, rate=1000.0,
+        max_items=LIMITE, max_depth=PROFUNDIDADE, cache_file=cache_file,
+    ))
+    return coletadas, stats
+
+
+# --- Divisão Adaptativa De Prefixos ---
+
+
+@pytest.mark.parametrize("modo_limite", ["paginar", "cortar"])
+def test_crawl_encontra_todas_as_palavras(servidor, modo_limite):
+    palavras = _palavras_de_teste()
+    base_url, requisicoes = servidor(palavras, modo_limite)
+
+    coletadas, stats = _crawl(base_url)
+
+    assert coletadas == set(palavras)
+    assert stats.get("falhas", 0) == 0
+    # Nenhuma letra inicial cabe no limite, então todas precisaram ser divididas
+    assert any(len(prefixo) == 2 for prefixo, _ in requisicoes)
+    assert max(len(prefixo) for prefixo, _ in requisicoes) <= PROFUNDIDADE
+
+
+# --- Entradas Fora Do Formato E Erros Inesperados ---
+
+
+def test_entradas_invalidas_sao_ignoradas(servidor):
+    palavras = _palavras_de_teste()
+    base_url, _ = servidor(palavras, invalidas=True)
+
+    coletadas, stats = _crawl(base_url)
+
+    assert coletadas == set(palavras)
+    assert stats.get("falhas", 0) == stats.get("erros", 0) == 0
+
+
+def test_erro_inesperado_nao_trava_a_fila(servidor):
+    base_url, _ = servidor(_palavras_de_teste())
+
+    def on_words(prefix, words):
+        raise KeyError(prefix)
+
+    # Mais prefixos do que workers: se cada erro derrubasse um worker, o queue.join() nunca voltaria
+    stats = asyncio.run(asyncio.wait_for(crawler.crawl_words(
+        string.ascii_lowercase, on_words, base_url, concurrency=8, rate=1000.0, max_items=LIMITE,
+    ), timeout=30))
+
+    assert stats["erros"] == len(string.ascii_lowercase)
+
+
+# --- Parser JSON Em Streaming ---
+
+
+class _RespostaEmPedacos:
+    """Imita o response.content do aiohttp entregando o corpo nos pedaços dados"""
+
+    def __init__(self, pedacos):
+        self.content = self
+        self._pedacos = pedacos
+
+    async def iter_chunked(self, tamanho):
+        for pedaco in self._pedacos:
+            yield pedaco
+
+
+def _ler(pedacos):
+    async def coletar():
+        return [item async for item in crawler.iter_json_array(_RespostaEmPedacos(pedacos))]
+    return asyncio.run(coletar())
+
+
+def _em_pedacos(dados, tamanho):
+    return [dados[i:i + tamanho] for i in range(0, len(dados), tamanho)]
+
+
+def test_iter_json_array_varios_pedacos_com_utf8_partido():
+    itens = [{"word": p} for p in ("ação", "ênfase", "açúcar", "pão", "zê")]
+    corpo = json.dumps(itens, ensure_ascii=False).encode("utf-8")
+    # Pedaços de 3 bytes cortam letras acentuadas (2 bytes em UTF-8) ao meio
+    assert any(b"\xc3" == pedaco[-1:] for pedaco in _em_pedacos(corpo, 3))
+
+    for tamanho in (1, 2, 3, 5, len(corpo)):
+        assert _ler(_em_pedacos(corpo, tamanho)) == itens
+
+
+def test_iter_json_array_resposta_cortada():
+    itens = [{"word": p} for p in ("casa", "caça", "cação")]
+    corpo = json.dumps(itens, ensure_ascii=False).encode("utf-8")
+    # Corte no meio de "cação": o 'ç' fica pela metade
+    corte = corpo.index("ç".encode("utf-8"), corpo.index(b"ca\xc3\xa7\xc3\xa3o")) + 1
+
+    lidos = []
+
+    async def coletar():
+        async for item in crawler.iter_json_array(_RespostaEmPedacos(_em_pedacos(corpo[:corte], 4))):
+            lidos.append(item)
+
+    with pytest.raises(crawler.TruncatedResponse):
+        asyncio.run(coletar())
+    assert lidos == itens[:2]
+
+
+def test_iter_json_array_rejeita_o_que_nao_e_lista():
+    with pytest.raises(ValueError):
+        _ler([b'{"word": "casa"}'])
+
+
+# --- Cache De Respostas E Retomada Pelo Diário ---
+
+
+def test_segunda_execucao_sai_toda_do_cache(servidor, tmp_path):
+    palavras = _palavras_de_teste()
+    base_url, requisicoes = servidor(palavras)
+    cache_file = str(tmp_path / "cache.db")
+
+    primeira, _ = _crawl(base_url, cache_file)
+    requisicoes.clear()
+    segunda, stats = _crawl(base_url, cache_file)
+
+    assert primeira == segunda == set(palavras)
+    assert requisicoes and all(status == 304 for _, status in requisicoes)
+    assert set(stats) == {"diario", 304}
+    assert stats["diario"] == 0
+
+
+def test_execucao_interrompida_retoma_pelo_diario(servidor, tmp_path):
+    palavras = _palavras_de_teste()
+    # Latência para a interrupção cair com a execução no meio
+    base_url, requisicoes = servidor(palavras, latencia=0.01)
+    cache_file = str(tmp_path / "cache.db")
+    coletadas = set()
+
+    async def interromper():
+        respostas = 0
+        pronto = asyncio.Event()
+
+        def on_words(prefix, words):
+            nonlocal respostas
+            coletadas.update(words)
+            respostas += 1
+            if respostas >= 40:
+                pronto.set()
+
+        tarefa = asyncio.create_task(crawler.crawl_words(
+            string.ascii_lowercase, on_words, base_url, concurrency=4, rate=1000.0,
+            max_items=LIMITE, max_depth=PROFUNDIDADE, cache_file=cache_file,
+        ))
+        await pronto.wait()
+        tarefa.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarefa
+
+    asyncio.run(interromper())
+
+    conexao = crawler.cache_crawler.conectar(cache_file)
+    concluidos = {p for p, in conexao.execute("SELECT prefixo FROM diario WHERE concluido = 1")}
+    pendentes = {p for p, in conexao.execute("SELECT prefixo FROM diario WHERE concluido = 0")}
+    conexao.close()
+    assert concluidos and pendentes
+    assert coletadas != set(palavras)
+
+    requisicoes.clear()
+    retomadas, stats = _crawl(base_url, cache_file)
+
+    assert retomadas == set(palavras)
+    assert stats["diario"] == len(concluidos)
+    buscados = {prefixo for prefixo, _ in requisicoes}
+    assert not buscados & concluidos
+    assert pendentes <= buscados
+    # Execução terminada sem pendências apaga o diário
+    conexao = crawler.cache_crawler.conectar(cache_file)
+    assert conexao.execute("SELECT COUNT(*) FROM diario").fetchone()[0] == 0
+    conexao.close()
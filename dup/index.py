@@ -1,3 +1,16 @@
+import argparse
+import hashlib
+import heapq
+import os
+import sys
+import tempfile
+import time
+
+# A normalização (mesma dobra de acentos dos robôs) fica na pasta Robo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Robo"))
+from nucleo_soletra import normalizar_palavra
+
+
 def remove_palavras_duplicadas(nome_arquivo_entrada, nome_arquivo_saida):
     palavras_unicas = set() # Usamos um set para armazenar palavras únicas por sua natureza de não permitir duplicatas
 
@@ -24,10 +37,330 @@ def remove_palavras_duplicadas(nome_arquivo_entrada, nome_arquivo_saida):
     except Exception as e:
         print(f"Ocorreu um erro ao escrever no arquivo: {e}")
 
-# Nome do seu arquivo de entrada
-arquivo_entrada = 'Robo-soletra\dup\dups.txt'
-# Nome do arquivo de saída onde as palavras sem duplicatas serão salvas
-arquivo_saida = 'Robo-soletra\dup\mno_dups.txt'
 
-# Chama a função para remover as duplicatas
-remove_palavras_duplicadas(arquivo_entrada, arquivo_saida)
\ No newline at end of file
+# --- Modo Externo: Ordenação Em Disco Para Arquivos Gigantes ---
+
+
+# Custo aproximado de cada registro dentro do bloco, além do próprio objeto str
+CUSTO_POR_PALAVRA = 64
+
+
+def _gravar_bloco_ordenado(contagens, diretorio):
+    """Grava um bloco ordenado 'registro<TAB>contagem' em um arquivo temporário e devolve o caminho"""
+    descritor, caminho = tempfile.mkstemp(suffix=".txt", dir=diretorio)
+    with os.fdopen(descritor, 'w', encoding='utf-8') as f:
+        for registro in sorted(contagens):
+            f.write(f"{registro}\t{contagens[registro]}\n")
+    return caminho
+
+
+def _ler_bloco(caminho):
+    with open(caminho, 'r', encoding='utf-8') as f:
+        for linha in f:
+            registro, contagem = linha.rstrip('\n').rsplit('\t', 1)
+            yield registro, int(contagem)
+
+
+def _despejar_blocos(registros, diretorio, orcamento):
+    """Conta os registros em memória até o orçamento e despeja cada bloco ordenado em disco"""
+    blocos = []
+    contagens = {}
+    uso = 0
+    for registro in registros:
+        if registro in contagens:
+            contagens[registro] += 1
+            continue
+        contagens[registro] = 1
+        uso += sys.getsizeof(registro) + CUSTO_POR_PALAVRA
+        if uso >= orcamento:
+            blocos.append(_gravar_bloco_ordenado(contagens, diretorio))
+            contagens = {}
+            uso = 0
+    if contagens or not blocos:
+        blocos.append(_gravar_bloco_ordenado(contagens, diretorio))
+    return blocos
+
+
+def _intercalar_blocos(blocos):
+    """K-way merge dos blocos: gera (registro, contagem total) em ordem, sem repetidos"""
+    anterior = None
+    total = 0
+    for registro, contagem in heapq.merge(*(_ler_bloco(caminho) for caminho in blocos)):
+        if registro != anterior:
+            if anterior is not None:
+                yield anterior, total
+            anterior = registro
+            total = 0
+        total += contagem
+    if anterior is not None:
+        yield anterior, total
+
+
+def _palavras_do_arquivo(nome_arquivo):
+    with open(nome_arquivo, 'r', encoding='utf-8') as f:
+        for linha in f:
+            yield from linha.split()
+
+
+def _relatar_vazao(tamanho_entrada, tempo_inicio):
+    tempo_total = time.time() - tempo_inicio
+    vazao = tamanho_entrada / (1024 * 1024) / tempo_total if tempo_total > 0 else 0
+    print(f"Tempo: {tempo_total:.2f}s | Vazão: {vazao:.1f} MB/s")
+
+
+def palavras_unicas_externo(palavras, memoria_mb=256, diretorio_temp=None):
+    """Etapa de pipeline: gera as palavras sem repetidas, em ordem, com memória limitada"""
+    with tempfile.TemporaryDirectory(dir=diretorio_temp) as diretorio:
+        blocos = _despejar_blocos(palavras, diretorio, memoria_mb * 1024 * 1024)
+        print(f"{len(blocos)} bloco(s) ordenado(s) gravado(s). Intercalando...")
+        for palavra, _ in _intercalar_blocos(blocos):
+            yield palavra
+
+
+def remove_palavras_duplicadas_externo(nome_arquivo_entrada, nome_arquivo_saida, memoria_mb=256, diretorio_temp=None):
+    """
+    Remove duplicatas de arquivos maiores que a memória: blocos ordenados são
+    despejados em arquivos temporários e depois combinados em uma única
+    intercalação (k-way merge) que descarta as repetidas.
+
+    Args:
+        nome_arquivo_entrada (str): Arquivo com as palavras (qualquer quantidade por linha).
+        nome_arquivo_saida (str): Arquivo ordenado, uma palavra única por linha.
+        memoria_mb (int): Orçamento aproximado de memória para cada bloco, em MB.
+        diretorio_temp (str, optional): Onde criar os blocos temporários.
+    """
+    tempo_inicio = time.time()
+
+    try:
+        tamanho_entrada = os.path.getsize(nome_arquivo_entrada)
+    except FileNotFoundError:
+        print(f"Erro: O arquivo '{nome_arquivo_entrada}' não foi encontrado.")
+        return
+
+    unicas = 0
+    try:
+        with open(nome_arquivo_saida, 'w', encoding='utf-8') as f_saida:
+            palavras = _palavras_do_arquivo(nome_arquivo_entrada)
+            for palavra in palavras_unicas_externo(palavras, memoria_mb, diretorio_temp):
+                f_saida.write(palavra + '\n')
+                unicas += 1
+    except Exception as e:
+        print(f"Ocorreu um erro ao processar os arquivos: {e}")
+        return
+
+    print(f"As palavras duplicadas foram removidas. {unicas} palavras únicas salvas em '{nome_arquivo_saida}'.")
+    _relatar_vazao(tamanho_entrada, tempo_inicio)
+
+
+# --- Modo Sem Acento: Uma Grafia Por Forma Normalizada ---
+
+
+PREFERENCIAS = ("acentuada", "frequente", "primeira")
+
+
+def _registros_com_chave(fontes):
+    """Gera 'chave<TAB>palavra<TAB>fonte' para cada palavra de cada fonte, em streaming"""
+    for fonte, palavras in enumerate(fontes):
+        for palavra in palavras:
+            yield f"{normalizar_palavra(palavra)}\t{palavra}\t{fonte:04d}"
+
+
+def _peso_da_grafia(preferencia, palavra, chave, frequencia, fonte):
+    """Critério de escolha da grafia: maior peso vence"""
+    acentuada = palavra.lower() != chave
+    minuscula = palavra == palavra.lower()
+    if preferencia == "acentuada":
+        return (acentuada, minuscula, frequencia, -fonte)
+    if preferencia == "frequente":
+        return (frequencia, acentuada, minuscula, -fonte)
+    return (-fonte, acentuada, minuscula, frequencia)
+
+
+def _escolher_grafias(registros_intercalados, preferencia):
+    """Agrupa o merge ordenado por chave e gera a grafia escolhida de cada grupo"""
+    chave_atual = None
+    grafias = {}
+    for registro, contagem in registros_intercalados:
+        chave, palavra, fonte = registro.split('\t')
+        if chave != chave_atual:
+            if grafias:
+                yield _melhor_grafia(grafias, chave_atual, preferencia)
+            chave_atual = chave
+            grafias = {}
+        frequencia, primeira_fonte = grafias.get(palavra, (0, int(fonte)))
+        grafias[palavra] = (frequencia + contagem, min(primeira_fonte, int(fonte)))
+    if grafias:
+        yield _melhor_grafia(grafias, chave_atual, preferencia)
+
+
+def _melhor_grafia(grafias, chave, preferencia):
+    return max(grafias, key=lambda palavra: _peso_da_grafia(preferencia, palavra, chave, *grafias[palavra]))
+
+
+def grafias_preferidas(fontes, preferencia="acentuada", memoria_mb=256, diretorio_temp=None):
+    """
+    Etapa de pipeline: recebe uma sequência de palavras por fonte (na ordem de
+    prioridade) e gera uma grafia por forma normalizada, ordenada pela forma.
+    """
+    with tempfile.TemporaryDirectory(dir=diretorio_temp) as diretorio:
+        blocos = _despejar_blocos(_registros_com_chave(fontes), diretorio, memoria_mb * 1024 * 1024)
+        yield from _escolher_grafias(_intercalar_blocos(blocos), preferencia)
+
+
+def remove_variantes_de_acento(nomes_arquivos_entrada, nome_arquivo_saida, preferencia="acentuada",
+                               memoria_mb=256, diretorio_temp=None):
+    """
+    Deduplica ignorando acentos e maiúsculas ("voce"/"você"/"Você" viram uma
+    entrada só), usando a mesma dobra de normalizar_palavra dos robôs. Roda em
+    streaming com ordenação externa, então escala para dumps gigantes.
+
+    Args:
+        nomes_arquivos_entrada (list): Fontes, na ordem de prioridade.
+        nome_arquivo_saida (str): Arquivo com uma grafia por forma normalizada.
+        preferencia (str): Qual grafia manter: 'acentuada' (a com acento),
+            'frequente' (a mais vista somando as fontes) ou 'primeira' (a da
+            primeira fonte listada).
+        memoria_mb (int): Orçamento aproximado de memória para cada bloco, em MB.
+        diretorio_temp (str, optional): Onde criar os blocos temporários.
+    """
+    if preferencia not in PREFERENCIAS:
+        print(f"Erro: preferência '{preferencia}' inválida. Use uma de: {', '.join(PREFERENCIAS)}.")
+        return
+
+    tempo_inicio = time.time()
+    try:
+        tamanho_entrada = sum(os.path.getsize(nome) for nome in nomes_arquivos_entrada)
+    except FileNotFoundError as e:
+        print(f"Erro: O arquivo '{e.filename}' não foi encontrado.")
+        return
+
+    mantidas = 0
+    try:
+        with open(nome_arquivo_saida, 'w', encoding='utf-8') as f_saida:
+            fontes = [_palavras_do_arquivo(nome) for nome in nomes_arquivos_entrada]
+            for palavra in grafias_preferidas(fontes, preferencia, memoria_mb, diretorio_temp):
+                f_saida.write(palavra + '\n')
+                mantidas += 1
+    except Exception as e:
+        print(f"Ocorreu um erro ao processar os arquivos: {e}")
+        return
+
+    print(f"Variantes de acento removidas (preferência: {preferencia}). {mantidas} palavras salvas em '{nome_arquivo_saida}'.")
+    _relatar_vazao(tamanho_entrada, tempo_inicio)
+
+
+# --- Atualização: Intercala Uma Fonte Nova No Dicionário Ordenado ---
+
+
+def _palavras_do_dicionario(nome_arquivo):
+    """Uma palavra por linha, conferindo que o dicionário está ordenado e sem repetidas"""
+    anterior = None
+    with open(nome_arquivo, 'r', encoding='utf-8') as f:
+        for linha in f:
+            palavra = linha.rstrip('\n')
+            if not palavra:
+                continue
+            if anterior is not None and palavra <= anterior:
+                raise ValueError(
+                    f"'{nome_arquivo}' não está ordenado ('{anterior}' antes de '{palavra}'). "
+                    "Rode o modo --externo nele uma vez antes de usar --atualizar."
+                )
+            anterior = palavra
+            yield palavra
+
+
+def atualizar_dicionario(nome_dicionario, nomes_arquivos_novos, memoria_mb=256, diretorio_temp=None,
+                         caminho_artefato=None, caminho_dawg=None):
+    """
+    Acrescenta fontes novas a um dicionário já ordenado sem refazer a
+    deduplicação inteira: só as fontes novas são ordenadas (em disco, se
+    preciso) e depois intercaladas com o dicionário em uma única passada
+    linear, que também calcula o hash do .txt novo. O artefato recebe só as
+    palavras novas; o DAWG mínimo não aceita inserção barata e é recompilado
+    a partir do dicionário inteiro.
+
+    Args:
+        nome_dicionario (str): Dicionário ordenado e sem repetidas (saída do dup).
+        nomes_arquivos_novos (list): Fontes a acrescentar.
+        memoria_mb (int): Orçamento aproximado de memória da ordenação das fontes novas, em MB.
+        diretorio_temp (str, optional): Onde criar os blocos temporários.
+        caminho_artefato (str, optional): Artefato binário (.bin) a atualizar.
+        caminho_dawg (str, optional): DAWG (.dawg) a recompilar.
+    """
+    tempo_inicio = time.time()
+    for nome in [nome_dicionario] + list(nomes_arquivos_novos):
+        if not os.path.exists(nome):
+            print(f"Erro: O arquivo '{nome}' não foi encontrado.")
+            return
+
+    adicionadas = []
+    caminho_temp = nome_dicionario + ".tmp"
+    try:
+        novas = palavras_unicas_externo(
+            (palavra for nome in nomes_arquivos_novos for palavra in _palavras_do_arquivo(nome)),
+            memoria_mb, diretorio_temp,
+        )
+        resumo = hashlib.sha256()
+        # Em binário, para o hash ser o dos bytes gravados (sem tradução de \n)
+        with open(caminho_temp, 'wb') as f_saida:
+            anterior = None
+            # Em empate a palavra já existente (0) vem antes da nova (1) e a nova é descartada
+            existentes = ((palavra, 0) for palavra in _palavras_do_dicionario(nome_dicionario))
+            for palavra, nova in heapq.merge(existentes, ((palavra, 1) for palavra in novas)):
+                if palavra == anterior:
+                    continue
+                linha = (palavra + '\n').encode('utf-8')
+                f_saida.write(linha)
+                resumo.update(linha)
+                if nova:
+                    adicionadas.append(palavra)
+                anterior = palavra
+        os.replace(caminho_temp, nome_dicionario)
+    except Exception as e:
+        if os.path.exists(caminho_temp):
+            os.remove(caminho_temp)
+        print(f"Ocorreu um erro ao atualizar o dicionário: {e}")
+        return
+
+    print(f"{len(adicionadas)} palavras novas intercaladas em '{nome_dicionario}'.")
+
+    if caminho_artefato and os.path.exists(caminho_artefato):
+        from artefato_dicionario import atualizar_artefato
+        jogaveis = atualizar_artefato(caminho_artefato, adicionadas, resumo.hexdigest())
+        print(f"Artefato '{caminho_artefato}' atualizado com {jogaveis} palavras jogáveis.")
+    if caminho_dawg and os.path.exists(caminho_dawg):
+        # O DAWG mínimo não aceita inserção barata; é recompilado a partir do dicionário novo
+        from dawg_dicionario import compilar_dawg
+        compilar_dawg(nome_dicionario, caminho_dawg, resumo.hexdigest())
+
+    print(f"Tempo: {time.time() - tempo_inicio:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove palavras duplicadas de uma ou mais listas.")
+    # Nome do(s) seu(s) arquivo(s) de entrada
+    parser.add_argument("entradas", nargs="*", default=['Robo-soletra\\dup\\dups.txt'])
+    # Nome do arquivo de saída onde as palavras sem duplicatas serão salvas
+    parser.add_argument("--saida", default='Robo-soletra\\dup\\mno_dups.txt')
+    parser.add_argument("--externo", action="store_true", help="ordena em disco, para arquivos maiores que a memória")
+    parser.add_argument("--sem-acento", choices=PREFERENCIAS, default=None,
+                        help="deduplica ignorando acentos, mantendo a grafia pela preferência escolhida")
+    parser.add_argument("--memoria-mb", type=int, default=256, help="orçamento de memória dos modos em disco")
+    parser.add_argument("--atualizar", metavar="DICIONARIO", default=None,
+                        help="intercala as entradas no dicionário ordenado, sem refazer a deduplicação inteira")
+    parser.add_argument("--artefato", default=None, help="artefato .bin a atualizar junto com --atualizar")
+    parser.add_argument("--dawg", default=None, help="DAWG .dawg a recompilar junto com --atualizar")
+    args = parser.parse_args()
+
+    # Chama a função para remover as duplicatas
+    if args.atualizar:
+        atualizar_dicionario(args.atualizar, args.entradas, memoria_mb=args.memoria_mb,
+                             caminho_artefato=args.artefato, caminho_dawg=args.dawg)
+    elif args.sem_acento:
+        remove_variantes_de_acento(args.entradas, args.saida, preferencia=args.sem_acento, memoria_mb=args.memoria_mb)
+    elif len(args.entradas) > 1:
+        print("Erro: várias entradas só são aceitas com --sem-acento.")
+    elif args.externo:
+        remove_palavras_duplicadas_externo(args.entradas[0], args.saida, memoria_mb=args.memoria_mb)
+    else:
+        remove_palavras_duplicadas(args.entradas[0], args.saida)
@@ -1,6 +1,7 @@
 import time
-import pandas as pd
+import sqlite3
 import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -11,59 +12,46 @@ from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Os módulos compartilhados dos robôs ficam na pasta Robo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Robo"))
+from nucleo_soletra import total_palavras, buscar_palavras, colapsar_variantes, hash_do_indice
+from indice_paralelo import construir_indice_paralelo
+from artefato_dicionario import abrir_artefato
+from dawg_dicionario import abrir_dawg
+from catalogo_tabuleiros import consultar_catalogo
+from cache_solucoes import ler_cache_solucao, salvar_cache_solucao
+from lexico_global import registrar_resultados, carregar_rejeitadas, podar_rejeitadas
+from historico_ml import (
+    registrar_historico, tamanho_historico, HistoricoEmMemoria, assinatura_tabuleiro, ordem_de_replay,
+    salvar_partida_resolvida, ler_partida_resolvida,
+)
+
 
 # --- CONFIGURAÇÕES ---
-HISTORICO_FILE = "historico_soletra.csv"
+HISTORICO_FILE = "historico_soletra.db"
 
 
 # --- O Cérebro Turbinado Com Machine Learning ---
 
 
-def normalizar_palavra(texto):
-    texto = texto.lower()
-    mapa_acentos = {
-        'á': 'a', 'à': 'a', 'â': 'a', 'ã': 'a',
-        'é': 'e', 'ê': 'e',
-        'í': 'i',
-        'ó': 'o', 'ô': 'o', 'õ': 'o',
-        'ú': 'u',
-    }
-    texto_normalizado = "".join(mapa_acentos.get(char, char) for char in texto)
-    return texto_normalizado
-
-
 def carregar_dicionario(caminho_arquivo='Robo-soletra/Robo/palavras3.txt'):
     print(f"📚 Carregando o dicionário '{caminho_arquivo}'...")
     try:
-        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-            palavras = {linha.strip() for linha in f}
-            print(f"✓ Dicionário carregado com {len(palavras)} palavras.")
-            return palavras
+        # Normaliza e filtra enquanto lê; listas gigantes são divididas entre os núcleos
+        indice = construir_indice_paralelo(caminho_arquivo)
+        print(f"✓ Dicionário carregado com {total_palavras(indice)} palavras.")
+        return indice
     except FileNotFoundError:
         print(f"❌ ERRO: O arquivo de dicionário '{caminho_arquivo}' não foi encontrado.")
         return None
 
 
-def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
+def encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario=None):
     print("🔍 Caçando palavras válidas...")
-    palavras_encontradas = []
-    
-    letra_central_norm = normalizar_palavra(letra_central)
-    letras_disponiveis_norm_set = set(normalizar_palavra(letras_disponiveis))
-
-    for palavra_original in dicionario:
-        if len(palavra_original) < 4:
-            continue
-        
-        palavra_norm = normalizar_palavra(palavra_original)
-        
-        if letra_central_norm not in palavra_norm:
-            continue
-        
-        if set(palavra_norm).issubset(letras_disponiveis_norm_set):
-            palavras_encontradas.append(palavra_original)
-            
-    palavras_encontradas.sort(key=len)
+    # Tabuleiro já resolvido no catálogo offline: resposta por consulta direta
+    palavras_encontradas = consultar_catalogo(letras_disponiveis, letra_central, hash_fonte=hash_dicionario)
+    if palavras_encontradas is None:
+        palavras_encontradas = buscar_palavras(indice, letras_disponiveis, letra_central)
     
     print(f"✓ {len(palavras_encontradas)} palavras válidas encontradas.")
     return palavras_encontradas
@@ -72,87 +60,46 @@ def encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario):
 # --- MACHINE LEARNING: HISTÓRICO E PRIORIZAÇÃO ---
 
 
-def carregar_historico():
-    """Carrega histórico de palavras ACEITAS anteriormente"""
-    if os.path.exists(HISTORICO_FILE):
-        try:
-            df = pd.read_csv(HISTORICO_FILE)
-            print(f"📊 Histórico ML carregado: {len(df)} palavras ACEITAS")
-            return df
-        except Exception as e:
-            print(f"⚠️ Erro ao carregar histórico: {e}. Criando novo...")
-            return pd.DataFrame(columns=["palavra", "tamanho", "frequencia"])
+def carregar_historico(tabuleiro):
+    """Carrega uma vez por execução os scores das palavras ACEITAS anteriormente no tabuleiro"""
+    try:
+        # Score: frequencia * 100 (quanto mais aceita, maior prioridade)
+        historico = HistoricoEmMemoria(lambda foi_aceita, frequencia: frequencia * 100, HISTORICO_FILE,
+                                       so_aceitas=True, tabuleiro=tabuleiro)
+    except sqlite3.Error as e:
+        print(f"⚠️ Erro ao carregar histórico: {e}. Criando novo...")
+        return None
+    if historico.aceitas:
+        print(f"📊 Histórico ML carregado: {historico.aceitas} palavras ACEITAS")
     else:
         print("📊 Nenhum histórico encontrado. Será criado após vitória completa.")
-        return pd.DataFrame(columns=["palavra", "tamanho", "frequencia"])
+    return historico
 
 
-def salvar_historico_vitoria(palavras_aceitas):
+def salvar_historico_vitoria(palavras_aceitas, tabuleiro):
     """Salva APENAS palavras aceitas no histórico - SÓ CHAMADO QUANDO GANHA 100%"""
-    historico = carregar_historico()
-    
     print(f"\n💾 Salvando histórico de VITÓRIA com {len(palavras_aceitas)} palavras aceitas...")
     
-    # Adicionar/atualizar palavras aceitas
-    for palavra in palavras_aceitas:
-        if palavra in historico['palavra'].values:
-            # Incrementa frequência
-            idx = historico[historico['palavra'] == palavra].index[0]
-            historico.at[idx, 'frequencia'] = historico.at[idx, 'frequencia'] + 1
-        else:
-            # Nova palavra aceita
-            novo_registro = pd.DataFrame([{
-                "palavra": palavra, 
-                "tamanho": len(palavra),
-                "frequencia": 1
-            }])
-            historico = pd.concat([historico, novo_registro], ignore_index=True)
-    
-    # Salvar histórico
-    historico.to_csv(HISTORICO_FILE, index=False)
-    print(f"✅ Histórico salvo com sucesso: {len(historico)} palavras no total")
+    # Adicionar/atualizar palavras aceitas numa transação só
+    registrar_historico(palavras_aceitas, caminho_arquivo=HISTORICO_FILE, tabuleiro=tabuleiro)
+    total, _ = tamanho_historico(HISTORICO_FILE, tabuleiro)
+    print(f"✅ Histórico salvo com sucesso: {total} palavras no total")
     print(f"   📁 Arquivo: {HISTORICO_FILE}")
 
 
-def priorizar_palavras_ml(palavras):
+def priorizar_palavras_ml(palavras, historico):
     """Usa histórico para priorizar palavras aceitas anteriormente"""
-    historico = carregar_historico()
-    
-    if historico.empty:
+    if historico is None or not historico.aceitas:
         print("🤖 ML: Sem histórico. Primeira execução - usando ordem padrão.")
         return palavras
     
-    # Criar dicionário de scores para acesso rápido
-    score_dict = {}
-    palavras_conhecidas = 0
-    
-    for _, row in historico.iterrows():
-        palavra = row['palavra']
-        # Score: frequencia * 100 (quanto mais aceita, maior prioridade)
-        score = row['frequencia'] * 100
-        score_dict[palavra] = score
-        palavras_conhecidas += 1
-    
-    print(f"🤖 ML: {palavras_conhecidas} palavras no histórico")
-    
-    # Atribuir scores
-    palavras_com_score = []
-    
-    for palavra in palavras:
-        if palavra in score_dict:
-            score = score_dict[palavra]
-        else:
-            # Palavras novas recebem score baseado no tamanho
-            score = 50 - len(palavra)
-        
-        palavras_com_score.append((palavra, score))
+    print(f"🤖 ML: {historico.aceitas} palavras no histórico")
     
-    # Ordenar por score (MAIOR primeiro)
-    palavras_com_score.sort(key=lambda x: (-x[1], len(x[0])))
-    palavras_priorizadas = [p[0] for p in palavras_com_score]
+    # Ordenar por score (MAIOR primeiro); palavras novas recebem score baseado no tamanho
+    palavras_priorizadas = historico.ordenar(palavras, lambda palavra: 50 - len(palavra))
     
     # Mostrar top 10
-    palavras_do_historico = [p for p in palavras_priorizadas if p in score_dict]
+    palavras_do_historico = [p for p in palavras_priorizadas if p in historico.scores]
     if palavras_do_historico:
         top_10 = palavras_do_historico[:min(10, len(palavras_do_historico))]
         print(f"🤖 ML: Top 10 do histórico: {', '.join(top_10)}")
@@ -267,7 +214,7 @@ def enviar_palavra_ultra_rapido(driver, palavra):
 
 
 def enviar_lote_palavras_ultra_rapido(driver, palavras, tentativa_num):
-    """Envia palavras em velocidade máxima"""
+    """Envia palavras em velocidade máxima; retorna (tempo, completou, palavras enviadas)"""
     print(f"\n{'='*60}")
     print(f"🎯 Tentativa {tentativa_num}: Enviando {len(palavras)} palavras...")
     print(f"{'='*60}\n")
@@ -294,7 +241,7 @@ def enviar_lote_palavras_ultra_rapido(driver, palavras, tentativa_num):
                 print(f"⏱️  Tempo: {tempo_decorrido:.2f} segundos")
                 print(f"{'🎉'*30}\n")
                 
-                return tempo_decorrido, True
+                return tempo_decorrido, True, palavras[:i + 1]
             
             acertos_anterior = acertos_atual
             
@@ -308,14 +255,22 @@ def enviar_lote_palavras_ultra_rapido(driver, palavras, tentativa_num):
     time.sleep(0.5)
     tempo_total = time.time() - tempo_inicio
     
-    return tempo_total, False
+    return tempo_total, False, palavras
 
 
 def jogar_soletra_ml(headless=False):
     """Versão definitiva - Salva histórico SÓ quando ganhar tudo"""
-    dicionario = carregar_dicionario()
-    if not dicionario:
-        return
+    # O dicionário compilado abre na hora via mmap; o .txt fica como reserva
+    indice = abrir_artefato()
+    if indice is None:
+        # Sem o artefato, o DAWG compilado (se existir) também evita reler o .txt
+        indice = abrir_dawg()
+    if indice is None:
+        indice = carregar_dicionario()
+        if not indice:
+            return
+    # Hash do .txt uma vez só (o artefato/DAWG já o trazem) para catálogo e cache
+    hash_dicionario = hash_do_indice(indice, 'Robo-soletra/Robo/palavras3.txt')
 
     print("\n" + "="*60)
     print("🤖 ROBÔ SOLETRA ULTIMATE - VELOCIDADE MÁXIMA + ML")
@@ -361,14 +316,34 @@ def jogar_soletra_ml(headless=False):
         print(f"✓ Letras disponíveis: {letras_disponiveis.upper()}")
         print(f"✓ Letra obrigatória: {letra_central.upper()}")
         
-        todas_palavras = encontrar_palavras_validas(letras_disponiveis, letra_central, dicionario)
+        # Partição do histórico deste tabuleiro de hoje, lida uma vez
+        tabuleiro = assinatura_tabuleiro(letras_disponiveis, letra_central)
+        historico = carregar_historico(tabuleiro)
         
-        if not todas_palavras:
-            print("\n❌ Nenhuma palavra foi encontrada.")
-            return
+        # Tabuleiro já completado: reenvia só as palavras aceitas, na ordem salva
+        palavras_replay = ler_partida_resolvida(tabuleiro, HISTORICO_FILE)
+        if palavras_replay is not None:
+            print(f"⚡ MODO REPLAY: tabuleiro já completado, {len(palavras_replay)} palavras aceitas salvas")
+            todas_palavras = palavras_priorizadas = palavras_replay
+        else:
+            # Tabuleiro já resolvido antes (ex: robô reiniciado no mesmo dia): lista direto do cache
+            palavras_priorizadas = ler_cache_solucao(letras_disponiveis, letra_central, hash_dicionario=hash_dicionario)
+            if palavras_priorizadas is not None:
+                todas_palavras = palavras_priorizadas
+            else:
+                todas_palavras = encontrar_palavras_validas(letras_disponiveis, letra_central, indice, hash_dicionario)
+        
+                if not todas_palavras:
+                    print("\n❌ Nenhuma palavra foi encontrada.")
+                    return
+        
+                # Priorizar com ML
+                # Uma grafia por forma normalizada; fica a mais bem priorizada pelo histórico
+                palavras_priorizadas = colapsar_variantes(priorizar_palavras_ml(todas_palavras, historico))
+                salvar_cache_solucao(letras_disponiveis, letra_central, palavras_priorizadas, hash_dicionario=hash_dicionario)
         
-        # Priorizar com ML
-        palavras_priorizadas = priorizar_palavras_ml(todas_palavras)
+            # Formas que o jogo já recusou em outros dias não são enviadas de novo
+            palavras_priorizadas = podar_rejeitadas(palavras_priorizadas, carregar_rejeitadas())
         
         print(f"\n{'='*60}")
         print(f"🚀 MODO LOOP INFINITO ATÉ VITÓRIA!")
@@ -381,6 +356,7 @@ def jogar_soletra_ml(headless=False):
         # LOOP INFINITO até completar
         tentativa = 1
         completou = False
+        palavras_enviadas = {}  # em ordem de envio, sem repetir entre tentativas
         tempo_total_inicio = time.time()
         
         while not completou:
@@ -388,11 +364,12 @@ def jogar_soletra_ml(headless=False):
             print(f"🔄 TENTATIVA {tentativa}")
             print(f"{'#'*60}")
             
-            tempo, completou_agora = enviar_lote_palavras_ultra_rapido(
+            tempo, completou_agora, enviadas = enviar_lote_palavras_ultra_rapido(
                 navegador, 
                 palavras_priorizadas,
                 tentativa
             )
+            palavras_enviadas.update(dict.fromkeys(enviadas))
             
             completou = completou_agora
             time.sleep(0.5)
@@ -407,7 +384,7 @@ def jogar_soletra_ml(headless=False):
             print(f"   ⏱️  Tempo: {tempo:.2f}s")
             print(f"{'='*60}")
             
-            if completou or acertos >= total:
+            if completou or (total > 0 and acertos >= total):
                 tempo_total_final = time.time() - tempo_total_inicio
                 
                 # Extrair palavras que foram REALMENTE aceitas
@@ -420,8 +397,18 @@ def jogar_soletra_ml(headless=False):
                 print(f"✅ Palavras aceitas extraídas: {len(palavras_aceitas_reais)}")
                 print(f"{'🎉'*20}")
                 
-                # SALVA O HISTÓRICO SÓ QUANDO GANHA TUDO
-                salvar_historico_vitoria(palavras_aceitas_reais)
+                # SALVA O HISTÓRICO SÓ QUANDO GANHA TUDO, e só se o placar e a lista de acertos
+                # foram lidos por inteiro (uma leitura falha devolve 0/0 ou uma lista parcial)
+                if total > 0 and acertos >= total and len(palavras_aceitas_reais) >= total:
+                    salvar_historico_vitoria(palavras_aceitas_reais, tabuleiro)
+                    # O próximo jogo neste tabuleiro reenvia só o que pontuou, na ordem de envio
+                    salvar_partida_resolvida(
+                        tabuleiro, ordem_de_replay(palavras_enviadas, palavras_aceitas_reais), HISTORICO_FILE,
+                    )
+                    # Com o tabuleiro completo, toda palavra enviada que não pontuou está fora da lista do jogo
+                    registrar_resultados(palavras_aceitas_reais, list(palavras_enviadas), definitivo=True)
+                else:
+                    print("⚠️ Placar ou lista de acertos incompletos: histórico e léxico não foram gravados")
                 
                 break
             
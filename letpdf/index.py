@@ -1,5 +1,46 @@
 import fitz  # PyMuPDF
+import hashlib  # Para identificar o PDF e cada página no cache
 import os      # Biblioteca para interagir com o sistema operacional
+import sqlite3  # Cache de páginas já extraídas
+import zlib
+from contextlib import closing
+from multiprocessing import Pool  # Para extrair várias páginas ao mesmo tempo
+
+# Versão da regra de negrito. Aumente sempre que mudar palavras_negrito_da_pagina:
+# o cache de páginas extraídas com a regra antiga deixa de ser usado.
+VERSAO_EXTRATOR = 1
+CACHE_PAGINAS = "cache_paginas.db"
+
+def palavras_negrito_da_pagina(pagina):
+    """
+    Gera as palavras em negrito de uma página já carregada.
+
+    Argumentos:
+        pagina (fitz.Page): A página do documento.
+    """
+    # Extrai o texto da página em formato de dicionário para obter detalhes da fonte
+    blocos = pagina.get_text("dict")["blocks"]
+    for bloco in blocos:
+        if "lines" in bloco:  # Garante que há linhas de texto no bloco
+            for linha in bloco["lines"]:
+                for span in linha["spans"]:
+                    # A identificação de negrito é feita verificando o nome da fonte.
+                    # Nomes de fontes em negrito geralmente contêm "bold", "cn", "cb", etc.
+                    if "bold" in span["font"].lower():
+                        # Pega o texto do span, remove espaços extras nas pontas e divide em palavras
+                        yield from span["text"].strip().split()
+
+def palavras_negrito_do_documento(documento):
+    """
+    Gera as palavras em negrito de todas as páginas, em ordem, sem acumular
+    a lista inteira. Também serve como etapa do pipeline de montagem do dicionário.
+
+    Argumentos:
+        documento (fitz.Document): O documento PDF aberto.
+    """
+    # Itera por cada página do documento
+    for pagina_num in range(len(documento)):
+        yield from palavras_negrito_da_pagina(documento.load_page(pagina_num))
 
 def extrair_palavras_negrito(caminho_pdf, caminho_txt):
     """
@@ -24,22 +65,7 @@ def extrair_palavras_negrito(caminho_pdf, caminho_txt):
 
     print(f"Lendo o arquivo '{caminho_pdf}'...")
 
-    # Itera por cada página do documento
-    for pagina_num in range(len(documento)):
-        pagina = documento.load_page(pagina_num)
-        # Extrai o texto da página em formato de dicionário para obter detalhes da fonte
-        blocos = pagina.get_text("dict")["blocks"]
-        for bloco in blocos:
-            if "lines" in bloco:  # Garante que há linhas de texto no bloco
-                for linha in bloco["lines"]:
-                    for span in linha["spans"]:
-                        # A identificação de negrito é feita verificando o nome da fonte.
-                        # Nomes de fontes em negrito geralmente contêm "bold", "cn", "cb", etc.
-                        if "bold" in span["font"].lower():
-                            # Pega o texto do span, remove espaços extras nas pontas e divide em palavras
-                            palavras = span["text"].strip().split()
-                            if palavras: # Garante que não adiciona listas vazias
-                                palavras_negrito.extend(palavras)
+    palavras_negrito.extend(palavras_negrito_do_documento(documento))
 
     # Fecha o documento PDF para liberar recursos
     documento.close()
@@ -57,15 +83,298 @@ def extrair_palavras_negrito(caminho_pdf, caminho_txt):
     except Exception as e:
         print(f"Erro ao escrever no arquivo de texto: {e}")
 
-# --- INSTRUÇÕES DE USO ---
+def _extrair_intervalo(tarefa):
+    """
+    Tarefa de um processo do pool: abre o seu próprio documento (objetos do
+    fitz não podem ser compartilhados entre processos) e extrai um intervalo de páginas.
+
+    Argumentos:
+        tarefa (tuple): (caminho_pdf, pagina_inicial, pagina_final), com a final exclusiva.
+    """
+    caminho_pdf, inicio, fim = tarefa
+    documento = fitz.open(caminho_pdf)
+    try:
+        palavras = []
+        for pagina_num in range(inicio, fim):
+            palavras.extend(palavras_negrito_da_pagina(documento.load_page(pagina_num)))
+        return palavras
+    finally:
+        documento.close()
+
+def palavras_negrito_em_paralelo(caminho_pdf, processos=None, paginas_por_tarefa=50):
+    """
+    Gera as palavras em negrito do PDF usando um pool de processos. Cada
+    processo recebe um intervalo de páginas, e os resultados saem na ordem das
+    páginas assim que cada intervalo fica pronto.
+
+    Argumentos:
+        caminho_pdf (str): O caminho para o arquivo PDF de entrada.
+        processos (int, opcional): Quantos processos usar (padrão: número de núcleos).
+        paginas_por_tarefa (int): Tamanho de cada intervalo de páginas.
+    """
+    documento = fitz.open(caminho_pdf)
+    total_paginas = len(documento)
+    documento.close()
+
+    tarefas = [
+        (caminho_pdf, inicio, min(inicio + paginas_por_tarefa, total_paginas))
+        for inicio in range(0, total_paginas, paginas_por_tarefa)
+    ]
+    with Pool(processos) as pool:
+        # imap mantém a ordem das tarefas sem esperar todas terminarem
+        for palavras in pool.imap(_extrair_intervalo, tarefas):
+            yield from palavras
+
+def extrair_palavras_negrito_paralelo(caminho_pdf, caminho_txt, processos=None,
+                                      paginas_por_tarefa=50, remover_repetidas=False):
+    """
+    Versão paralela de extrair_palavras_negrito para PDFs com milhares de
+    páginas. As palavras vão direto para o arquivo de saída, na ordem das
+    páginas, sem montar a lista inteira em memória.
+
+    Argumentos:
+        caminho_pdf (str): O caminho para o arquivo PDF de entrada.
+        caminho_txt (str): O caminho para o arquivo de texto de saída.
+        processos (int, opcional): Quantos processos usar (padrão: número de núcleos).
+        paginas_por_tarefa (int): Tamanho de cada intervalo de páginas.
+        remover_repetidas (bool): Grava cada palavra só na primeira vez em que aparece.
+    """
+    if not os.path.exists(caminho_pdf):
+        print(f"Erro: O arquivo '{caminho_pdf}' não foi encontrado.")
+        return
+
+    print(f"Lendo o arquivo '{caminho_pdf}' em paralelo...")
+
+    vistas = set()
+    quantidade = 0
+    try:
+        with open(caminho_txt, "w", encoding="utf-8") as f:
+            for palavra in palavras_negrito_em_paralelo(caminho_pdf, processos, paginas_por_tarefa):
+                if remover_repetidas:
+                    if palavra in vistas:
+                        continue
+                    vistas.add(palavra)
+                f.write(palavra + "\n")
+                quantidade += 1
+    except Exception as e:
+        print(f"Erro durante a extração: {e}")
+        return
+
+    if quantidade == 0:
+        print("Nenhuma palavra em negrito foi encontrada no documento.")
+        return
+    print(f"Sucesso! {quantidade} palavras em negrito foram extraídas e salvas em '{caminho_txt}'")
+
+def _conectar_cache(caminho_cache):
+    conexao = sqlite3.connect(caminho_cache)
+    # Uma linha por página (identificada pelo conteúdo, então sobrevive a páginas novas no fim do PDF)
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS paginas (
+            hash_pagina TEXT NOT NULL,
+            versao INTEGER NOT NULL,
+            palavras BLOB NOT NULL,
+            PRIMARY KEY (hash_pagina, versao)
+        )
+    """)
+    # Um PDF já processado por inteiro guarda a sequência de hashes das suas páginas
+    conexao.execute("""
+        CREATE TABLE IF NOT EXISTS documentos (
+            hash_pdf TEXT NOT NULL,
+            versao INTEGER NOT NULL,
+            hashes_paginas BLOB NOT NULL,
+            PRIMARY KEY (hash_pdf, versao)
+        )
+    """)
+    return conexao
+
+def _hash_arquivo(caminho):
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for pedaco in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(pedaco)
+    return sha.hexdigest()
+
+def _hash_pagina(pagina):
+    """
+    Identifica a página pelo seu fluxo de conteúdo, pelos Form XObjects que
+    ele desenha e pelas fontes usadas (de onde sai o negrito).
+    """
+    sha = hashlib.sha256(pagina.read_contents())
+    # O texto pode estar todo dentro de forms (o fluxo da página fica só com
+    # "/Fm0 Do"); get_xobjects já inclui os forms aninhados
+    for xref, nome, _, _ in pagina.get_xobjects():
+        fluxo = pagina.parent.xref_stream(xref) or b""
+        sha.update(f"{nome}:{len(fluxo)}:".encode("utf-8"))
+        sha.update(fluxo)
+    # Sem o xref das fontes, que muda quando o PDF é regravado com páginas a mais
+    sha.update(repr([fonte[1:] for fonte in pagina.get_fonts()]).encode("utf-8"))
+    return sha.hexdigest()
+
+def _extrair_paginas(tarefa):
+    """
+    Tarefa do pool no modo com cache: extrai uma lista de páginas avulsas.
+
+    Argumentos:
+        tarefa (tuple): (caminho_pdf, [(pagina_num, hash_pagina), ...]).
+    """
+    caminho_pdf, paginas = tarefa
+    documento = fitz.open(caminho_pdf)
+    try:
+        return [
+            (hash_pagina, list(palavras_negrito_da_pagina(documento.load_page(pagina_num))))
+            for pagina_num, hash_pagina in paginas
+        ]
+    finally:
+        documento.close()
+
+def palavras_negrito_com_cache(caminho_pdf, caminho_cache=CACHE_PAGINAS, processos=1, paginas_por_tarefa=50):
+    """
+    Gera as palavras em negrito do PDF, em ordem, extraindo só as páginas que
+    ainda não estão no cache (novas, alteradas ou de uma versão antiga do extrator).
+    Num PDF já processado e inalterado, nenhuma página é aberta.
+
+    Argumentos:
+        caminho_pdf (str): O caminho para o arquivo PDF de entrada.
+        caminho_cache (str): Arquivo SQLite do cache de páginas.
+        processos (int, opcional): Processos para extrair as páginas que faltam (None: número de núcleos).
+        paginas_por_tarefa (int): Quantas páginas cada tarefa do pool recebe.
+    """
+    hash_pdf = _hash_arquivo(caminho_pdf)
+
+    with closing(_conectar_cache(caminho_cache)) as conexao:
+        linha = conexao.execute(
+            "SELECT hashes_paginas FROM documentos WHERE hash_pdf = ? AND versao = ?",
+            (hash_pdf, VERSAO_EXTRATOR),
+        ).fetchone()
+
+        if linha is not None:
+            hashes = zlib.decompress(linha[0]).decode("utf-8").split("\n")
+            print(f"PDF inalterado: {len(hashes)} páginas lidas do cache.")
+        else:
+            documento = fitz.open(caminho_pdf)
+            hashes = [_hash_pagina(documento.load_page(n)) for n in range(len(documento))]
+            documento.close()
+
+            # Páginas repetidas (mesmo conteúdo) só precisam ser extraídas uma vez
+            em_cache = set()
+            for hash_pagina in set(hashes):
+                if conexao.execute(
+                    "SELECT 1 FROM paginas WHERE hash_pagina = ? AND versao = ?",
+                    (hash_pagina, VERSAO_EXTRATOR),
+                ).fetchone():
+                    em_cache.add(hash_pagina)
+            faltando = []
+            for pagina_num, hash_pagina in enumerate(hashes):
+                if hash_pagina not in em_cache:
+                    em_cache.add(hash_pagina)
+                    faltando.append((pagina_num, hash_pagina))
+            print(f"{len(hashes) - len(faltando)} páginas no cache, {len(faltando)} a extrair.")
+
+            tarefas = [
+                (caminho_pdf, faltando[inicio:inicio + paginas_por_tarefa])
+                for inicio in range(0, len(faltando), paginas_por_tarefa)
+            ]
+            if processos == 1:
+                resultados = map(_extrair_paginas, tarefas)
+                pool = None
+            else:
+                pool = Pool(processos)
+                resultados = pool.imap_unordered(_extrair_paginas, tarefas)
+            try:
+                # Cada lote é gravado assim que fica pronto: uma execução interrompida não perde o que já foi feito
+                for lote in resultados:
+                    with conexao:
+                        conexao.executemany(
+                            "INSERT OR REPLACE INTO paginas VALUES (?, ?, ?)",
+                            [(h, VERSAO_EXTRATOR, zlib.compress("\n".join(p).encode("utf-8"))) for h, p in lote],
+                        )
+            finally:
+                if pool is not None:
+                    pool.close()
+                    pool.join()
+
+            with conexao:
+                conexao.execute(
+                    "INSERT OR REPLACE INTO documentos VALUES (?, ?, ?)",
+                    (hash_pdf, VERSAO_EXTRATOR, zlib.compress("\n".join(hashes).encode("utf-8"))),
+                )
+
+        for hash_pagina in hashes:
+            palavras = conexao.execute(
+                "SELECT palavras FROM paginas WHERE hash_pagina = ? AND versao = ?",
+                (hash_pagina, VERSAO_EXTRATOR),
+            ).fetchone()[0]
+            texto = zlib.decompress(palavras).decode("utf-8")
+            if texto:
+                yield from texto.split("\n")
+
+def extrair_palavras_negrito_incremental(caminho_pdf, caminho_txt, caminho_cache=CACHE_PAGINAS,
+                                         processos=1, remover_repetidas=False):
+    """
+    Igual a extrair_palavras_negrito, mas reaproveita o cache de páginas:
+    rodar de novo no mesmo PDF, ou num PDF que só ganhou páginas, processa
+    apenas o que é novo.
+
+    Argumentos:
+        caminho_pdf (str): O caminho para o arquivo PDF de entrada.
+        caminho_txt (str): O caminho para o arquivo de texto de saída.
+        caminho_cache (str): Arquivo SQLite do cache de páginas.
+        processos (int, opcional): Processos para extrair as páginas que faltam (None: número de núcleos).
+        remover_repetidas (bool): Grava cada palavra só na primeira vez em que aparece.
+    """
+    if not os.path.exists(caminho_pdf):
+        print(f"Erro: O arquivo '{caminho_pdf}' não foi encontrado.")
+        return
+
+    print(f"Lendo o arquivo '{caminho_pdf}' (com cache de páginas)...")
+
+    vistas = set()
+    quantidade = 0
+    try:
+        with open(caminho_txt, "w", encoding="utf-8") as f:
+            for palavra in palavras_negrito_com_cache(caminho_pdf, caminho_cache, processos):
+                if remover_repetidas:
+                    if palavra in vistas:
+                        continue
+                    vistas.add(palavra)
+                f.write(palavra + "\n")
+                quantidade += 1
+    except Exception as e:
+        print(f"Erro durante a extração: {e}")
+        return
+
+    if quantidade == 0:
+        print("Nenhuma palavra em negrito foi encontrada no documento.")
+        return
+    print(f"Sucesso! {quantidade} palavras em negrito foram extraídas e salvas em '{caminho_txt}'")
+
+if __name__ == "__main__":
+    # --- INSTRUÇÕES DE USO ---
+
+    # 1. Coloque o seu arquivo PDF na mesma pasta que este script Python.
+    # 2. Altere o nome do arquivo aqui para corresponder ao seu.
+    caminho_arquivo_pdf = 'dict.pdf'
+
+    # 3. Defina o nome do arquivo de texto que será criado com o resultado.
+    caminho_arquivo_txt = 'resultado_negrito.txt'
 
-# 1. Coloque o seu arquivo PDF na mesma pasta que este script Python.
-# 2. Altere o nome do arquivo aqui para corresponder ao seu.
-caminho_arquivo_pdf = 'dict.pdf'
+    # 4. Para PDFs grandes, use vários processos (cada um lê um intervalo de páginas).
+    #    Com remover_repetidas=True, cada palavra é gravada uma única vez.
+    modo_paralelo = True
+    remover_repetidas = False
 
-# 3. Defina o nome do arquivo de texto que será criado com o resultado.
-caminho_arquivo_txt = 'resultado_negrito.txt'
+    # 5. Com o cache ligado, rodar de novo só extrai as páginas novas ou alteradas
+    #    (ou todas, se VERSAO_EXTRATOR tiver mudado).
+    usar_cache = True
 
-# 4. Execute o script.
-# Chama a função principal para iniciar a extração
-extrair_palavras_negrito(caminho_arquivo_pdf, caminho_arquivo_txt)
\ No newline at end of file
+    # 6. Execute o script.
+    # Chama a função principal para iniciar a extração
+    if usar_cache:
+        extrair_palavras_negrito_incremental(caminho_arquivo_pdf, caminho_arquivo_txt,
+                                             processos=None if modo_paralelo else 1,
+                                             remover_repetidas=remover_repetidas)
+    elif modo_paralelo:
+        extrair_palavras_negrito_paralelo(caminho_arquivo_pdf, caminho_arquivo_txt,
+                                          remover_repetidas=remover_repetidas)
+    else:
+        extrair_palavras_negrito(caminho_arquivo_pdf, caminho_arquivo_txt)
\ No newline at end of file
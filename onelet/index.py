@@ -1,3 +1,22 @@
+def filtrar_por_tamanho(palavras, tamanho_minimo=2):
+    """
+    Gera as palavras (sem espaços nas pontas) com tamanho maior que o mínimo,
+    pulando linhas em branco. Também serve como etapa do pipeline de montagem
+    do dicionário.
+
+    Args:
+        palavras (iterable): Palavras ou linhas de texto.
+        tamanho_minimo (int): Palavras com esse tamanho ou menos são descartadas.
+    """
+    for palavra in palavras:
+        # Remove espaços em branco e quebras de linha do início/fim
+        palavra = palavra.strip()
+
+        # Se a palavra (depois de limpar os espaços) não estiver vazia
+        # e tiver um tamanho maior que o mínimo, ela segue adiante.
+        if len(palavra) > tamanho_minimo:
+            yield palavra
+
 def limpar_lista_palavras(arquivo_entrada, arquivo_saida, tamanho_minimo=2):
     """
     Lê um arquivo com uma palavra por linha, remove as linhas que contêm
@@ -15,15 +34,9 @@ def limpar_lista_palavras(arquivo_entrada, arquivo_saida, tamanho_minimo=2):
         with open(arquivo_entrada, 'r', encoding='utf-8') as f_entrada, \
              open(arquivo_saida, 'w', encoding='utf-8') as f_saida:
 
-            for linha in f_entrada:
-                # Remove espaços em branco e quebras de linha do início/fim
-                palavra = linha.strip()
-                
-                # Se a palavra (depois de limpar os espaços) não estiver vazia
-                # e tiver um tamanho maior que o mínimo, escrevemos no novo arquivo.
-                if len(palavra) > tamanho_minimo:
-                    f_saida.write(linha) # Escreve a linha original (com o \n)
-                    palavras_mantidas += 1
+            for palavra in filtrar_por_tamanho(f_entrada, tamanho_minimo):
+                f_saida.write(palavra + '\n')
+                palavras_mantidas += 1
 
         print(f"Arquivo '{arquivo_saida}' criado com sucesso!")
         print(f"{palavras_mantidas} palavras foram mantidas.")
@@ -33,9 +46,10 @@ def limpar_lista_palavras(arquivo_entrada, arquivo_saida, tamanho_minimo=2):
     except Exception as e:
         print(f"Ocorreu um erro: {e}")
 
-# Nomes dos arquivos de entrada e saída
-arquivo_entrada = "robo-soletra\onelet\onelet.txt"
-arquivo_saida = "robo-soletra\onelet\onelet_corrigido.txt"
+if __name__ == "__main__":
+    # Nomes dos arquivos de entrada e saída
+    arquivo_entrada = "robo-soletra\onelet\onelet.txt"
+    arquivo_saida = "robo-soletra\onelet\onelet_corrigido.txt"
 
-# Chama a função para remover palavras com 2 ou menos letras
-limpar_lista_palavras(arquivo_entrada, arquivo_saida, tamanho_minimo=2)
\ No newline at end of file
+    # Chama a função para remover palavras com 2 ou menos letras
+    limpar_lista_palavras(arquivo_entrada, arquivo_saida, tamanho_minimo=2)
\ No newline at end of file
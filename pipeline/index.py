@@ -0,0 +1,162 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+
+# As etapas moram nos scripts de cada pasta (dup, onelet, teste, letpdf) e no núcleo dos robôs
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.join(RAIZ, "Robo"))
+from dup.index import palavras_unicas_externo, grafias_preferidas, PREFERENCIAS
+from onelet.index import filtrar_por_tamanho
+from teste.index import primeiras_palavras
+from nucleo_soletra import normalizar_palavra, ler_palavras_jogaveis
+
+
+# --- Pipeline Único De Montagem Do Dicionário ---
+#
+# Substitui rodar dup, onelet, teste e letpdf à mão, um depois do outro, cada
+# um relendo e regravando arquivos inteiros. Aqui cada passo é um gerador e
+# as palavras atravessam todas as etapas uma única vez, sem arquivos
+# intermediários:
+#
+#   fonte (txt / 1ª coluna do csv / negrito do pdf) -> tamanho -> normalização
+#   -> deduplicação -> regra do Soletra -> arquivo final
+#
+# As etapas até a normalização rodam por fonte; a deduplicação é o ponto em
+# que as fontes se juntam (na ordem em que foram passadas).
+
+
+ETAPAS = ("extração", "tamanho", "normalização", "deduplicação", "regra", "gravação")
+
+
+def _palavras_txt(caminho):
+    with open(caminho, 'r', encoding='utf-8') as f:
+        for linha in f:
+            yield from linha.split()
+
+
+def _palavras_csv(caminho):
+    with open(caminho, 'r', encoding='utf-8') as f:
+        yield from primeiras_palavras(f)
+
+
+def _palavras_pdf(caminho):
+    # PyMuPDF só é exigido quando há PDF entre as fontes
+    import fitz
+    from letpdf.index import palavras_negrito_do_documento
+
+    documento = fitz.open(caminho)
+    try:
+        yield from palavras_negrito_do_documento(documento)
+    finally:
+        documento.close()
+
+
+EXTRATORES = {"txt": _palavras_txt, "csv": _palavras_csv, "pdf": _palavras_pdf}
+
+
+def _cronometrar(etapa, itens, medicoes):
+    """Repassa os itens acumulando o tempo gasto em next() e quantos itens saíram da etapa"""
+    medicao = medicoes.setdefault(etapa, [0.0, 0])
+    iterador = iter(itens)
+    while True:
+        inicio = time.perf_counter()
+        try:
+            item = next(iterador)
+        except StopIteration:
+            medicao[0] += time.perf_counter() - inicio
+            return
+        medicao[0] += time.perf_counter() - inicio
+        medicao[1] += 1
+        yield item
+
+
+def _relatar_etapas(medicoes):
+    """O tempo medido em cada etapa inclui as anteriores; o relatório mostra só a parte dela"""
+    print(f"\n{'etapa':<14}{'palavras':>12}{'tempo':>10}")
+    acumulado_anterior = 0.0
+    for etapa in ETAPAS:
+        if etapa not in medicoes:
+            continue
+        acumulado, quantidade = medicoes[etapa]
+        print(f"{etapa:<14}{quantidade:>12}{acumulado - acumulado_anterior:>9.2f}s")
+        acumulado_anterior = acumulado
+    print(f"{'total':<14}{'':>12}{acumulado_anterior:>9.2f}s")
+
+
+def montar_dicionario(fontes, caminho_saida, tamanho_minimo=None, normalizar=False,
+                      dedupe="exato", regra_soletra=False, memoria_mb=256):
+    """
+    Monta o dicionário final a partir de várias fontes em uma única passada.
+
+    Args:
+        fontes (list): Pares (tipo, caminho) com tipo 'txt', 'csv' ou 'pdf', em ordem de prioridade.
+        caminho_saida (str): Arquivo final, uma palavra por linha.
+        tamanho_minimo (int, optional): Descarta palavras com esse tamanho ou menos.
+        normalizar (bool): Grava a forma normalizada (sem acentos, minúscula).
+        dedupe (str, optional): 'exato', uma preferência do modo sem acento de
+            dup ('acentuada', 'frequente', 'primeira') ou None para não deduplicar.
+        regra_soletra (bool): Mantém só palavras que podem ser resposta do Soletra.
+        memoria_mb (int): Orçamento de memória da deduplicação em disco.
+    """
+    medicoes = {}
+
+    def cadeia_da_fonte(tipo, caminho):
+        itens = _cronometrar("extração", EXTRATORES[tipo](caminho), medicoes)
+        if tamanho_minimo is not None:
+            itens = _cronometrar("tamanho", filtrar_por_tamanho(itens, tamanho_minimo), medicoes)
+        if normalizar:
+            itens = _cronometrar("normalização", map(normalizar_palavra, itens), medicoes)
+        return itens
+
+    cadeias = [cadeia_da_fonte(tipo, caminho) for tipo, caminho in fontes]
+
+    if dedupe == "exato":
+        itens = palavras_unicas_externo(itertools.chain.from_iterable(cadeias), memoria_mb)
+    elif dedupe in PREFERENCIAS:
+        itens = grafias_preferidas(cadeias, dedupe, memoria_mb)
+    else:
+        itens = itertools.chain.from_iterable(cadeias)
+    if dedupe:
+        itens = _cronometrar("deduplicação", itens, medicoes)
+
+    if regra_soletra:
+        itens = _cronometrar("regra", (palavra for palavra, _, _ in ler_palavras_jogaveis(itens)), medicoes)
+
+    print(f"🛠️  Montando '{caminho_saida}' a partir de {len(fontes)} fonte(s)...")
+    with open(caminho_saida, 'w', encoding='utf-8') as f_saida:
+        f_saida.writelines(palavra + '\n' for palavra in _cronometrar("gravação", itens, medicoes))
+
+    print(f"✓ {medicoes['gravação'][1]} palavras salvas em '{caminho_saida}'.")
+    _relatar_etapas(medicoes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monta o dicionário dos robôs em uma única passada.")
+    parser.add_argument("--txt", dest="fontes", action="append", type=lambda c: ("txt", c),
+                        help="lista de palavras (pode repetir)")
+    parser.add_argument("--csv", dest="fontes", action="append", type=lambda c: ("csv", c),
+                        help="arquivo cuja 1ª coluna é a palavra (pode repetir)")
+    parser.add_argument("--pdf", dest="fontes", action="append", type=lambda c: ("pdf", c),
+                        help="PDF de onde extrair as palavras em negrito (pode repetir)")
+    parser.add_argument("--saida", default="Robo-soletra/Robo/palavras3.txt")
+    parser.add_argument("--tamanho-minimo", type=int, default=None)
+    parser.add_argument("--normalizar", action="store_true")
+    parser.add_argument("--dedupe", choices=("exato", "nenhum") + PREFERENCIAS, default="exato")
+    parser.add_argument("--regra-soletra", action="store_true")
+    parser.add_argument("--memoria-mb", type=int, default=256)
+    args = parser.parse_args()
+
+    if not args.fontes:
+        parser.error("informe ao menos uma fonte com --txt, --csv ou --pdf")
+
+    montar_dicionario(
+        args.fontes, args.saida,
+        tamanho_minimo=args.tamanho_minimo,
+        normalizar=args.normalizar,
+        dedupe=None if args.dedupe == "nenhum" else args.dedupe,
+        regra_soletra=args.regra_soletra,
+        memoria_mb=args.memoria_mb,
+    )
@@ -1,3 +1,18 @@
+def primeiras_palavras(linhas):
+    """
+    Gera a palavra antes da primeira vírgula de cada linha não vazia.
+    Também serve como etapa do pipeline de montagem do dicionário.
+
+    Args:
+        linhas (iterable): Linhas de texto (ex: um arquivo aberto).
+    """
+    for linha in linhas:
+        linha = linha.strip()  # Remove espaços em branco e quebras de linha
+        if linha:  # Garante que a linha não está vazia
+            # Divide a linha na primeira vírgula e pega a primeira parte
+            partes = linha.split(',', 1) # O '1' garante que divide apenas na primeira vírgula
+            yield partes[0]
+
 def extrair_primeiras_palavras(arquivo_entrada, arquivo_saida):
     """
     Lê um arquivo de texto linha por linha, extrai a palavra antes da primeira vírgula
@@ -9,14 +24,7 @@ def extrair_primeiras_palavras(arquivo_entrada, arquivo_saida):
     """
     try:
         with open(arquivo_entrada, 'r', encoding='utf-8') as f_entrada:
-            palavras_extraidas = []
-            for linha in f_entrada:
-                linha = linha.strip()  # Remove espaços em branco e quebras de linha
-                if linha:  # Garante que a linha não está vazia
-                    # Divide a linha na primeira vírgula e pega a primeira parte
-                    partes = linha.split(',', 1) # O '1' garante que divide apenas na primeira vírgula
-                    palavra = partes[0]
-                    palavras_extraidas.append(palavra)
+            palavras_extraidas = list(primeiras_palavras(f_entrada))
 
         with open(arquivo_saida, 'w', encoding='utf-8') as f_saida:
             for palavra in palavras_extraidas: